@@ -1,12 +1,9 @@
 from kivy.uix.screenmanager import Screen, ScreenManager
 from kivy.uix.floatlayout import FloatLayout
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.image import Image
 from kivy.uix.label import Label
 from kivy.uix.button import Button
 from kivy.uix.widget import Widget
-from kivy.core.window import Window
-from kivy.utils import platform
 from kivy.metrics import dp, sp
 from kivy.graphics import Color, Rectangle, RoundedRectangle
 from kivy.uix.scrollview import ScrollView
@@ -21,32 +18,18 @@ from kivymd.app import MDApp
 from kivymd.uix.bottomnavigation import MDBottomNavigation, MDBottomNavigationItem
 from kivymd.uix.button import MDIconButton
 
-# Import the DonationWidget
-from donation_widget import DonationWidget
-
-# Import the BatchmatesWidget
-from batchmates_widget import BatchmatesWidget
-
-# Import the EventCalendarWidget for the calendar tab
-from event_calendar_widget import EventCalendarWidget
-
-# Import the ProfileCardWidget for the profile tab
-from profile_card_widget import ProfileCardWidget
+# Tab content widgets (DonationWidget, BatchmatesWidget, EventCalendarWidget,
+# ProfileCardWidget) are imported when their tab is first built
 from kivy.animation import Animation  # Add animation import at the top
 
-# Import the SettingsPage
-from settings_page import SettingsPage
+# Screens are declared in a lazy registry and built on first navigation
+from screen_registry import LazyScreenManager
+from app_chrome import HeaderBar as ChromeHeaderBar, ChromeHost, shared_chrome
+from page_cache import PageCache
+from resize_dispatcher import get_resize_dispatcher
 
-# Device profile constants
-DEVICE_PROFILES = {
-    'small': {'width': 392, 'height': 759},  # Match the image proportions
-    'medium': {'width': 1080, 'height': 2340},  # Common smartphone size
-}
-
-# For mobile devices, let the system set the window size
-# Only set window size for desktop/development
-if platform not in ('android', 'ios'):
-    Window.size = (DEVICE_PROFILES['small']['width'], DEVICE_PROFILES['small']['height'])
+# Delay after the first frame before idle tabs start being pre-built
+TAB_PREWARM_DELAY = 1.0
 
 # Colors from the image
 TEAL_COLOR = (26/255, 164/255, 159/255, 1)  # #1AA49F
@@ -59,10 +42,6 @@ LIGHT_TEXT_COLOR = (0.5, 0.5, 0.5, 1)
 ASSETS_PATH = Path(__file__).parent / Path(r"build\assets\frame7")
 NAVIGATION_ICONS_PATH = Path(__file__).parent / Path(r"navigation_icons")
 
-# Create navigation_icons directory if it doesn't exist
-if not os.path.exists(NAVIGATION_ICONS_PATH):
-    os.makedirs(NAVIGATION_ICONS_PATH)
-
 # KV string for the search field - updated hint text
 search_field_kv = """
 MDTextField:
@@ -101,108 +80,27 @@ class SearchBar(BoxLayout):
         if self.on_filter_callback:
             self.on_filter_callback(value)
 
-class HeaderBar(BoxLayout):
-    """Teal header bar with school name"""
+class HeaderBar(ChromeHeaderBar):
+    """Teal header bar with school name and a settings cog for the profile tab"""
     def __init__(self, **kwargs):
+        kwargs.setdefault('title', "Santisimo Rosario")
+        kwargs.setdefault('subtitle', "Integrated Highschool")
+        kwargs.setdefault('settings', False)  # Start with hidden button
         super().__init__(**kwargs)
-        self.orientation = 'horizontal'
-        self.size_hint_y = None
-        self.height = dp(60)
-        self.padding = [dp(10), dp(5), dp(10), dp(5)]
-        
-        # Background color
-        with self.canvas.before:
-            Color(*TEAL_COLOR)
-            self.rect = Rectangle(pos=self.pos, size=self.size)
-        self.bind(pos=self._update_rect, size=self._update_rect)
-        
-        # Left - School logo
-        logo_path = os.path.join(ASSETS_PATH, "image_1.png")
-        self.logo = Image(
-            source=logo_path if os.path.exists(logo_path) else "",
-            size_hint=(None, 1),
-            width=dp(50),
-            allow_stretch=True,
-            keep_ratio=True
-        )
-        self.add_widget(self.logo)
-        
-        # Center - School name
-        school_layout = BoxLayout(orientation='vertical', size_hint=(1, 1))
-        self.school_name = Label(
-            text="Santisimo Rosario",
-            font_size=sp(16),
-            color=WHITE_COLOR,
-            halign='left',
-            valign='bottom',
-            size_hint=(1, 0.5),
-            text_size=(None, None),
-            bold=True
-        )
-        self.school_subtext = Label(
-            text="Integrated Highschool",
-            font_size=sp(14),
-            color=WHITE_COLOR,
-            halign='left',
-            valign='top',
-            size_hint=(1, 0.5),
-            text_size=(None, None)
-        )
-        school_layout.add_widget(self.school_name)
-        school_layout.add_widget(self.school_subtext)
-        self.add_widget(school_layout)
-        
-        # Right - Settings cog icon (invisible by default)
-        self.settings_btn = MDIconButton(
+    
+    def create_settings_button(self):
+        """Settings cog icon"""
+        return MDIconButton(
             icon="cog",
             theme_icon_color="Custom",
             icon_color=WHITE_COLOR,
             size_hint=(None, None),
             size=(dp(24), dp(40)),  # Reduced width from 40dp to 24dp
-            pos_hint={'center_y': 0.5},
-            opacity=0,  # Start with invisible button
-            disabled=True  # Start with disabled button
+            pos_hint={'center_y': 0.5}
         )
-        self.settings_btn.bind(on_press=self.on_settings)
-        self.add_widget(self.settings_btn)
-    
-    def _update_rect(self, instance, value):
-        """Update background when size changes"""
-        self.rect.pos = self.pos
-        self.rect.size = self.size
-        
-    def on_settings(self, instance):
-        """Handle settings button press"""
-        print("Settings button pressed")
-        
-        # Navigate to the settings page via the app
-        app = MDApp.get_running_app()
-        if hasattr(app, 'show_settings_page'):
-            app.show_settings_page()
-        else:
-            # Try direct navigation if method doesn't exist
-            try:
-                if hasattr(app.root, 'current'):
-                    app.root.current = 'settings'
-                    print("Navigated to settings page")
-            except Exception as e:
-                print(f"Could not navigate to settings: {e}")
-    
-    def show_settings_button(self, show=True):
-        """Show or hide the settings button"""
-        if show:
-            # Make fully visible with animation
-            from kivy.animation import Animation
-            anim = Animation(opacity=1, duration=0.2)
-            anim.start(self.settings_btn)
-            self.settings_btn.disabled = False
-        else:
-            # Hide immediately
-            self.settings_btn.opacity = 0
-            self.settings_btn.disabled = True
 
 class DirectoryContent(FloatLayout):
-    """Content area for alumni directory - currently blank"""
+    """Content area for alumni directory - alumni listed by name"""
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         
@@ -212,7 +110,10 @@ class DirectoryContent(FloatLayout):
             self.bg = Rectangle(pos=self.pos, size=self.size)
         self.bind(pos=self._update_bg, size=self._update_bg)
         
-        # Currently blank - will be populated with alumni listings later
+        # Alumni list, loaded page by page while scrolling
+        from alumni_list import AlumniListView
+        self.alumni_list = AlumniListView(size_hint=(1, 1), pos_hint={'x': 0, 'y': 0})
+        self.add_widget(self.alumni_list)
         
     def _update_bg(self, instance, value):
         """Update background when size changes"""
@@ -221,10 +122,17 @@ class DirectoryContent(FloatLayout):
 
 class AlumniDirectoryPage(Screen):
     """Main alumni directory page layout"""
+    # Chrome the app's shared header shows; the settings cog follows the tab
+    chrome_options = {'header': True, 'title': "Santisimo Rosario", 'subtitle': "Integrated Highschool"}
+    
     # Track the currently active tab name
     current_tab = 'home'  # Default to home tab
     
-    def __init__(self, **kwargs):
+    # Profile tab card and the session it shows, set when the tab is built
+    profile_card = None
+    profile_session = None
+    
+    def __init__(self, prewarm_tabs=True, **kwargs):
         super().__init__(**kwargs)
         
         # Create a base layout
@@ -237,12 +145,16 @@ class AlumniDirectoryPage(Screen):
             self.rect = Rectangle(pos=self.base_layout.pos, size=self.base_layout.size)
         self.base_layout.bind(pos=self._update_rect, size=self._update_rect)
         
-        # Add header (without settings navigation callback)
-        self.header = HeaderBar(pos_hint={'top': 1})
-        self.base_layout.add_widget(self.header)
+        # Use the app's shared header when it has one, otherwise add our own
+        chrome = shared_chrome()
+        if chrome is None:
+            self.header = HeaderBar(pos_hint={'top': 1})
+            self.base_layout.add_widget(self.header)
+        else:
+            self.header = chrome.header
         
         # Calculate header height ratio more precisely to avoid compression
-        header_height_ratio = self.header.height / Window.height
+        header_height_ratio = self._header_height_ratio()
         
         # Create content area that will contain the MDBottomNavigation
         # Use absolute positioning to prevent compression
@@ -255,14 +167,64 @@ class AlumniDirectoryPage(Screen):
         self.bottom_nav = MDBottomNavigation()
         self.bottom_nav.bind(on_tab_switch=self.on_tab_switch)
         
-        # Create Home tab
-        home_tab = MDBottomNavigationItem(name='home', text='Home', icon='home')
+        # Store donation widgets for filtering (filled when the tab is built)
+        self.donation_widgets = {}
+        
+        # Tabs are created empty; their content is built on first activation
+        self.tabs = {}
+        self.built_tabs = set()
+        self.tab_builders = {
+            'home': self._build_home_tab,
+            'donation': self._build_donation_tab,
+            'search': self._build_search_tab,
+            'events': self._build_events_tab,
+            'profile': self._build_profile_tab,
+        }
+        for name, text, icon in [
+            ('home', 'Home', 'home'),
+            ('donation', 'Donation', 'hand-heart'),
+            ('search', 'Search', 'magnify'),
+            ('events', 'Events', 'calendar'),
+            ('profile', 'Profile', 'account'),
+        ]:
+            tab = MDBottomNavigationItem(name=name, text=text, icon=icon)
+            self.tabs[name] = tab
+            self.bottom_nav.add_widget(tab)
+        
+        # Cold start only pays for the home tab
+        self.ensure_tab_built('home')
+        
+        # Optionally build the remaining tabs one per idle frame later on
+        self.prewarm_tabs = prewarm_tabs
+        self._prewarm_event = None
+        
+        # After adding all tabs, make sure the MDBottomNavigation fills the content area
+        self.content_layout.add_widget(self.bottom_nav)
+        self.base_layout.add_widget(self.content_layout)
+        
+        # Keep layout adjusted when the window size changes
+        get_resize_dispatcher().subscribe(self._on_window_resize)
+        
+        # Schedule layout adjustment and tab setup
+        Clock.schedule_once(self._adjust_layout, 0.1)
+        Clock.schedule_once(self.initial_tab_setup, 0.5)
+    
+    def ensure_tab_built(self, tab_name):
+        """Build a tab's content the first time it is needed"""
+        if tab_name in self.built_tabs or tab_name not in self.tab_builders:
+            return
+        self.built_tabs.add(tab_name)
+        self.tab_builders[tab_name](self.tabs[tab_name])
+        print(f"Built tab: {tab_name}")
+    
+    def _build_home_tab(self, home_tab):
+        """Create the Home tab content"""
         home_content = DirectoryContent(size_hint=(1, 1))
         home_tab.add_widget(home_content)
-        self.bottom_nav.add_widget(home_tab)
-        
-        # Create Donation tab
-        donation_tab = MDBottomNavigationItem(name='donation', text='Donation', icon='hand-heart')
+    
+    def _build_donation_tab(self, donation_tab):
+        """Create the Donation tab content"""
+        from donation_widget import DonationWidget
         
         # Create vertical layout for donation content
         donation_layout = BoxLayout(
@@ -271,9 +233,6 @@ class AlumniDirectoryPage(Screen):
             padding=[dp(0), dp(10), dp(0), dp(10)]
         )
         
-        # Store donation widgets for filtering
-        self.donation_widgets = {}
-        
         # Add search bar at the top - use filter_donations as callback
         search_bar = SearchBar(
             size_hint=(1, None), 
@@ -326,10 +285,10 @@ class AlumniDirectoryPage(Screen):
         
         # Add the donation layout to the donation tab
         donation_tab.add_widget(donation_layout)
-        self.bottom_nav.add_widget(donation_tab)
-        
-        # Create Search tab
-        search_tab = MDBottomNavigationItem(name='search', text='Search', icon='magnify')
+    
+    def _build_search_tab(self, search_tab):
+        """Create the Search tab content"""
+        from batchmates_widget import BatchmatesWidget
         
         # Create a scroll view for the BatchmatesWidget
         search_scroll = ScrollView(
@@ -342,16 +301,17 @@ class AlumniDirectoryPage(Screen):
         # Add BatchmatesWidget with QR navigation callback
         search_scroll.add_widget(BatchmatesWidget(on_qr_press=self.on_qr_code_press))
         search_tab.add_widget(search_scroll)
-        self.bottom_nav.add_widget(search_tab)
+    
+    def _build_events_tab(self, calendar_tab):
+        """Create the Events tab content"""
+        from event_calendar_widget import EventCalendarWidget
         
-        # Create Calendar tab
-        calendar_tab = MDBottomNavigationItem(name='events', text='Events', icon='calendar')
         calendar_content = EventCalendarWidget(size_hint=(1, 1))
         calendar_tab.add_widget(calendar_content)
-        self.bottom_nav.add_widget(calendar_tab)
-        
-        # Create Profile tab
-        profile_tab = MDBottomNavigationItem(name='profile', text='Profile', icon='account')
+    
+    def _build_profile_tab(self, profile_tab):
+        """Create the Profile tab content"""
+        from profile_card_widget import ProfileCardWidget
         
         # Create a scroll view for the profile content
         profile_scroll = ScrollView(
@@ -361,48 +321,97 @@ class AlumniDirectoryPage(Screen):
         )
         
         # Add ProfileCardWidget to the profile tab
-        profile_card = ProfileCardWidget()
+        self.profile_card = ProfileCardWidget()
+        self._bind_profile()
         
-        # Set up some sample profile data
-        profile_card.update_profile(
-            name="Alejandino, Ivan Ray",
-            status="Alumni",
-            batch="Batch 2015 - 2016",
-            course="BSIT",
-            address="123 Main Street, City",
-            email="ivan.alejandino@example.com",
-            contact="+123-456-7890"
-        )
-        
-        profile_scroll.add_widget(profile_card)
+        profile_scroll.add_widget(self.profile_card)
         profile_tab.add_widget(profile_scroll)
-        self.bottom_nav.add_widget(profile_tab)
+    
+    def _bind_profile(self):
+        """Show the signed-in user's cached profile on the profile card
+        
+        The card is updated again whenever the session reloads or edits
+        the profile. Called again on entering the page, so a different
+        user signing in replaces the previous user's profile.
+        """
+        from session import get_session
+        session = get_session()
+        if session is self.profile_session:
+            return
+        self.profile_session = session
         
-        # After adding all tabs, make sure the MDBottomNavigation fills the content area
-        self.content_layout.add_widget(self.bottom_nav)
-        self.base_layout.add_widget(self.content_layout)
+        if session is not None:
+            self._show_profile(session.get("profile", callback=self._show_profile))
+        else:
+            # Sample profile data when running without a signed-in user
+            self.profile_card.update_profile(
+                name="Alejandino, Ivan Ray",
+                status="Alumni",
+                batch="Batch 2015 - 2016",
+                course="BSIT",
+                address="123 Main Street, City",
+                email="ivan.alejandino@example.com",
+                contact="+123-456-7890"
+            )
+    
+    def _show_profile(self, profile):
+        """Fill the profile card from a session profile dict"""
+        from session import format_batch
+        if not profile:
+            return
+        self.profile_card.update_profile(
+            name=profile.get('name') or "",
+            status="Alumni",
+            batch=format_batch(profile.get('year_graduated')),
+            course=profile.get('strand') or "",
+            address=profile.get('address') or "",
+            email=profile.get('email') or "",
+            contact=profile.get('contact') or ""
+        )
+    
+    def on_enter(self):
+        """Start pre-building the other tabs once the page is on screen"""
+        # The shared header may have been changed by another screen
+        self.header.show_settings_button(AlumniDirectoryPage.current_tab == 'profile', animate=False)
         
-        # Bind to window size changes to keep layout adjusted
-        Window.bind(on_resize=self._on_window_resize)
+        # Follow the signed-in user if it changed since the profile tab was built
+        if self.profile_card is not None:
+            self._bind_profile()
         
-        # Schedule layout adjustment and tab setup
-        Clock.schedule_once(self._adjust_layout, 0.1)
-        Clock.schedule_once(self.initial_tab_setup, 0.5)
+        if self.prewarm_tabs and self._prewarm_event is None and len(self.built_tabs) < len(self.tabs):
+            self._prewarm_event = Clock.schedule_once(self._prewarm_next_tab, TAB_PREWARM_DELAY)
+    
+    def _prewarm_next_tab(self, dt):
+        """Build one unbuilt tab, then yield the frame before the next"""
+        self._prewarm_event = None
+        for tab_name in self.tab_builders:
+            if tab_name not in self.built_tabs:
+                self.ensure_tab_built(tab_name)
+                break
+        if len(self.built_tabs) < len(self.tabs):
+            # One tab per frame so input and drawing keep running in between
+            self._prewarm_event = Clock.schedule_once(self._prewarm_next_tab, 0)
     
     def _adjust_layout(self, dt):
         """Adjust layout based on window size to prevent compression"""
-        if Window.height > 0:  # Avoid division by zero
-            # Recalculate header height ratio
-            header_height_ratio = self.header.height / Window.height
-            
-            # Update content layout position and size
-            self.content_layout.pos_hint = {'x': 0, 'y': 0, 'top': 1 - header_height_ratio}
-            self.content_layout.size_hint = (1, 1 - header_height_ratio)
+        # Recalculate header height ratio
+        header_height_ratio = self._header_height_ratio()
+        
+        # Update content layout position and size
+        self.content_layout.pos_hint = {'x': 0, 'y': 0, 'top': 1 - header_height_ratio}
+        self.content_layout.size_hint = (1, 1 - header_height_ratio)
+    
+    def _header_height_ratio(self):
+        """Part of the window taken by a header drawn inside this page"""
+        from kivy.core.window import Window
+        if self.header.parent is not self.base_layout or Window.height <= 0:
+            return 0
+        return self.header.height / Window.height
     
-    def _on_window_resize(self, instance, width, height):
+    def _on_window_resize(self, width, height):
         """Handle window resizing events"""
-        # Re-adjust layout when window size changes
-        Clock.schedule_once(self._adjust_layout, 0.1)
+        # Re-adjust layout when window size changes (at most once per frame)
+        self._adjust_layout(0)
     
     def initial_tab_setup(self, dt):
         """Set up the initial tab and button visibility"""
@@ -420,6 +429,7 @@ class AlumniDirectoryPage(Screen):
     def navigate_to_search_tab(self):
         """Switch to the Search tab to display BatchmatesWidget"""
         # Switch to the search tab in MDBottomNavigation
+        self.ensure_tab_built('search')
         self.bottom_nav.switch_tab('search')
         print("Navigating to the search tab to find batchmates")
     
@@ -455,8 +465,9 @@ class AlumniDirectoryPage(Screen):
 
     def on_qr_code_press(self, instance):
         """Handle QR code button press in batchmates widget"""
-        print("QR code pressed - navigating to QR scanner")
-        # You can implement navigation to a QR scanner screen here
+        print("QR code pressed - navigating to QR code page")
+        if self.manager and self.manager.has_screen('qr_code'):
+            self.manager.current = 'qr_code'
     
     def on_tab_switch(self, instance_tabs, instance_tab, instance_tab_label, tab_text):
         """Handle tab switching with MDBottomNavigation signature"""
@@ -465,6 +476,8 @@ class AlumniDirectoryPage(Screen):
         # Update current tab when user switches tabs
         if hasattr(instance_tab, 'name'):
             AlumniDirectoryPage.current_tab = instance_tab.name
+            # Build the tab's content on first activation
+            self.ensure_tab_built(instance_tab.name)
         
         # Show settings button only when on profile tab
         is_profile = instance_tab.name == 'profile'
@@ -482,6 +495,7 @@ class AlumniDirectoryPage(Screen):
         """Set the active tab by name - called after returning from settings"""
         if hasattr(self, 'bottom_nav') and tab_name:
             try:
+                self.ensure_tab_built(tab_name)
                 self.bottom_nav.switch_tab(tab_name)
                 print(f"Restored tab: {tab_name}")
             except:
@@ -639,24 +653,58 @@ except ImportError:
 
 class AlumniDirectoryApp(MDApp):
     """Main application class"""
+    # Donation pages cached per campaign, created on first use
+    details_pages = None
+    amount_pages = None
+    
     def build(self):
-        # Create the screen manager
-        sm = ScreenManager()
+        from app_bootstrap import bootstrap
+        bootstrap()
+        
+        # Create the screen manager; screens are only declared here
+        sm = LazyScreenManager()
+        
+        # One header shared by every screen; pages built from here on use it
+        self.chrome = ChromeHost(sm, header=HeaderBar())
         
-        # Add the login screen first
-        sm.add_widget(LoginScreen(name='login'))
+        # The login screen is shown first and never evicted
+        sm.register('login', LoginScreen, evictable=False)
         
-        # Add the signup screen
-        sm.add_widget(SignupScreen(name='signup'))
+        # Declare the signup screen
+        sm.register('signup', SignupScreen)
         
-        # Add the alumni directory screen
-        sm.add_widget(AlumniDirectoryPage(name='alumni_directory'))
+        # The directory page is heavy, so build it after the first frame
+        # while the user is still typing credentials
+        sm.register('alumni_directory', AlumniDirectoryPage, preload=True)
         
-        # Add the settings screen
-        sm.add_widget(SettingsPage(name='settings'))
+        # Declare the settings screen
+        sm.register('settings', self._create_settings_screen)
+        
+        # Declare the QR code screen (own code and scanned-code lookup)
+        sm.register('qr_code', self._create_qr_screen)
+        
+        # A saved login goes straight to the directory; otherwise show the
+        # login screen, which builds only that screen
+        from session import resume_session
+        sm.current = 'alumni_directory' if resume_session() else 'login'
         
         return sm
     
+    def on_start(self):
+        """Show the shared header and preload declared screens once the first frame is up"""
+        self.chrome.attach()
+        self.root.start_preloading()
+    
+    def _create_settings_screen(self, name):
+        """Build the settings screen on first visit"""
+        from settings_page import SettingsPage
+        return SettingsPage(name=name)
+    
+    def _create_qr_screen(self, name):
+        """Build the QR code screen on first visit"""
+        from qr_page import QRCodePage
+        return QRCodePage(name=name)
+    
     def show_signup_screen(self):
         """Navigate to the signup screen"""
         # Get the screen manager
@@ -681,25 +729,21 @@ class AlumniDirectoryApp(MDApp):
         else:
             print("Login screen not found")
     
+    def sign_out(self):
+        """Revoke the saved login and return to the login screen"""
+        from session import sign_out
+        sign_out()
+        self.show_login_screen()
+    
     def show_donation_details(self, image_source, title):
         """Show the donation details page"""
         try:
             from donation_details_page import DonationDetailsPage
             
-            # Get the screen manager
-            sm = self.root
-            
-            # Remove the donation details screen if it exists
-            if sm.has_screen('donation_details'):
-                sm.remove_widget(sm.get_screen('donation_details'))
-            
-            # Create the donation details screen
-            details_screen = Screen(name='donation_details')
-            details_screen.add_widget(DonationDetailsPage(image_path=image_source, title=title))
-            sm.add_widget(details_screen)
-            
-            # Switch to the donation details screen
-            sm.current = 'donation_details'
+            # Reuse a cached page for this campaign instead of rebuilding it
+            if self.details_pages is None:
+                self.details_pages = PageCache(DonationDetailsPage)
+            self.details_pages.show(self.root, 'donation_details', image_source, title)
         except ImportError:
             print("Could not load donation_details_page.py")
     
@@ -734,20 +778,10 @@ class AlumniDirectoryApp(MDApp):
             try:
                 from donation_amount_page import DonationAmountPage
                 
-                # Get the screen manager
-                sm = self.root
-                
-                # Remove the previous screen if it exists
-                if sm.has_screen('donation_amount'):
-                    sm.remove_widget(sm.get_screen('donation_amount'))
-                
-                # Create and add the donation amount screen
-                amount_screen = Screen(name='donation_amount')
-                amount_screen.add_widget(DonationAmountPage(image_path=image_source, title=title))
-                sm.add_widget(amount_screen)
-                
-                # Switch to the donation amount screen
-                sm.current = 'donation_amount'
+                # Reuse a cached page for this campaign instead of rebuilding it
+                if self.amount_pages is None:
+                    self.amount_pages = PageCache(DonationAmountPage)
+                self.amount_pages.show(self.root, 'donation_amount', image_source, title)
             except ImportError:
                 # Fallback: Create a simple dialog if the page doesn't exist
                 print(f"Donation amount requested for: {title}")
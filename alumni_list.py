@@ -0,0 +1,229 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from kivy.clock import Clock
+from kivy.graphics import Color, Rectangle
+from kivy.metrics import dp, sp
+from kivy.properties import StringProperty
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.label import Label
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
+
+# Colors from the image
+WHITE_COLOR = (1, 1, 1, 1)
+GRAY_COLOR = (0.9, 0.9, 0.9, 1)
+DARK_TEXT_COLOR = (0.2, 0.2, 0.2, 1)
+LIGHT_TEXT_COLOR = (0.5, 0.5, 0.5, 1)
+
+# Rows fetched per page, and most rows kept loaded at once
+LIST_PAGE_SIZE = 50
+MAX_LOADED_ROWS = 300
+
+# Fetch the next page once the viewport is this many rows from the end
+PREFETCH_ROWS = 20
+
+ROW_HEIGHT = 64  # dp
+
+_list_executor = None
+
+def get_list_executor():
+    """Single worker thread that runs directory queries in order"""
+    global _list_executor
+    if _list_executor is None:
+        _list_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="alumni-list")
+    return _list_executor
+
+class AlumniRow(BoxLayout):
+    """One recycled directory row: name, then batch and strand"""
+    name = StringProperty("")
+    details = StringProperty("")
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.orientation = 'vertical'
+        self.padding = [dp(20), dp(8), dp(20), dp(8)]
+
+        # White background with a divider at the bottom
+        with self.canvas.before:
+            Color(*WHITE_COLOR)
+            self.bg = Rectangle(pos=self.pos, size=self.size)
+            Color(*GRAY_COLOR)
+            self.divider = Rectangle(pos=self.pos, size=(self.width, 1))
+        self.bind(pos=self._update_canvas, size=self._update_canvas)
+
+        self.name_label = Label(font_size=sp(16), color=DARK_TEXT_COLOR, bold=True,
+                                halign='left', valign='middle', shorten=True)
+        self.details_label = Label(font_size=sp(13), color=LIGHT_TEXT_COLOR,
+                                   halign='left', valign='middle', shorten=True)
+        for label in (self.name_label, self.details_label):
+            label.bind(size=lambda instance, size: setattr(instance, 'text_size', size))
+            self.add_widget(label)
+
+        self.bind(name=self.name_label.setter('text'), details=self.details_label.setter('text'))
+
+    def _update_canvas(self, instance, value):
+        """Update background and divider when size changes"""
+        self.bg.pos = self.pos
+        self.bg.size = self.size
+        self.divider.pos = self.pos
+        self.divider.size = (self.width, 1)
+
+class AlumniListView(RecycleView):
+    """Alumni directory list that loads pages as the user scrolls
+
+    Pages come from DatabaseConnector.list_alumni, which seeks on the
+    (name, id) index, so every page costs the same. Queries run on a
+    background thread and the next page is requested before the user
+    reaches the end of the list. Only a bounded window of rows is kept:
+    rows far above the viewport are dropped as new ones arrive, and
+    fetched again if the user scrolls back up. Rows are drawn by a
+    recycled view, so the widget count stays constant.
+    """
+    def __init__(self, page_size=LIST_PAGE_SIZE, max_rows=MAX_LOADED_ROWS,
+                 prefetch_rows=PREFETCH_ROWS, **kwargs):
+        super().__init__(**kwargs)
+        self.page_size = page_size
+        self.max_rows = max(max_rows, 2 * page_size)
+        self.prefetch_rows = prefetch_rows
+        self.row_height = dp(ROW_HEIGHT)
+
+        self.viewclass = AlumniRow
+        layout = RecycleBoxLayout(
+            orientation='vertical',
+            size_hint_y=None,
+            default_size=(None, self.row_height),
+            default_size_hint=(1, None)
+        )
+        layout.bind(minimum_height=layout.setter('height'))
+        self.add_widget(layout)
+
+        # Year and strand filters passed to list_alumni
+        self.filters = {}
+
+        # Bumped on every reload so answers to older queries are ignored
+        self.generation = 0
+        self.loading = False
+        self.has_more_after = True
+        self.has_more_before = False
+
+        self.bind(scroll_y=self._on_scroll, height=self._on_scroll)
+        Clock.schedule_once(lambda dt: self.reload())
+
+    def reload(self, **filters):
+        """Start the list again from the top, optionally with new filters"""
+        if filters:
+            self.filters = {key: value for key, value in filters.items() if value}
+        self.generation += 1
+        self.loading = False
+        self.has_more_after = True
+        self.has_more_before = False
+        self.data = []
+        self.scroll_y = 1
+        self._fetch('after')
+
+    def _fetch(self, direction):
+        """Request the page after the last row or before the first one"""
+        if self.loading:
+            return
+        if direction == 'after' and not self.has_more_after:
+            return
+        if direction == 'before' and not self.has_more_before:
+            return
+
+        cursor = None
+        if self.data:
+            cursor = self.data[-1]['key'] if direction == 'after' else self.data[0]['key']
+
+        self.loading = True
+        generation = self.generation
+        future = get_list_executor().submit(self._query, direction, cursor, dict(self.filters))
+        future.add_done_callback(
+            lambda future: Clock.schedule_once(lambda dt: self._on_page(future, direction, generation)))
+
+    def _query(self, direction, cursor, filters):
+        """Worker thread: read one page from the database"""
+        from db_connector import db
+
+        if cursor:
+            filters[direction] = cursor
+        return db.list_alumni(limit=self.page_size, **filters)
+
+    def _on_page(self, future, direction, generation):
+        """Main thread: merge a fetched page into the loaded window"""
+        if generation != self.generation:
+            return
+        self.loading = False
+
+        try:
+            ok, message, page = future.result()
+        except Exception as e:
+            print(f"Error loading alumni: {e}")
+            return
+        if not ok:
+            print(message)
+            return
+
+        rows = [self._row_data(user) for user in page['results']]
+        data = list(self.data)
+        if direction == 'after':
+            self.has_more_after = page['has_more']
+            data.extend(rows)
+            added_above = 0
+            # Drop rows from the top once the window is full
+            removed_above = max(0, len(data) - self.max_rows)
+            if removed_above:
+                data = data[removed_above:]
+                self.has_more_before = True
+        else:
+            self.has_more_before = page['has_more']
+            data = rows + data
+            added_above = len(rows)
+            removed_above = 0
+            # Drop rows from the bottom once the window is full
+            if len(data) > self.max_rows:
+                data = data[:self.max_rows]
+                self.has_more_after = True
+
+        self._replace_data(data, added_above - removed_above)
+
+        # Keep going if the viewport is still close to an edge
+        Clock.schedule_once(self._on_scroll)
+
+    def _row_data(self, user):
+        """RecycleView data for one user"""
+        details = " - ".join(
+            value for value in (
+                f"Batch {user['year_graduated']}" if user.get('year_graduated') else None,
+                user.get('strand')
+            ) if value
+        )
+        return {
+            'name': user['name'],
+            'details': details,
+            'key': (user['name'], user['id'])
+        }
+
+    def _replace_data(self, data, rows_shifted):
+        """Swap in new rows without moving what is on screen
+
+        rows_shifted is how many rows were added (positive) or removed
+        (negative) above the current ones.
+        """
+        scrollable = max(len(self.data) * self.row_height - self.height, 0)
+        top_offset = (1 - self.scroll_y) * scrollable + rows_shifted * self.row_height
+
+        self.data = data
+        scrollable = max(len(data) * self.row_height - self.height, 0)
+        if scrollable:
+            self.scroll_y = min(1, max(0, 1 - top_offset / scrollable))
+
+    def _on_scroll(self, *args):
+        """Prefetch when the viewport nears either end of the loaded rows"""
+        if self.loading or not self.data:
+            return
+        scrollable = max(len(self.data) * self.row_height - self.height, 0)
+        margin = self.prefetch_rows * self.row_height
+        if self.has_more_after and self.scroll_y * scrollable < margin:
+            self._fetch('after')
+        elif self.has_more_before and (1 - self.scroll_y) * scrollable < margin:
+            self._fetch('before')
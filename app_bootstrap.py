@@ -0,0 +1,50 @@
+"""One-time application setup shared by every entry point
+
+Page modules used to size the window and create asset directories as
+soon as they were imported. That work now happens here, once, when an
+App is built, so importing a page module has no side effects.
+"""
+from pathlib import Path
+import os
+
+# Device profile constants
+DEVICE_PROFILES = {
+    'small': {'width': 392, 'height': 759},  # Match the image proportions
+    'medium': {'width': 1080, 'height': 2340},  # Common smartphone size
+}
+
+NAVIGATION_ICONS_PATH = Path(__file__).parent / Path(r"navigation_icons")
+
+_window_configured = False
+_created_directories = set()
+
+def ensure_directory(path):
+    """Create a directory the first time it is asked for"""
+    path = Path(path)
+    if path in _created_directories:
+        return path
+    if not os.path.exists(path):
+        os.makedirs(path)
+    _created_directories.add(path)
+    return path
+
+def configure_window(profile='small'):
+    """Size the window for development, once per process"""
+    global _window_configured
+    if _window_configured:
+        return
+    _window_configured = True
+
+    # For mobile devices, let the system set the window size
+    # Only set window size for desktop/development
+    from kivy.utils import platform
+    if platform not in ('android', 'ios'):
+        from kivy.core.window import Window
+        Window.size = (DEVICE_PROFILES[profile]['width'], DEVICE_PROFILES[profile]['height'])
+
+def bootstrap(asset_dirs=(), profile='small'):
+    """Set up the window and asset directories; safe to call repeatedly"""
+    ensure_directory(NAVIGATION_ICONS_PATH)
+    for path in asset_dirs:
+        ensure_directory(path)
+    configure_window(profile)
@@ -0,0 +1,350 @@
+from kivy.app import App
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.floatlayout import FloatLayout
+from kivy.uix.image import Image
+from kivy.uix.label import Label
+from kivy.uix.button import Button
+from kivy.metrics import dp, sp
+from kivy.graphics import Color, Rectangle, Line
+from pathlib import Path
+import os
+
+# Shared navigation icon atlas
+from texture_cache import navigation_icon_source
+
+# Colors from the image
+TEAL_COLOR = (26/255, 164/255, 159/255, 1)  # #1AA49F
+WHITE_COLOR = (1, 1, 1, 1)
+
+# Path to assets
+ASSETS_PATH = Path(__file__).parent / Path(r"build\assets\frame7")
+NAVIGATION_ICONS_PATH = Path(__file__).parent / Path(r"navigation_icons")
+LOGO_PATH = os.path.join(ASSETS_PATH, "image_1.png")
+SETTINGS_ICON_PATH = os.path.join(ASSETS_PATH, "button_9.png")
+
+# Navigation slots: (icon file, label, icon size in dp, fallback label font size)
+NAVIGATION_ITEMS = (
+    ("home_icon.png", "Home", 30, 14),
+    ("donation_icon.png", "Donation", 30, 14),
+    ("search_icon.png", "Search", 30, 14),
+    ("calendar_icon.png", "Event Calendar", 55, 12),
+    ("profile_icon.png", "Profile", 25, 13),
+)
+
+class HeaderBar(BoxLayout):
+    """Teal header bar with the school logo, a title and a settings button
+
+    With a subtitle the title is shown as the two-line, left-aligned
+    school name; without one it is a single centered title. The
+    settings button can be shown or hidden at any time, so one header
+    instance can serve every screen.
+    """
+    def __init__(self, title="Donate", subtitle=None, settings=True,
+                 logo_path=LOGO_PATH, settings_icon=SETTINGS_ICON_PATH, **kwargs):
+        super().__init__(**kwargs)
+        self.orientation = 'horizontal'
+        self.size_hint_y = None
+        self.height = dp(60)
+        self.padding = [dp(10), dp(5), dp(10), dp(5)]
+        self.settings_icon = settings_icon
+
+        # Background color
+        with self.canvas.before:
+            Color(*TEAL_COLOR)
+            self.rect = Rectangle(pos=self.pos, size=self.size)
+        self.bind(pos=self._update_rect, size=self._update_rect)
+
+        # Left - School logo
+        self.logo = Image(
+            source=logo_path if os.path.exists(logo_path) else "",
+            size_hint=(None, 1),
+            width=dp(50),
+            allow_stretch=True,
+            keep_ratio=True
+        )
+        self.add_widget(self.logo)
+
+        # Center - Title, with an optional second line
+        title_layout = BoxLayout(orientation='vertical', size_hint=(1, 1))
+        self.title = Label(color=WHITE_COLOR, bold=True)
+        self.subtitle = Label(color=WHITE_COLOR, font_size=sp(14), halign='left', valign='top')
+        for label in (self.title, self.subtitle):
+            label.bind(size=lambda instance, size: setattr(instance, 'text_size', size))
+            title_layout.add_widget(label)
+        self.add_widget(title_layout)
+        self.set_title(title, subtitle)
+
+        # Right - Settings button
+        self.settings_btn = self.create_settings_button()
+        self.settings_btn.bind(on_press=self.on_settings)
+        self.add_widget(self.settings_btn)
+        self.show_settings_button(settings, animate=False)
+
+    def create_settings_button(self):
+        """Build the settings button; subclasses can use a different widget"""
+        return Button(
+            background_normal=self.settings_icon if os.path.exists(self.settings_icon) else "",
+            background_color=(1, 1, 1, 1),
+            size_hint=(None, None),
+            size=(dp(40), dp(40)),
+            pos_hint={'center_y': 0.5}
+        )
+
+    def set_title(self, title, subtitle=None):
+        """Change the title text and layout in place"""
+        self.title.text = title
+        self.subtitle.text = subtitle or ""
+        if subtitle:
+            # Two-line school name next to the logo
+            self.title.font_size = sp(16)
+            self.title.halign = 'left'
+            self.title.valign = 'bottom'
+            self.title.size_hint_y = 0.5
+            self.subtitle.size_hint_y = 0.5
+            self.subtitle.opacity = 1
+        else:
+            self.title.font_size = sp(22)
+            self.title.halign = 'center'
+            self.title.valign = 'middle'
+            self.title.size_hint_y = 1
+            self.subtitle.size_hint_y = 0
+            self.subtitle.opacity = 0
+
+    def show_settings_button(self, show=True, animate=True):
+        """Show or hide the settings button"""
+        if show:
+            if animate:
+                # Make fully visible with animation
+                from kivy.animation import Animation
+                Animation(opacity=1, duration=0.2).start(self.settings_btn)
+            else:
+                self.settings_btn.opacity = 1
+            self.settings_btn.disabled = False
+        else:
+            # Hide immediately
+            self.settings_btn.opacity = 0
+            self.settings_btn.disabled = True
+
+    def _update_rect(self, instance, value):
+        """Update background when size changes"""
+        self.rect.pos = self.pos
+        self.rect.size = self.size
+
+    def on_settings(self, instance):
+        """Handle settings button press"""
+        print("Settings button pressed")
+
+        # Navigate to the settings page via the app
+        app = App.get_running_app()
+        if hasattr(app, 'show_settings_page'):
+            app.show_settings_page()
+        else:
+            # Try direct navigation if method doesn't exist
+            try:
+                if hasattr(app.root, 'current'):
+                    app.root.current = 'settings'
+                    print("Navigated to settings page")
+            except Exception as e:
+                print(f"Could not navigate to settings: {e}")
+
+class EmptyNavigationBar(BoxLayout):
+    """Navigation bar with 5 empty slots ready to be populated"""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.orientation = 'horizontal'
+        self.size_hint_y = None
+        self.height = dp(60)
+        self.padding = [dp(5), dp(5), dp(5), dp(5)]
+
+        # Background color
+        with self.canvas.before:
+            Color(*WHITE_COLOR)
+            self.rect = Rectangle(pos=self.pos, size=self.size)
+            Color(0.9, 0.9, 0.9, 1)  # Light gray top border
+            self.border = Line(points=[0, 0, 0, 0], width=1)
+        self.bind(pos=self._update_canvas, size=self._update_canvas)
+
+        # Store reference to slots
+        self.slots = []
+
+        # Create 5 empty slots
+        for i in range(5):
+            slot = BoxLayout(orientation='vertical', size_hint=(1, 1))
+            self.add_widget(slot)
+            self.slots.append(slot)
+
+    def add_icon_to_slot(self, slot_index, icon_source, text, icon_size=None, icon_pos_y=0.5):
+        """Add an icon and text to a specific slot"""
+        if 0 <= slot_index < len(self.slots):
+            # Clear any existing content in the slot
+            self.slots[slot_index].clear_widgets()
+
+            # Create vertical layout for the icon and text
+            content_layout = BoxLayout(orientation='vertical', size_hint=(1, 1))
+
+            # Default icon size
+            if icon_size is None:
+                icon_size = (dp(30), dp(30))
+
+            # Add icon with adjustable vertical position
+            icon = Image(
+                source=navigation_icon_source(icon_source),
+                size_hint=(None, None),
+                size=icon_size,
+                pos_hint={'center_x': 0.5, 'center_y': icon_pos_y}
+            )
+
+            # Add icon container with increased height for more room
+            icon_container = FloatLayout(size_hint=(1, None), height=dp(45))
+            icon_container.add_widget(icon)
+
+            # Add text with adjusted position
+            text_label = Label(
+                text=text,
+                font_size=sp(12),
+                size_hint=(1, None),
+                height=dp(15),  # Reduced height to move up closer to icon
+                halign='center',
+                padding=(0, dp(-8))  # Increased negative padding to pull text up
+            )
+
+            # Add widgets to content layout
+            content_layout.add_widget(icon_container)
+            content_layout.add_widget(text_label)
+
+            # Add content layout to slot
+            self.slots[slot_index].add_widget(content_layout)
+
+    def add_default_icons(self, fallback_path=None):
+        """Fill the five slots with the standard navigation icons"""
+        for slot_index, (filename, text, size, font_size) in enumerate(NAVIGATION_ITEMS):
+            icon_path = os.path.join(NAVIGATION_ICONS_PATH, filename)
+            if not os.path.exists(icon_path) and fallback_path:
+                icon_path = os.path.join(fallback_path, filename)
+
+            if os.path.exists(icon_path):
+                self.add_icon_to_slot(slot_index, icon_path, text,
+                                      icon_size=(dp(size), dp(size)),
+                                      icon_pos_y=0.3)
+            else:
+                self.slots[slot_index].add_widget(Label(text=text, font_size=sp(font_size)))
+
+    def _update_canvas(self, instance, value):
+        """Update background and border when size changes"""
+        self.rect.pos = self.pos
+        self.rect.size = self.size
+
+        self.border.points = [
+            self.x, self.y + self.height - 1,
+            self.x + self.width, self.y + self.height - 1
+        ]
+
+class ChromeHost:
+    """One header and navigation bar kept on screen above a ScreenManager
+
+    The chrome widgets sit on the Window next to the ScreenManager, so
+    changing screens never rebuilds them. Each screen, or the page it
+    hosts, describes what it needs with a chrome_options dict:
+
+        header      show the header bar
+        title       header title
+        subtitle    second title line (school name style)
+        settings    show the settings button (left alone if missing)
+        navigation  show the navigation bar
+
+    Screens without chrome_options get the whole window.
+    """
+    def __init__(self, screen_manager, header=None, navigation=None):
+        self.screen_manager = screen_manager
+        self.header = header or HeaderBar()
+        self.navigation = navigation
+        self.header_visible = False
+        self.navigation_visible = False
+        self.attached = False
+        self._set_visible(self.header, False)
+
+    def attach(self):
+        """Put the chrome on the window; call once the app root is shown"""
+        from kivy.core.window import Window
+        if self.attached:
+            return
+        self.attached = True
+
+        # The app manages sizes from here on
+        self.screen_manager.size_hint = (None, None)
+        self.header.size_hint = (None, None)
+        Window.add_widget(self.header)
+        Window.bind(size=self._layout)
+        self.screen_manager.bind(current_screen=self._on_current_screen)
+        self._on_current_screen(self.screen_manager, self.screen_manager.current_screen)
+
+    def apply(self, options):
+        """Show the chrome a screen asked for"""
+        self.header_visible = bool(options.get('header'))
+        if self.header_visible:
+            self.header.set_title(options.get('title', self.header.title.text), options.get('subtitle'))
+            if 'settings' in options:
+                self.header.show_settings_button(options['settings'], animate=False)
+        self._set_visible(self.header, self.header_visible)
+
+        self.navigation_visible = bool(options.get('navigation'))
+        if self.navigation_visible and self.navigation is None:
+            self._create_navigation()
+        if self.navigation is not None:
+            self._set_visible(self.navigation, self.navigation_visible)
+
+        self._layout()
+
+    def _create_navigation(self):
+        """Build the navigation bar the first time a screen needs it"""
+        from kivy.core.window import Window
+        self.navigation = EmptyNavigationBar(size_hint=(None, None))
+        self.navigation.add_default_icons()
+        if self.attached:
+            Window.add_widget(self.navigation)
+
+    def _on_current_screen(self, screen_manager, screen):
+        """Update the chrome for the screen being shown"""
+        self.apply(chrome_options(screen))
+
+    def _layout(self, *args):
+        """Place the chrome and fit the ScreenManager between it"""
+        from kivy.core.window import Window
+        if not self.attached:
+            return
+        width, height = Window.size
+        top = self.header.height if self.header_visible else 0
+        bottom = self.navigation.height if self.navigation_visible else 0
+
+        self.header.width = width
+        self.header.pos = (0, height - self.header.height)
+        if self.navigation is not None:
+            self.navigation.width = width
+            self.navigation.pos = (0, 0)
+
+        self.screen_manager.pos = (0, bottom)
+        self.screen_manager.size = (width, height - top - bottom)
+
+    def _set_visible(self, widget, visible):
+        """Hide chrome without removing it from the window"""
+        widget.opacity = 1 if visible else 0
+        widget.disabled = not visible
+
+def chrome_options(screen):
+    """Return the chrome_options of a screen or of the page inside it"""
+    if screen is None:
+        return {}
+    for widget in [screen] + list(screen.children):
+        options = getattr(widget, 'chrome_options', None)
+        if isinstance(options, dict):
+            return options
+    return {}
+
+def shared_chrome():
+    """Return the running app's ChromeHost, or None for standalone pages"""
+    app = App.get_running_app()
+    return getattr(app, 'chrome', None) if app else None
+
+def chrome_height(widget):
+    """Height taken by a page's own header or navigation bar, if it has one"""
+    return widget.height if widget is not None else 0
@@ -0,0 +1,215 @@
+from pathlib import Path
+import bisect
+import os
+import re
+
+# Path to assets
+ASSETS_PATH = Path(__file__).parent / Path(r"build\assets\frame7")
+
+# Ranking weights - a title hit always outranks a description hit
+TITLE_MATCH_SCORE = 10
+DESCRIPTION_MATCH_SCORE = 1
+TITLE_PHRASE_BONUS = 5
+
+# Default number of campaigns per results page
+DEFAULT_PAGE_SIZE = 10
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+def tokenize(text):
+    """Split text into lowercase search tokens"""
+    return _TOKEN_RE.findall((text or "").lower())
+
+class CampaignIndex:
+    """Searchable in-memory index of donation campaigns
+
+    Each campaign is a dict with 'id', 'title', 'description' and
+    'image_path'. Titles and descriptions are indexed separately so a
+    title match always ranks above a description match. Query tokens
+    are matched as prefixes so results update sensibly while typing.
+    """
+    def __init__(self, campaigns=None):
+        self.campaigns = {}
+        self.order = []
+
+        # token -> set of campaign ids, kept separately for ranking
+        self.title_postings = {}
+        self.description_postings = {}
+
+        # Sorted token list used for prefix lookups
+        self.sorted_tokens = []
+
+        # Memo of the last query so paging does not re-rank
+        self._last_query = None
+        self._last_results = []
+
+        for campaign in campaigns or []:
+            self.add(campaign)
+
+    def __len__(self):
+        return len(self.order)
+
+    def add(self, campaign):
+        """Add a campaign to the index"""
+        campaign_id = campaign['id']
+        if campaign_id in self.campaigns:
+            self.remove(campaign_id)
+
+        self.campaigns[campaign_id] = campaign
+        self.order.append(campaign_id)
+
+        for token in set(tokenize(campaign.get('title'))):
+            self._add_posting(self.title_postings, token, campaign_id)
+        for token in set(tokenize(campaign.get('description'))):
+            self._add_posting(self.description_postings, token, campaign_id)
+
+        self._last_query = None
+
+    def remove(self, campaign_id):
+        """Remove a campaign from the index"""
+        campaign = self.campaigns.pop(campaign_id, None)
+        if campaign is None:
+            return
+
+        self.order.remove(campaign_id)
+        for token in set(tokenize(campaign.get('title'))):
+            self._remove_posting(self.title_postings, token, campaign_id)
+        for token in set(tokenize(campaign.get('description'))):
+            self._remove_posting(self.description_postings, token, campaign_id)
+
+        self._last_query = None
+
+    def get(self, campaign_id):
+        """Return the campaign with the given id, or None"""
+        return self.campaigns.get(campaign_id)
+
+    def search(self, query, page=0, page_size=DEFAULT_PAGE_SIZE):
+        """Return (campaigns, total) for one page of ranked results"""
+        results = self._ranked_ids(query)
+        start = max(page, 0) * page_size
+        page_ids = results[start:start + page_size]
+        return [self.campaigns[campaign_id] for campaign_id in page_ids], len(results)
+
+    def _ranked_ids(self, query):
+        """Rank all campaigns matching the query, best first"""
+        normalized = " ".join(tokenize(query))
+        if normalized == self._last_query:
+            return self._last_results
+
+        tokens = normalized.split()
+        if not tokens:
+            # Empty query lists the whole catalog in its natural order
+            results = list(self.order)
+        else:
+            scores = None
+            for token in tokens:
+                token_scores = {}
+                for indexed_token in self._tokens_with_prefix(token):
+                    for campaign_id in self.description_postings.get(indexed_token, ()):
+                        token_scores[campaign_id] = max(
+                            token_scores.get(campaign_id, 0), DESCRIPTION_MATCH_SCORE)
+                    for campaign_id in self.title_postings.get(indexed_token, ()):
+                        token_scores[campaign_id] = TITLE_MATCH_SCORE
+
+                # Every query token has to match somewhere
+                if scores is None:
+                    scores = token_scores
+                else:
+                    scores = {
+                        campaign_id: score + token_scores[campaign_id]
+                        for campaign_id, score in scores.items()
+                        if campaign_id in token_scores
+                    }
+                if not scores:
+                    break
+
+            # Bonus when the query appears as a phrase in the title
+            for campaign_id in scores:
+                title = " ".join(tokenize(self.campaigns[campaign_id].get('title')))
+                if normalized in title:
+                    scores[campaign_id] += TITLE_PHRASE_BONUS
+
+            position = {campaign_id: i for i, campaign_id in enumerate(self.order)} if scores else {}
+            results = sorted(scores, key=lambda campaign_id: (-scores[campaign_id], position[campaign_id]))
+
+        self._last_query = normalized
+        self._last_results = results
+        return results
+
+    def _tokens_with_prefix(self, prefix):
+        """Yield every indexed token that starts with prefix"""
+        start = bisect.bisect_left(self.sorted_tokens, prefix)
+        for token in self.sorted_tokens[start:]:
+            if not token.startswith(prefix):
+                break
+            yield token
+
+    def _add_posting(self, postings, token, campaign_id):
+        """Record that a campaign contains a token"""
+        if token not in self.title_postings and token not in self.description_postings:
+            bisect.insort(self.sorted_tokens, token)
+        postings.setdefault(token, set()).add(campaign_id)
+
+    def _remove_posting(self, postings, token, campaign_id):
+        """Forget that a campaign contains a token"""
+        ids = postings.get(token)
+        if ids is None:
+            return
+        ids.discard(campaign_id)
+        if not ids:
+            del postings[token]
+            if token not in self.title_postings and token not in self.description_postings:
+                index = bisect.bisect_left(self.sorted_tokens, token)
+                if index < len(self.sorted_tokens) and self.sorted_tokens[index] == token:
+                    del self.sorted_tokens[index]
+
+# Building blocks for the sample catalog
+_SAMPLE_PROJECTS = [
+    ("Computer Labs", "image_3.png", "New computers, monitors and networking for the student computer laboratories."),
+    ("Infrastructure", "image_5.png", "Repairs and upgrades to classrooms, roofing, walkways and campus grounds."),
+    ("Library Books", "image_3.png", "Textbooks, reference materials and reading corners for the school library."),
+    ("Science Laboratory", "image_3.png", "Microscopes, chemicals and safety equipment for science classes."),
+    ("Scholarship Fund", "image_5.png", "Tuition support for deserving students from low-income families."),
+    ("Sports Equipment", "image_5.png", "Balls, nets, uniforms and training gear for varsity teams."),
+    ("Feeding Program", "image_5.png", "Nutritious daily meals for students in the school feeding program."),
+    ("Music Room", "image_3.png", "Instruments, sound system and practice space for the school band and choir."),
+    ("Chapel Renovation", "image_5.png", "Restoration of the school chapel, pews and stained glass windows."),
+    ("Clinic Supplies", "image_3.png", "Medicines, first aid kits and equipment for the school clinic."),
+    ("Solar Panels", "image_5.png", "Rooftop solar power to lower electricity costs and teach renewable energy."),
+    ("Robotics Club", "image_3.png", "Robot kits, sensors and competition fees for the robotics club."),
+]
+
+_SAMPLE_CAMPAIGNS = [
+    "Batch {year} Pledge",
+    "Alumni Homecoming {year}",
+    "Class of {year} Legacy Gift",
+]
+
+def build_sample_catalog(count=300):
+    """Build a realistic catalog of sample donation campaigns"""
+    campaigns = []
+    year = 2024
+    while len(campaigns) < count:
+        for campaign_name in _SAMPLE_CAMPAIGNS:
+            for project, image_name, description in _SAMPLE_PROJECTS:
+                if len(campaigns) >= count:
+                    break
+                campaign_id = len(campaigns) + 1
+                campaigns.append({
+                    'id': campaign_id,
+                    'title': f"Donate for {project} ({campaign_name.format(year=year)})",
+                    'description': description,
+                    'image_path': os.path.join(ASSETS_PATH, image_name),
+                })
+        year -= 1
+    return campaigns
+
+# Shared index used by every donation page in the app
+_shared_index = None
+
+def get_campaign_index():
+    """Return the shared campaign index, building it on first use"""
+    global _shared_index
+    if _shared_index is None:
+        _shared_index = CampaignIndex(build_sample_catalog())
+    return _shared_index
@@ -0,0 +1,235 @@
+from kivy.uix.screenmanager import Screen
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.label import Label
+from kivy.uix.button import Button
+from kivy.uix.textinput import TextInput
+from kivy.uix.widget import Widget
+from kivy.metrics import dp, sp
+from kivy.graphics import Color, Rectangle
+from kivy.clock import Clock
+import threading
+import time
+
+# Shared header bar, the check-in desk and its write buffer
+from app_chrome import HeaderBar, shared_chrome
+from checkin_queue import CheckinStation, get_checkin_queue
+from session import format_batch
+
+# Colors from the image
+TEAL_COLOR = (26/255, 164/255, 159/255, 1)  # #1AA49F
+WHITE_COLOR = (1, 1, 1, 1)
+DARK_TEXT_COLOR = (0.2, 0.2, 0.2, 1)
+LIGHT_TEXT_COLOR = (0.5, 0.5, 0.5, 1)
+PURPLE_COLOR = (81/255, 45/255, 168/255, 1)  # Purple for event title
+SUCCESS_TEXT_COLOR = (0.1, 0.6, 0.3, 1)
+WARNING_TEXT_COLOR = (0.85, 0.55, 0.1, 1)
+ERROR_TEXT_COLOR = (0.8, 0.2, 0.2, 1)
+
+# How often the counters are redrawn, and how many recent scans are listed
+STATS_REFRESH_INTERVAL = 1.0  # Seconds
+RECENT_SCANS_SHOWN = 5
+
+# Reopening an event reads its attendee list again once it is this old
+ATTENDEE_LIST_TTL = 300  # Seconds
+
+# Message and color shown for each check-in result
+SCAN_RESULTS = {
+    "checked_in": ("Checked in", SUCCESS_TEXT_COLOR),
+    "already_checked_in": ("Already checked in", WARNING_TEXT_COLOR),
+    "not_registered": ("Not on the attendee list", ERROR_TEXT_COLOR),
+    "invalid": ("Not a valid alumni QR code", ERROR_TEXT_COLOR),
+}
+
+class CheckinPage(Screen):
+    """Door check-in for one event, driven by a handheld QR scanner
+
+    The attendee list is loaded on a background thread; after that
+    each scan is checked against memory and queued for a batched write,
+    so the field is ready for the next code straight away. Counters are
+    redrawn on a timer instead of after every scan.
+    """
+    # Chrome the app's shared header bar shows for this page
+    chrome_options = {'header': True, 'title': "Event Check-in", 'settings': False}
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        layout = BoxLayout(orientation='vertical')
+        self.add_widget(layout)
+
+        # White background
+        with layout.canvas.before:
+            Color(*WHITE_COLOR)
+            self.rect = Rectangle(pos=layout.pos, size=layout.size)
+        layout.bind(pos=self._update_rect, size=self._update_rect)
+
+        # The header comes from the app's shared chrome when it has one
+        if shared_chrome() is None:
+            layout.add_widget(HeaderBar(title="Event Check-in", settings=False))
+
+        content = BoxLayout(orientation='vertical', padding=[dp(20), dp(10), dp(20), dp(20)], spacing=dp(10))
+        layout.add_widget(content)
+
+        # Back button at the top-left
+        back_btn = Button(
+            text="< Back",
+            font_size=sp(18),
+            color=TEAL_COLOR,
+            background_color=(0, 0, 0, 0),  # Transparent background
+            size_hint=(None, None),
+            size=(dp(80), dp(30))
+        )
+        back_btn.bind(on_press=self.on_back)
+        content.add_widget(back_btn)
+
+        # Event and counters
+        self.event_label = self._label(sp(20), PURPLE_COLOR, dp(30), bold=True)
+        content.add_widget(self.event_label)
+        self.stats_label = self._label(sp(14), LIGHT_TEXT_COLOR, dp(40))
+        content.add_widget(self.stats_label)
+
+        # Scan field; handheld scanners type the code and press Enter
+        self.scan_input = TextInput(
+            hint_text="Scan an alumni QR code",
+            size_hint_y=None,
+            height=dp(40),
+            multiline=False,
+            disabled=True
+        )
+        self.scan_input.bind(on_text_validate=self.on_scan)
+        content.add_widget(self.scan_input)
+
+        self.result_label = self._label(sp(18), DARK_TEXT_COLOR, dp(60), bold=True)
+        content.add_widget(self.result_label)
+
+        # Latest scans, newest first
+        content.add_widget(self._label(sp(14), DARK_TEXT_COLOR, dp(25), text="Recent scans", bold=True))
+        self.recent_label = self._label(sp(13), LIGHT_TEXT_COLOR, dp(110))
+        content.add_widget(self.recent_label)
+
+        content.add_widget(Widget(size_hint_y=1))
+
+        self.station = None
+        self._loading = None  # Station whose attendee list is being read
+        self.recent = []
+        self._stats_event = None
+
+    def _label(self, font_size, color, height, text="", bold=False):
+        """Centered single-purpose label of a fixed height"""
+        label = Label(text=text, font_size=font_size, color=color, bold=bold,
+                      size_hint_y=None, height=height, halign='center', valign='middle')
+        label.bind(size=lambda instance, size: setattr(instance, 'text_size', size))
+        return label
+
+    def _update_rect(self, instance, value):
+        """Update background rectangle on size/position change"""
+        self.rect.pos = instance.pos
+        self.rect.size = instance.size
+
+    def set_event(self, event_title, event_date):
+        """Start checking in to an event, loading its attendees in the background
+
+        Reopening the loaded event keeps its list until it is older than
+        ATTENDEE_LIST_TTL; then it is read again while the current list
+        keeps answering scans.
+        """
+        event = (event_title, event_date)
+        if self._loading and (self._loading.event_title, self._loading.event_date) == event:
+            return
+        if self.station and (self.station.event_title, self.station.event_date) == event:
+            if time.monotonic() - self.station.loaded_at < ATTENDEE_LIST_TTL:
+                return
+        else:
+            self.station = None
+            self.recent = []
+            self.event_label.text = event_title
+            self.stats_label.text = "Loading attendee list..."
+            self.result_label.text = ""
+            self.recent_label.text = ""
+            self.scan_input.disabled = True
+
+        station = self._loading = CheckinStation(event_title, event_date)
+        threading.Thread(target=self._load_station, args=(station,), daemon=True).start()
+
+    def _load_station(self, station):
+        """Worker thread: read the attendee list and earlier check-ins"""
+        ok, message = station.load()
+        Clock.schedule_once(lambda dt: self._station_loaded(station, ok, message))
+
+    def _station_loaded(self, station, ok, message):
+        """Main thread: open the scan field once the list is in memory"""
+        if station is not self._loading:
+            return
+        self._loading = None
+        if not ok:
+            # A list that could not be refreshed keeps the one already loaded
+            if self.station is None:
+                self.stats_label.text = message
+            return
+        self.station = station
+        self.scan_input.disabled = False
+        self.scan_input.focus = True
+        self.result_label.color = LIGHT_TEXT_COLOR
+        self.result_label.text = message
+        self._refresh_stats()
+
+    def on_enter(self):
+        """Redraw the counters while the page is shown"""
+        self._stats_event = Clock.schedule_interval(self._refresh_stats, STATS_REFRESH_INTERVAL)
+        if self.station:
+            self.scan_input.focus = True
+
+    def on_leave(self):
+        """Stop the counter timer and send what is queued"""
+        if self._stats_event:
+            self._stats_event.cancel()
+            self._stats_event = None
+        threading.Thread(target=get_checkin_queue().flush, daemon=True).start()
+
+    def _refresh_stats(self, dt=None):
+        """Show check-ins so far and how many still wait for the database"""
+        if self.station is None:
+            return
+        pending = get_checkin_queue().pending_count()
+        offline = " (offline)" if self.station.offline else ""
+        self.stats_label.text = (
+            f"Checked in {len(self.station.checked_in)} of {len(self.station.attendees)}{offline}\n"
+            f"Waiting to sync: {pending}"
+        )
+
+    def on_scan(self, instance):
+        """Check in a scanned code and ready the field for the next one"""
+        code = instance.text.strip()
+        instance.text = ""
+        if not code or self.station is None:
+            return
+
+        status, attendee = self.station.check_in(code)
+        message, color = SCAN_RESULTS[status]
+        if attendee:
+            batch = format_batch(attendee.get('year_graduated'))
+            message = f"{message}: {attendee['name']}" + (f" ({batch})" if batch else "")
+        self.result_label.color = color
+        self.result_label.text = message
+
+        self.recent.insert(0, message)
+        del self.recent[RECENT_SCANS_SHOWN:]
+        self.recent_label.text = "\n".join(self.recent)
+
+        # Keep the field focused so a handheld scanner can type the next code
+        Clock.schedule_once(lambda dt: setattr(instance, 'focus', True))
+
+    def on_back(self, instance):
+        """Return to the event details"""
+        if self.manager and self.manager.has_screen('event_details'):
+            self.manager.current = 'event_details'
+
+def show_checkin(manager, event_title, event_date):
+    """Open the check-in page for an event, adding it to the screen manager once"""
+    if manager.has_screen('event_checkin'):
+        page = manager.get_screen('event_checkin')
+    else:
+        page = CheckinPage(name='event_checkin')
+        manager.add_widget(page)
+    page.set_event(event_title, event_date)
+    manager.current = 'event_checkin'
@@ -0,0 +1,376 @@
+import atexit
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Local store of check-ins and attendee snapshots, usable without a server
+DATA_PATH = Path(__file__).parent / "data"
+CHECKIN_QUEUE_PATH = DATA_PATH / "checkin_queue.db"
+
+# Scans are committed locally at most this often, and in groups up to this size
+FLUSH_INTERVAL = 1.0  # Seconds
+FLUSH_BATCH_SIZE = 200
+
+# Wait before sending again after the database refused a batch
+SYNC_RETRY_DELAY = 30  # Seconds
+
+class CheckinQueue:
+    """Batched, durable write buffer for event check-ins
+
+    Check-ins are appended to an in-memory buffer and return at once. A
+    flusher thread commits the buffer to a local SQLite file once a
+    second (or as soon as FLUSH_BATCH_SIZE scans are waiting), then
+    sends every unsent check-in to the database in batches with
+    db.record_checkins. Check-ins sent while the app runs on the SQLite
+    fallback are sent again once a later run is connected to MySQL, so
+    a door that worked offline syncs up by itself.
+
+    The same file keeps a snapshot of each event's attendee list and
+    the QR signing key from the last online load, so check-in keeps
+    working offline.
+    """
+    def __init__(self, queue_path=CHECKIN_QUEUE_PATH, flush_interval=FLUSH_INTERVAL,
+                 batch_size=FLUSH_BATCH_SIZE):
+        self.queue_path = Path(queue_path)
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+
+        self._buffer = []
+        self._pending = 0  # Buffered or unsent check-ins, kept so counters never read the disk
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._flusher = None
+        self._running = False
+        self._next_sync_at = 0
+
+    def start(self):
+        """Create the local store and start the flusher"""
+        if self._running:
+            return
+        self.queue_path.parent.mkdir(parents=True, exist_ok=True)
+        self._initialize_store()
+        self._pending = self._count_unsent()
+
+        self._running = True
+        self._flusher = threading.Thread(target=self._flush_loop, name="checkin-flusher", daemon=True)
+        self._flusher.start()
+
+    def stop(self, timeout=5):
+        """Flush what is buffered and stop the flusher"""
+        if not self._running:
+            return
+        self._running = False
+        self._wake.set()
+        self._flusher.join(timeout)
+        self._flusher = None
+
+    def add(self, user_id, event_title, event_date, checked_in_at=None):
+        """Buffer one check-in; it is committed locally within flush_interval"""
+        checked_in_at = checked_in_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock:
+            self._buffer.append((user_id, event_title, event_date, checked_in_at))
+            self._pending += 1
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            self._wake.set()
+
+    def flush(self):
+        """Commit buffered check-ins and try to send unsent ones now"""
+        self._commit_buffer()
+        self._next_sync_at = 0
+        return self._sync()
+
+    def pending_count(self):
+        """Check-ins not yet in the database (buffered or unsent), from memory"""
+        return self._pending
+
+    def checked_in_users(self, event_title, event_date):
+        """Ids of users checked in to an event on this device"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT user_id FROM checkins WHERE event_date = ? AND event_title = ?",
+                (event_date, event_title)
+            ).fetchall()
+        finally:
+            conn.close()
+        with self._lock:
+            buffered = [row[0] for row in self._buffer if row[1] == event_title and row[2] == event_date]
+        return {row[0] for row in rows} | set(buffered)
+
+    def save_snapshot(self, event_title, event_date, attendees, signing_key):
+        """Keep an event's attendees and the QR key for offline check-in"""
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM attendee_snapshots WHERE event_date = ? AND event_title = ?",
+                         (event_date, event_title))
+            conn.executemany(
+                "INSERT INTO attendee_snapshots (event_date, event_title, user_id, name, year_graduated) VALUES (?, ?, ?, ?, ?)",
+                [(event_date, event_title, user['id'], user['name'], user.get('year_graduated')) for user in attendees]
+            )
+            if signing_key:
+                conn.execute("INSERT OR REPLACE INTO snapshot_keys (name, value) VALUES ('qr_signing_key', ?)",
+                             (signing_key.hex(),))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def load_snapshot(self, event_title, event_date):
+        """Attendees and QR key saved by the last online load (empty if none)"""
+        conn = self._connect()
+        try:
+            conn.row_factory = sqlite3.Row
+            attendees = [dict(row) for row in conn.execute(
+                "SELECT user_id AS id, name, year_graduated FROM attendee_snapshots WHERE event_date = ? AND event_title = ?",
+                (event_date, event_title)
+            )]
+        finally:
+            conn.close()
+        return attendees, self.snapshot_key()
+
+    def snapshot_key(self):
+        """QR signing key saved by the last online load, or None"""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT value FROM snapshot_keys WHERE name = 'qr_signing_key'").fetchone()
+        finally:
+            conn.close()
+        return bytes.fromhex(row[0]) if row else None
+
+    def _flush_loop(self):
+        """Commit and send check-ins until stopped"""
+        while self._running:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self._commit_buffer()
+                if time.monotonic() >= self._next_sync_at:
+                    self._sync()
+            except Exception as e:
+                print(f"Unexpected error in check-in flusher: {e}")
+
+        # Nothing buffered is lost on a clean stop
+        self._commit_buffer()
+
+    def _commit_buffer(self):
+        """Write every buffered check-in to the local store in one transaction"""
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+        if not batch:
+            return
+        conn = self._connect()
+        try:
+            conn.executemany(
+                "INSERT OR IGNORE INTO checkins (user_id, event_title, event_date, checked_in_at) VALUES (?, ?, ?, ?)",
+                batch
+            )
+            conn.commit()
+
+            # Check-ins this device already had are not pending twice
+            skipped = len(batch) - conn.total_changes
+            if skipped:
+                with self._lock:
+                    self._pending -= skipped
+        except sqlite3.Error as e:
+            # Put the batch back so the next flush tries again
+            print(f"Error saving check-ins locally: {e}")
+            with self._lock:
+                self._buffer = batch + self._buffer
+        finally:
+            conn.close()
+
+    def _sync(self):
+        """Send unsent check-ins to the database in batches; return how many were sent"""
+        from db_connector import db
+
+        if not db.connected:
+            return 0
+
+        # Rows sent to the SQLite fallback still go to MySQL when it is back
+        if db.db_type == 'mysql':
+            unsent = "synced_to IS NULL OR synced_to <> 'mysql'"
+        else:
+            unsent = "synced_to IS NULL"
+
+        # The flusher and an explicit flush() must not send the same rows twice
+        with self._sync_lock:
+            return self._send_unsent(db, unsent)
+
+    def _send_unsent(self, db, unsent):
+        """Send rows matching the unsent filter until none are left or a batch fails"""
+        sent = 0
+        conn = self._connect()
+        try:
+            while True:
+                rows = conn.execute(
+                    f"SELECT rowid, user_id, event_title, event_date, checked_in_at FROM checkins WHERE {unsent} LIMIT ?",
+                    (self.batch_size,)
+                ).fetchall()
+                if not rows:
+                    break
+                ok, message = db.record_checkins([row[1:] for row in rows])
+                if not ok:
+                    print(f"Check-ins kept for later sync: {message}")
+                    self._next_sync_at = time.monotonic() + SYNC_RETRY_DELAY
+                    break
+                conn.executemany("UPDATE checkins SET synced_to = ? WHERE rowid = ?",
+                                 [(db.db_type, row[0]) for row in rows])
+                conn.commit()
+                sent += len(rows)
+
+                # Rows on the SQLite fallback still wait for MySQL
+                if db.db_type == 'mysql':
+                    with self._lock:
+                        self._pending -= len(rows)
+        finally:
+            conn.close()
+        return sent
+
+    def _initialize_store(self):
+        """Create the local tables if they don't exist"""
+        conn = self._connect()
+        try:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS checkins (
+                    user_id INTEGER NOT NULL,
+                    event_title TEXT NOT NULL,
+                    event_date TEXT NOT NULL,
+                    checked_in_at TEXT NOT NULL,
+                    synced_to TEXT,
+                    PRIMARY KEY (event_date, event_title, user_id)
+                )
+            ''')
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_checkins_synced ON checkins (synced_to)")
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS attendee_snapshots (
+                    event_date TEXT NOT NULL,
+                    event_title TEXT NOT NULL,
+                    user_id INTEGER NOT NULL,
+                    name TEXT,
+                    year_graduated TEXT,
+                    PRIMARY KEY (event_date, event_title, user_id)
+                )
+            ''')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS snapshot_keys (
+                    name TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            ''')
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _count_unsent(self):
+        """Check-ins in the local store not yet in MySQL"""
+        conn = self._connect()
+        try:
+            return conn.execute(
+                "SELECT COUNT(*) FROM checkins WHERE synced_to IS NULL OR synced_to <> 'mysql'"
+            ).fetchone()[0]
+        finally:
+            conn.close()
+
+    def _connect(self):
+        """Open a connection to the local store"""
+        return sqlite3.connect(str(self.queue_path), timeout=10)
+
+class CheckinStation:
+    """Check-in desk for one event: every scan is answered from memory
+
+    load() reads the event's attendees and earlier check-ins once (from
+    the database, or from the offline snapshot) into a dict and a set.
+    After that check_in() only verifies the QR signature, looks the user
+    up in memory and hands the check-in to the write buffer, so a scan
+    never waits for the database or the disk.
+    """
+    def __init__(self, event_title, event_date, checkin_queue=None):
+        self.event_title = event_title
+        self.event_date = event_date
+        self.queue = checkin_queue or get_checkin_queue()
+        self.attendees = {}  # user id -> attendee dict
+        self.checked_in = set()
+        self.payloads = None
+        self.offline = False
+        self.loaded_at = None  # time.monotonic() of the last successful load
+
+    def load(self):
+        """Read attendees and check-ins; return (success, message)"""
+        from db_connector import db
+        from qr_payload import QRPayloads, get_qr_payloads
+
+        ok, message, state = db.get_event_attendees(self.event_title, self.event_date)
+        online = ok and db.db_type == 'mysql'
+        snapshot, snapshot_key = self.queue.load_snapshot(self.event_title, self.event_date)
+
+        # The server's list is the whole truth; the snapshot only stands in when it can't be read
+        if online or (ok and not snapshot):
+            attendees = {user['id']: user for user in state['attendees']}
+        else:
+            attendees = {user['id']: user for user in snapshot}
+        checked_in = self.queue.checked_in_users(self.event_title, self.event_date)
+        if ok:
+            checked_in.update(state['checked_in'])
+
+        if online:
+            # Remember the list and key for a door that loses the server later
+            payloads = get_qr_payloads()
+            self.queue.save_snapshot(self.event_title, self.event_date, state['attendees'], payloads.signing_key())
+        elif snapshot_key is not None:
+            # Codes are signed with the server's key, not the fallback database's
+            payloads = QRPayloads(secret=snapshot_key)
+        else:
+            payloads = get_qr_payloads()
+
+        if not attendees and not ok:
+            return False, message
+
+        # Read the key here, on the loading thread, so no scan ever waits for it
+        if payloads.signing_key() is None:
+            return False, "QR codes cannot be checked without the signing key"
+
+        self.attendees = attendees
+        self.checked_in = checked_in
+        self.payloads = payloads
+        self.offline = not online
+        self.loaded_at = time.monotonic()
+        return True, f"{len(attendees)} attendees loaded" + (" (offline)" if self.offline else "")
+
+    def check_in(self, payload):
+        """Check in the owner of a scanned code
+
+        Returns (status, attendee) where status is "checked_in",
+        "already_checked_in", "not_registered" or "invalid".
+        """
+        if self.payloads is None:
+            return "invalid", None
+        user_id = self.payloads.verify(payload)
+        if user_id is None:
+            return "invalid", None
+
+        attendee = self.attendees.get(user_id)
+        if attendee is None:
+            return "not_registered", None
+        if user_id in self.checked_in:
+            return "already_checked_in", attendee
+
+        self.checked_in.add(user_id)
+        self.queue.add(user_id, self.event_title, self.event_date)
+        return "checked_in", attendee
+
+# Shared queue used by check-in stations
+_checkin_queue = None
+
+def get_checkin_queue():
+    """Return the shared check-in queue, starting it on first use"""
+    global _checkin_queue
+    if _checkin_queue is None:
+        _checkin_queue = CheckinQueue()
+        _checkin_queue.start()
+
+        # Scans accepted in the last flush interval are committed on exit
+        atexit.register(_checkin_queue.stop)
+    return _checkin_queue
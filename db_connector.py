@@ -1,10 +1,68 @@
 import mysql.connector
 from mysql.connector import Error
 import os
+import re
 import time
 import sqlite3
+import secrets
+import threading
+from datetime import datetime
 from pathlib import Path
 
+# Trigram index and edit-distance scoring for fuzzy name lookup
+from name_matching import name_trigrams, name_similarity
+
+# Login throttling in front of authenticate_user
+from rate_limiter import get_login_limiter
+
+# Offline geocoding and grid cells for nearby alumni
+from geo_index import (get_gazetteer, grid_cell, neighborhood_cells, distance_km,
+                       NEARBY_RADIUS_KM, MAX_NEARBY_RADIUS_KM)
+
+# Alumni search result pages
+DEFAULT_SEARCH_PAGE_SIZE = 20
+MAX_SEARCH_PAGE_SIZE = 100
+
+# Alumni directory listing pages
+DEFAULT_LIST_PAGE_SIZE = 50
+
+# InnoDB ignores FULLTEXT terms shorter than innodb_ft_min_token_size
+MYSQL_FT_MIN_TOKEN_SIZE = 3
+
+# Columns returned by alumni search (never the password)
+ALUMNI_SEARCH_COLUMNS = "u.id, u.name, u.email, u.year_graduated, u.strand"
+
+# Fuzzy batchmate lookup: share of the query's trigrams a name must have
+# to become a candidate, candidates reranked per query, and the lowest
+# edit-distance similarity returned
+FUZZY_MIN_TRIGRAM_SHARE = 0.3
+FUZZY_CANDIDATE_LIMIT = 50
+FUZZY_MIN_SIMILARITY = 0.6
+
+# Index rows a fuzzy lookup may read; the query's rarest trigrams are
+# used until this is reached, so common ones ("an ", " ma") are skipped
+FUZZY_POSTING_BUDGET = 20000
+
+# Rows written per batch when rebuilding the trigram index
+TRIGRAM_BACKFILL_BATCH = 1000
+
+# Seconds facet counts are reused; registrations through this connector
+# clear them at once, the timeout covers other clients of a shared MySQL
+FACET_CACHE_TTL = 300
+
+# Profile columns a user may change, and the columns returned as a profile
+PROFILE_FIELDS = ("email", "name", "year_graduated", "strand")
+PROFILE_COLUMNS = "u.id, u.email, u.name, u.year_graduated, u.strand, u.created_at, l.address"
+
+# Nearby alumni returned by default
+DEFAULT_NEARBY_LIMIT = 20
+
+# Bytes of key material in a newly created app secret
+APP_SECRET_SIZE = 32
+
+# Answers accepted for an event RSVP
+RSVP_STATUSES = ("attending", "not_attending")
+
 class DatabaseConnector:
     """Utility class to handle database operations for the Alumni Tracer app"""
     
@@ -22,6 +80,20 @@ class DatabaseConnector:
         self.max_retries = max_retries
         self.db_type = 'mysql'  # Default to MySQL
         
+        # Set once the alumni full-text index is available
+        self.fulltext_search = False
+        
+        # Cached (year_graduated, strand) -> user count, with the time it was read
+        self._facet_lock = threading.Lock()
+        self._facet_counts = None
+        self._facet_counts_time = 0
+        
+        # Callbacks notified with each newly recorded donation
+        self.donation_listeners = []
+        
+        # Per-email and per-client login attempt budgets
+        self.login_limiter = get_login_limiter()
+        
         # Initialize connection and create tables if needed
         try:
             self._initialize_database()
@@ -81,6 +153,107 @@ class DatabaseConnector:
                 )
             ''')
             
+            # Create donations ledger table if not exists
+            print("Creating donations table if it doesn't exist...")
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS donations (
+                    id INT AUTO_INCREMENT PRIMARY KEY,
+                    reference VARCHAR(32) NOT NULL UNIQUE,
+                    user_id INT,
+                    donor_name VARCHAR(255),
+                    donor_email VARCHAR(255),
+                    campaign VARCHAR(255) NOT NULL,
+                    amount DECIMAL(12, 2) NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    INDEX idx_donations_user (user_id),
+                    INDEX idx_donations_created (created_at)
+                )
+            ''')
+            
+            # Create event RSVPs table if not exists (one answer per user and event)
+            print("Creating event_rsvps table if it doesn't exist...")
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS event_rsvps (
+                    id INT AUTO_INCREMENT PRIMARY KEY,
+                    user_id INT NOT NULL,
+                    event_title VARCHAR(255) NOT NULL,
+                    event_date DATE NOT NULL,
+                    status VARCHAR(20) NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE KEY uq_event_rsvps_user_event (user_id, event_date, event_title)
+                )
+            ''')
+            
+            # Attendee lookups by event
+            self._create_index_mysql(cursor, 'event_rsvps', 'idx_event_rsvps_event', 'event_date, event_title')
+            
+            # Create event check-ins table if not exists (one check-in per user and event)
+            print("Creating event_checkins table if it doesn't exist...")
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS event_checkins (
+                    id INT AUTO_INCREMENT PRIMARY KEY,
+                    user_id INT NOT NULL,
+                    event_title VARCHAR(255) NOT NULL,
+                    event_date DATE NOT NULL,
+                    checked_in_at TIMESTAMP NOT NULL,
+                    UNIQUE KEY uq_event_checkins_event_user (event_date, event_title, user_id)
+                )
+            ''')
+            
+            # Create opt-in alumni locations table if not exists (city-level, by grid cell)
+            print("Creating alumni_locations table if it doesn't exist...")
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS alumni_locations (
+                    user_id INT PRIMARY KEY,
+                    address VARCHAR(255) NOT NULL,
+                    place VARCHAR(255) NOT NULL,
+                    latitude DOUBLE NOT NULL,
+                    longitude DOUBLE NOT NULL,
+                    geo_cell VARCHAR(16) NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                    INDEX idx_alumni_locations_cell (geo_cell)
+                )
+            ''')
+            
+            # Create app secrets table if not exists (signing keys shared by every client)
+            print("Creating app_secrets table if it doesn't exist...")
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS app_secrets (
+                    name VARCHAR(64) PRIMARY KEY,
+                    value VARCHAR(255) NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Full-text index used by alumni search
+            self._create_alumni_search_index_mysql(cursor)
+            
+            # Composite indexes used by faceted browse (batch first, and strand first)
+            self._create_index_mysql(cursor, 'users', 'idx_users_year_strand', 'year_graduated, strand')
+            self._create_index_mysql(cursor, 'users', 'idx_users_strand_year', 'strand, year_graduated')
+            
+            # Sort order of the directory listing, unfiltered and within one batch and strand
+            self._create_index_mysql(cursor, 'users', 'idx_users_name_id', 'name, id')
+            self._create_index_mysql(cursor, 'users', 'idx_users_year_strand_name', 'year_graduated, strand, name, id')
+            
+            # Trigram index used by fuzzy batchmate lookup
+            print("Creating name_trigrams table if it doesn't exist...")
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS name_trigrams (
+                    trigram VARCHAR(3) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL,
+                    user_id INT NOT NULL,
+                    PRIMARY KEY (trigram, user_id),
+                    INDEX idx_name_trigrams_user (user_id)
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS name_trigram_counts (
+                    trigram VARCHAR(3) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL PRIMARY KEY,
+                    users INT NOT NULL
+                )
+            ''')
+            self._backfill_name_trigrams(cursor, "%s")
+            
             conn.commit()
             self.connected = True
             print("MySQL database initialized successfully")
@@ -135,6 +308,102 @@ class DatabaseConnector:
             )
         ''')
         
+        # Create donations ledger table if it doesn't exist
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS donations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                reference TEXT NOT NULL UNIQUE,
+                user_id INTEGER,
+                donor_name TEXT,
+                donor_email TEXT,
+                campaign TEXT NOT NULL,
+                amount REAL NOT NULL,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_donations_user ON donations (user_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_donations_created ON donations (created_at)")
+        
+        # Create event RSVPs table if it doesn't exist (one answer per user and event)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS event_rsvps (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                event_title TEXT NOT NULL,
+                event_date TEXT NOT NULL,
+                status TEXT NOT NULL,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE (user_id, event_date, event_title)
+            )
+        ''')
+        
+        # Attendee lookups by event
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_event_rsvps_event ON event_rsvps (event_date, event_title)")
+        
+        # Create event check-ins table if it doesn't exist (one check-in per user and event)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS event_checkins (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                event_title TEXT NOT NULL,
+                event_date TEXT NOT NULL,
+                checked_in_at TEXT NOT NULL,
+                UNIQUE (event_date, event_title, user_id)
+            )
+        ''')
+        
+        # Create opt-in alumni locations table if it doesn't exist (city-level, by grid cell)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS alumni_locations (
+                user_id INTEGER PRIMARY KEY,
+                address TEXT NOT NULL,
+                place TEXT NOT NULL,
+                latitude REAL NOT NULL,
+                longitude REAL NOT NULL,
+                geo_cell TEXT NOT NULL,
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_alumni_locations_cell ON alumni_locations (geo_cell)")
+        
+        # Create app secrets table if it doesn't exist (signing keys shared by every client)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS app_secrets (
+                name TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Full-text index used by alumni search
+        self._create_alumni_search_index_sqlite(cursor)
+        
+        # Composite indexes used by faceted browse (batch first, and strand first)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_year_strand ON users (year_graduated, strand)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_strand_year ON users (strand, year_graduated)")
+        
+        # Sort order of the directory listing, unfiltered and within one batch and
+        # strand (the rowid id is part of every index)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_name ON users (name)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_year_strand_name ON users (year_graduated, strand, name)")
+        
+        # Trigram index used by fuzzy batchmate lookup
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS name_trigrams (
+                trigram TEXT NOT NULL,
+                user_id INTEGER NOT NULL,
+                PRIMARY KEY (trigram, user_id)
+            ) WITHOUT ROWID
+        ''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_name_trigrams_user ON name_trigrams (user_id)")
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS name_trigram_counts (
+                trigram TEXT NOT NULL PRIMARY KEY,
+                users INTEGER NOT NULL
+            ) WITHOUT ROWID
+        ''')
+        self._backfill_name_trigrams(cursor, "?")
+        
         conn.commit()
         cursor.close()
         conn.close()
@@ -146,9 +415,14 @@ class DatabaseConnector:
             return False, "Database not connected. User information will not be saved."
             
         if self.db_type == 'mysql':
-            return self._register_user_mysql(email, password, name, year_graduated, strand)
+            result = self._register_user_mysql(email, password, name, year_graduated, strand)
         else:
-            return self._register_user_sqlite(email, password, name, year_graduated, strand)
+            result = self._register_user_sqlite(email, password, name, year_graduated, strand)
+        
+        # A new user changes the batch and strand counts
+        if result[0]:
+            self.invalidate_facet_cache()
+        return result
     
     def _register_user_mysql(self, email, password, name, year_graduated=None, strand=None):
         """Register a new user in MySQL database"""
@@ -170,6 +444,9 @@ class DatabaseConnector:
                 VALUES (%s, %s, %s, %s, %s)
             """
             cursor.execute(query, (email, password, name, year_graduated, strand))
+            
+            # Index the name for fuzzy lookup in the same transaction
+            self._index_name_trigrams(cursor, cursor.lastrowid, name, "%s")
             conn.commit()
             
             return True, "Registration successful"
@@ -207,6 +484,9 @@ class DatabaseConnector:
                 VALUES (?, ?, ?, ?, ?)
             """
             cursor.execute(query, (email, password, name, year_graduated, strand))
+            
+            # Index the name for fuzzy lookup in the same transaction
+            self._index_name_trigrams(cursor, cursor.lastrowid, name, "?")
             conn.commit()
             
             return True, "Registration successful (saved locally)"
@@ -219,8 +499,18 @@ class DatabaseConnector:
             if conn:
                 conn.close()
     
-    def authenticate_user(self, email, password):
-        """Authenticate a user with email and password"""
+    def authenticate_user(self, email, password, client=None):
+        """Authenticate a user with email and password
+        
+        Attempts are rate limited per email and per client (any string
+        identifying the device or address, if the caller knows it);
+        refused attempts return without touching the database.
+        """
+        # Shed repeated attempts before they reach the database
+        allowed, retry_after = self.login_limiter.check(email, client)
+        if not allowed:
+            return False, f"Too many login attempts. Try again in {retry_after} seconds.", None
+        
         if not self.connected:
             # For demo purposes, allow a hardcoded test account when DB is not available
             if email == "test@example.com" and password == "password":
@@ -231,13 +521,19 @@ class DatabaseConnector:
                     "year_graduated": "2023",
                     "strand": "STEM"
                 }
+                self.login_limiter.succeeded(email)
                 return True, "Test account authenticated (offline mode)", user
             return False, "Database not connected. Cannot authenticate.", None
             
         if self.db_type == 'mysql':
-            return self._authenticate_user_mysql(email, password)
+            result = self._authenticate_user_mysql(email, password)
         else:
-            return self._authenticate_user_sqlite(email, password)
+            result = self._authenticate_user_sqlite(email, password)
+        
+        # A successful login clears the email's failed attempts
+        if result[0]:
+            self.login_limiter.succeeded(email)
+        return result
     
     def _authenticate_user_mysql(self, email, password):
         """Authenticate a user against MySQL database"""
@@ -301,5 +597,1280 @@ class DatabaseConnector:
             if conn:
                 conn.close()
 
+    def get_user_profile(self, user_id):
+        """Return the profile of one user (everything but the password)"""
+        if not self.connected:
+            return False, "Database not connected. Cannot load profile.", None
+        
+        placeholder = "%s" if self.db_type == 'mysql' else "?"
+        ok, message, rows = self._select_dicts(f"""
+            SELECT {PROFILE_COLUMNS} FROM users u
+            LEFT JOIN alumni_locations l ON l.user_id = u.id
+            WHERE u.id = {placeholder}
+        """, (user_id,))
+        if not ok:
+            return ok, message, None
+        if not rows:
+            return False, "User not found", None
+        return True, "Profile loaded", rows[0]
+    
+    def update_user_profile(self, user_id, **changes):
+        """Change a user's email, name, batch or strand
+        
+        Only the PROFILE_FIELDS given are written. Returns (success,
+        message, profile) with the profile as stored after the update.
+        A new name is re-indexed for fuzzy lookup in the same
+        transaction, and a new batch or strand clears the facet counts.
+        """
+        if not self.connected:
+            return False, "Database not connected. Profile will not be saved.", None
+        
+        unknown = set(changes) - set(PROFILE_FIELDS)
+        if unknown:
+            return False, f"Cannot update {', '.join(sorted(unknown))}", None
+        if 'name' in changes and not (changes['name'] or "").strip():
+            return False, "Name cannot be empty", None
+        if 'email' in changes and not (changes['email'] or "").strip():
+            return False, "Email cannot be empty", None
+        
+        placeholder = "%s" if self.db_type == 'mysql' else "?"
+        conn = None
+        cursor = None
+        try:
+            if self.db_type == 'mysql':
+                conn = mysql.connector.connect(**self.config)
+            else:
+                conn = sqlite3.connect(str(self.sqlite_db_path))
+            cursor = conn.cursor()
+            
+            cursor.execute(
+                f"SELECT name, year_graduated, strand FROM users WHERE id = {placeholder}", (user_id,)
+            )
+            current = cursor.fetchone()
+            if not current:
+                return False, "User not found", None
+            
+            # Check if the new email belongs to someone else
+            if 'email' in changes:
+                cursor.execute(
+                    f"SELECT id FROM users WHERE email = {placeholder} AND id <> {placeholder}",
+                    (changes['email'], user_id)
+                )
+                if cursor.fetchone():
+                    return False, "Email already registered", None
+            
+            if changes:
+                columns = [field for field in PROFILE_FIELDS if field in changes]
+                assignments = ", ".join(f"{column} = {placeholder}" for column in columns)
+                cursor.execute(
+                    f"UPDATE users SET {assignments} WHERE id = {placeholder}",
+                    [changes[column] for column in columns] + [user_id]
+                )
+            
+            # Re-index a changed name for fuzzy lookup
+            if 'name' in changes and changes['name'] != current[0]:
+                self._unindex_name_trigrams(cursor, user_id, placeholder)
+                self._index_name_trigrams(cursor, user_id, changes['name'], placeholder)
+            conn.commit()
+            
+        except (Error, sqlite3.Error) as e:
+            print(f"Error updating profile: {e}")
+            return False, f"Profile update failed: {str(e)}", None
+            
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except:
+                    pass
+            if conn:
+                try:
+                    conn.close()
+                except:
+                    pass
+        
+        # A new batch or strand changes the facet counts
+        if changes.get('year_graduated', current[1]) != current[1] or changes.get('strand', current[2]) != current[2]:
+            self.invalidate_facet_cache()
+        
+        ok, message, profile = self.get_user_profile(user_id)
+        return ok, "Profile updated" if ok else message, profile
+    
+    def set_user_location(self, user_id, address):
+        """Opt a user in to nearby search at the place their address is in
+        
+        The address is geocoded against the local gazetteer, and only
+        the city's coordinates are stored, never the street. Returns
+        (success, message, location).
+        """
+        if not self.connected:
+            return False, "Database not connected. Location will not be saved.", None
+        
+        place = get_gazetteer().geocode(address)
+        if place is None:
+            return False, "Could not find the city or municipality in this address", None
+        location = dict(place, address=address.strip(),
+                        geo_cell=grid_cell(place["latitude"], place["longitude"]))
+        
+        if self.db_type == 'mysql':
+            query = """
+                INSERT INTO alumni_locations (user_id, address, place, latitude, longitude, geo_cell)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE address = VALUES(address), place = VALUES(place),
+                    latitude = VALUES(latitude), longitude = VALUES(longitude), geo_cell = VALUES(geo_cell)
+            """
+        else:
+            query = """
+                INSERT INTO alumni_locations (user_id, address, place, latitude, longitude, geo_cell)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (user_id) DO UPDATE SET address = excluded.address, place = excluded.place,
+                    latitude = excluded.latitude, longitude = excluded.longitude,
+                    geo_cell = excluded.geo_cell, updated_at = CURRENT_TIMESTAMP
+            """
+        params = (user_id, location["address"], f"{place['place']}, {place['province']}",
+                  place["latitude"], place["longitude"], location["geo_cell"])
+        
+        ok, message = self._execute_write(query, params, "saving location")
+        return ok, "Location saved" if ok else message, location if ok else None
+    
+    def clear_user_location(self, user_id):
+        """Opt a user out of nearby search"""
+        if not self.connected:
+            return False, "Database not connected. Location will not be removed."
+        
+        placeholder = "%s" if self.db_type == 'mysql' else "?"
+        ok, message = self._execute_write(
+            f"DELETE FROM alumni_locations WHERE user_id = {placeholder}", (user_id,), "removing location"
+        )
+        return ok, "Location removed" if ok else message
+    
+    def find_nearby_alumni(self, user_id, radius_km=NEARBY_RADIUS_KM, limit=DEFAULT_NEARBY_LIMIT, same_batch=True):
+        """Alumni who opted in to a location within radius_km of a user's
+        
+        Only the grid cells around the user's place are read, through
+        the geo_cell index, and the exact distance is checked on those
+        rows; the rest of the table is never touched. With same_batch,
+        only the user's batchmates are returned. Returns (success,
+        message, results) with "place" and "distance_km" on each
+        result, nearest first.
+        """
+        if not self.connected:
+            return False, "Database not connected. Cannot search nearby alumni.", None
+        
+        radius_km = min(radius_km, MAX_NEARBY_RADIUS_KM)
+        placeholder = "%s" if self.db_type == 'mysql' else "?"
+        ok, message, rows = self._select_dicts(f"""
+            SELECT u.year_graduated, l.latitude, l.longitude
+            FROM users u JOIN alumni_locations l ON l.user_id = u.id
+            WHERE u.id = {placeholder}
+        """, (user_id,))
+        if not ok:
+            return ok, message, None
+        if not rows:
+            return False, "Add your address to see alumni near you", None
+        origin = rows[0]
+        
+        cells = neighborhood_cells(origin["latitude"], origin["longitude"], radius_km)
+        query = f"""
+            SELECT {ALUMNI_SEARCH_COLUMNS}, l.place, l.latitude, l.longitude
+            FROM alumni_locations l
+            JOIN users u ON u.id = l.user_id
+            WHERE l.geo_cell IN ({", ".join([placeholder] * len(cells))}) AND u.id <> {placeholder}
+        """
+        params = cells + [user_id]
+        if same_batch:
+            if not origin["year_graduated"]:
+                return True, "0 alumni found", []
+            query += f" AND u.year_graduated = {placeholder}"
+            params.append(origin["year_graduated"])
+        
+        ok, message, rows = self._select_dicts(query, params)
+        if not ok:
+            return ok, message, None
+        
+        # Exact distance for the rows in the neighborhood's cells
+        results = []
+        for row in rows:
+            distance = distance_km(origin["latitude"], origin["longitude"], row.pop("latitude"), row.pop("longitude"))
+            if distance <= radius_km:
+                row["distance_km"] = round(distance, 1)
+                results.append(row)
+        results.sort(key=lambda user: (user["distance_km"], user["name"], user["id"]))
+        results = results[:limit]
+        return True, f"{len(results)} alumni found", results
+    
+    def get_app_secret(self, name):
+        """Return a named signing key as bytes, creating it on first use
+        
+        The first client to ask stores a random key; every client of the
+        same database gets that key afterwards. Returns None when the
+        database is not connected.
+        """
+        if not self.connected:
+            print("Database not connected. No app secret available.")
+            return None
+        
+        placeholder = "%s" if self.db_type == 'mysql' else "?"
+        insert = "INSERT IGNORE" if self.db_type == 'mysql' else "INSERT OR IGNORE"
+        
+        # Losing a race to create the key just means the other client's key is used
+        ok, message = self._execute_write(
+            f"{insert} INTO app_secrets (name, value) VALUES ({placeholder}, {placeholder})",
+            (name, secrets.token_hex(APP_SECRET_SIZE)), "creating app secret"
+        )
+        if not ok:
+            return None
+        ok, message, rows = self._select_dicts(
+            f"SELECT value FROM app_secrets WHERE name = {placeholder}", (name,)
+        )
+        if not ok or not rows:
+            return None
+        return bytes.fromhex(rows[0]["value"])
+    
+    def record_rsvp(self, user_id, event_title, event_date, status="attending"):
+        """Save a user's answer for an event, replacing any earlier answer
+        
+        event_date is a 'YYYY-MM-DD' string; status is one of RSVP_STATUSES.
+        """
+        if not self.connected:
+            return False, "Database not connected. RSVP will not be saved."
+        if status not in RSVP_STATUSES:
+            return False, f"Unknown RSVP status: {status}"
+        
+        if self.db_type == 'mysql':
+            query = """
+                INSERT INTO event_rsvps (user_id, event_title, event_date, status)
+                VALUES (%s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE status = VALUES(status)
+            """
+        else:
+            query = """
+                INSERT INTO event_rsvps (user_id, event_title, event_date, status)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (user_id, event_date, event_title) DO UPDATE SET status = excluded.status
+            """
+        
+        ok, message = self._execute_write(query, (user_id, event_title, event_date, status), "saving RSVP")
+        return ok, "RSVP saved" if ok else message
+    
+    def get_user_rsvps(self, user_id):
+        """Return a user's event RSVPs ordered by event date"""
+        if not self.connected:
+            return False, "Database not connected. Cannot load RSVPs.", None
+        
+        # Answered from the (user_id, event_date, event_title) unique index
+        placeholder = "%s" if self.db_type == 'mysql' else "?"
+        ok, message, rows = self._select_dicts(f"""
+            SELECT id, event_title, event_date, status, created_at
+            FROM event_rsvps WHERE user_id = {placeholder}
+            ORDER BY event_date, event_title
+        """, (user_id,))
+        if not ok:
+            return ok, message, None
+        for row in rows:
+            row['event_date'] = str(row['event_date'])
+        return True, f"{len(rows)} RSVPs loaded", rows
+    
+    def get_user_donations(self, user_id):
+        """Return a user's donations, newest first"""
+        if not self.connected:
+            return False, "Database not connected. Cannot load donations.", None
+        
+        placeholder = "%s" if self.db_type == 'mysql' else "?"
+        ok, message, rows = self._select_dicts(f"""
+            SELECT id, reference, campaign, amount, created_at
+            FROM donations WHERE user_id = {placeholder}
+            ORDER BY created_at DESC, id DESC
+        """, (user_id,))
+        if not ok:
+            return ok, message, None
+        for row in rows:
+            row['amount'] = float(row['amount'])
+        return True, f"{len(rows)} donations loaded", rows
+    
+    def get_event_attendees(self, event_title, event_date):
+        """Who may check in to an event, and who already has
+        
+        Returns (success, message, {"attendees", "checked_in"}), where
+        attendees are the users who RSVPed attending (id, name,
+        year_graduated) and checked_in the ids of users checked in so far.
+        """
+        if not self.connected:
+            return False, "Database not connected. Cannot load attendees.", None
+        
+        # Both lookups are answered from the (event_date, event_title, ...) indexes
+        placeholder = "%s" if self.db_type == 'mysql' else "?"
+        ok, message, attendees = self._select_dicts(f"""
+            SELECT u.id, u.name, u.year_graduated
+            FROM event_rsvps r JOIN users u ON u.id = r.user_id
+            WHERE r.event_date = {placeholder} AND r.event_title = {placeholder} AND r.status = 'attending'
+        """, (event_date, event_title))
+        if not ok:
+            return ok, message, None
+        ok, message, checked_in = self._select_dicts(f"""
+            SELECT user_id FROM event_checkins
+            WHERE event_date = {placeholder} AND event_title = {placeholder}
+        """, (event_date, event_title))
+        if not ok:
+            return ok, message, None
+        
+        state = {"attendees": attendees, "checked_in": [row["user_id"] for row in checked_in]}
+        return True, f"{len(attendees)} attendees loaded", state
+    
+    def record_checkins(self, checkins):
+        """Write a batch of (user_id, event_title, event_date, checked_in_at) check-ins
+        
+        All rows go in one statement and one commit. Check-ins already
+        recorded are skipped, so a batch can safely be sent again.
+        """
+        if not self.connected:
+            return False, "Database not connected. Check-ins will not be saved."
+        if not checkins:
+            return True, "No check-ins to record"
+        
+        if self.db_type == 'mysql':
+            query = """
+                INSERT IGNORE INTO event_checkins (user_id, event_title, event_date, checked_in_at)
+                VALUES (%s, %s, %s, %s)
+            """
+        else:
+            query = """
+                INSERT OR IGNORE INTO event_checkins (user_id, event_title, event_date, checked_in_at)
+                VALUES (?, ?, ?, ?)
+            """
+        ok, message = self._execute_write(query, checkins, "recording check-ins", many=True)
+        return ok, f"{len(checkins)} check-ins recorded" if ok else message
+    
+    def _execute_write(self, query, params, action, many=False):
+        """Run one write statement (or one per row with many) and commit; return (success, message)"""
+        conn = None
+        cursor = None
+        try:
+            if self.db_type == 'mysql':
+                conn = mysql.connector.connect(**self.config)
+            else:
+                conn = sqlite3.connect(str(self.sqlite_db_path))
+            cursor = conn.cursor()
+            if many:
+                cursor.executemany(query, params)
+            else:
+                cursor.execute(query, params)
+            conn.commit()
+            return True, "Saved"
+            
+        except (Error, sqlite3.Error) as e:
+            print(f"Error {action}: {e}")
+            return False, f"Failed {action}: {str(e)}"
+            
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except:
+                    pass
+            if conn:
+                try:
+                    conn.close()
+                except:
+                    pass
+    
+    def _select_dicts(self, query, params):
+        """Run a read query and return (success, message, rows as dicts)"""
+        conn = None
+        cursor = None
+        try:
+            if self.db_type == 'mysql':
+                conn = mysql.connector.connect(**self.config)
+                cursor = conn.cursor(dictionary=True)
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+            else:
+                conn = sqlite3.connect(str(self.sqlite_db_path))
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                rows = [dict(row) for row in cursor.fetchall()]
+            return True, "Query successful", rows
+            
+        except (Error, sqlite3.Error) as e:
+            print(f"Error reading from database: {e}")
+            return False, f"Query failed: {str(e)}", None
+            
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except:
+                    pass
+            if conn:
+                try:
+                    conn.close()
+                except:
+                    pass
+    
+    def _create_index_mysql(self, cursor, table, index_name, columns):
+        """Create an index unless it exists (MySQL has no CREATE INDEX IF NOT EXISTS)"""
+        cursor.execute("""
+            SELECT COUNT(*) FROM information_schema.statistics
+            WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s
+        """, (table, index_name))
+        if not cursor.fetchone()[0]:
+            print(f"Creating index {index_name}...")
+            cursor.execute(f"CREATE INDEX {index_name} ON {table} ({columns})")
+    
+    def _create_alumni_search_index_mysql(self, cursor):
+        """Add the FULLTEXT index over the searchable user columns"""
+        # InnoDB keeps FULLTEXT indexes in sync with the table by itself
+        cursor.execute("""
+            SELECT COUNT(*) FROM information_schema.statistics
+            WHERE table_schema = DATABASE() AND table_name = 'users'
+              AND index_name = 'ft_users_search'
+        """)
+        if not cursor.fetchone()[0]:
+            print("Creating alumni search index...")
+            cursor.execute(
+                "ALTER TABLE users ADD FULLTEXT INDEX ft_users_search (name, email, year_graduated, strand)"
+            )
+        self.fulltext_search = True
+    
+    def _create_alumni_search_index_sqlite(self, cursor):
+        """Create the FTS5 index over users and the triggers that maintain it"""
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users_fts'")
+        exists = cursor.fetchone() is not None
+        
+        try:
+            # External-content table: the text lives in users, only the index is stored
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5(
+                    name, email, year_graduated, strand,
+                    content='users', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2',
+                    prefix='2 3'
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            # SQLite built without FTS5; search falls back to LIKE
+            print(f"Full-text search unavailable, using simple search: {e}")
+            return
+        
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS users_fts_insert AFTER INSERT ON users BEGIN
+                INSERT INTO users_fts (rowid, name, email, year_graduated, strand)
+                VALUES (new.id, new.name, new.email, new.year_graduated, new.strand);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS users_fts_delete AFTER DELETE ON users BEGIN
+                INSERT INTO users_fts (users_fts, rowid, name, email, year_graduated, strand)
+                VALUES ('delete', old.id, old.name, old.email, old.year_graduated, old.strand);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS users_fts_update AFTER UPDATE ON users BEGIN
+                INSERT INTO users_fts (users_fts, rowid, name, email, year_graduated, strand)
+                VALUES ('delete', old.id, old.name, old.email, old.year_graduated, old.strand);
+                INSERT INTO users_fts (rowid, name, email, year_graduated, strand)
+                VALUES (new.id, new.name, new.email, new.year_graduated, new.strand);
+            END
+        ''')
+        
+        # Index users registered before the search table existed
+        if not exists:
+            cursor.execute("INSERT INTO users_fts (users_fts) VALUES ('rebuild')")
+        self.fulltext_search = True
+    
+    def search_alumni(self, query, page=1, page_size=DEFAULT_SEARCH_PAGE_SIZE, year_graduated=None, strand=None):
+        """Search alumni by name, email, batch or strand
+        
+        Every word of the query must match the start of a word in one of
+        the searched columns. Results are ranked best match first (name
+        matches weigh most) and returned one page at a time as
+        (success, message, {"results", "page", "page_size", "has_more"}).
+        An empty query lists alumni by name. year_graduated and strand
+        narrow the results to one batch or strand.
+        """
+        if not self.connected:
+            return False, "Database not connected. Cannot search alumni.", None
+        
+        page = max(1, int(page))
+        page_size = max(1, min(int(page_size), MAX_SEARCH_PAGE_SIZE))
+        terms = re.findall(r"\w+", (query or "").lower())
+        
+        if self.db_type == 'mysql':
+            ok, message, rows = self._search_alumni_mysql(terms, page, page_size, year_graduated, strand)
+        else:
+            ok, message, rows = self._search_alumni_sqlite(terms, page, page_size, year_graduated, strand)
+        if not ok:
+            return ok, message, None
+        
+        # One extra row is fetched to tell whether another page exists
+        result = {
+            "results": rows[:page_size],
+            "page": page,
+            "page_size": page_size,
+            "has_more": len(rows) > page_size
+        }
+        return True, f"{len(result['results'])} alumni found", result
+    
+    def _alumni_search_filters(self, year_graduated, strand, placeholder):
+        """WHERE conditions and parameters for the batch and strand filters"""
+        conditions = []
+        params = []
+        if year_graduated:
+            conditions.append(f"u.year_graduated = {placeholder}")
+            params.append(str(year_graduated))
+        if strand:
+            conditions.append(f"u.strand = {placeholder}")
+            params.append(strand)
+        return conditions, params
+    
+    def _search_alumni_mysql(self, terms, page, page_size, year_graduated, strand):
+        """Ranked alumni search using the MySQL FULLTEXT index"""
+        conn = None
+        cursor = None
+        
+        try:
+            conn = mysql.connector.connect(**self.config)
+            cursor = conn.cursor(dictionary=True)
+            
+            conditions, params = self._alumni_search_filters(year_graduated, strand, "%s")
+            fulltext_terms = [term for term in terms if len(term) >= MYSQL_FT_MIN_TOKEN_SIZE]
+            short_terms = [term for term in terms if len(term) < MYSQL_FT_MIN_TOKEN_SIZE]
+            
+            # Short words are below the FULLTEXT token size; match them as name prefixes
+            for term in short_terms:
+                conditions.insert(0, "(u.name LIKE %s OR u.name LIKE %s)")
+                params[0:0] = [f"{term}%", f"% {term}%"]
+            
+            if fulltext_terms:
+                # Boolean mode: every word required, each as a prefix
+                match = "MATCH (u.name, u.email, u.year_graduated, u.strand) AGAINST (%s IN BOOLEAN MODE)"
+                against = " ".join(f"+{term}*" for term in fulltext_terms)
+                query = f"SELECT {ALUMNI_SEARCH_COLUMNS}, {match} AS score FROM users u"
+                conditions.insert(0, match)
+                params = [against, against] + params
+                order = "score DESC, u.name, u.id"
+            else:
+                query = f"SELECT {ALUMNI_SEARCH_COLUMNS} FROM users u"
+                order = "u.name, u.id"
+            
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            query += f" ORDER BY {order} LIMIT %s OFFSET %s"
+            params += [page_size + 1, (page - 1) * page_size]
+            
+            cursor.execute(query, params)
+            return True, "Search successful", cursor.fetchall()
+            
+        except Error as e:
+            print(f"Error searching alumni: {e}")
+            return False, f"Search failed: {str(e)}", None
+            
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except:
+                    pass
+            if conn:
+                try:
+                    conn.close()
+                except:
+                    pass
+    
+    def _search_alumni_sqlite(self, terms, page, page_size, year_graduated, strand):
+        """Ranked alumni search using the SQLite FTS5 index"""
+        conn = None
+        try:
+            conn = sqlite3.connect(str(self.sqlite_db_path))
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            
+            conditions, params = self._alumni_search_filters(year_graduated, strand, "?")
+            
+            if terms and self.fulltext_search:
+                # Each word quoted (no FTS syntax from user input) and matched as a prefix;
+                # bm25 weights: name, email, year_graduated, strand
+                query = f"""
+                    SELECT {ALUMNI_SEARCH_COLUMNS}, bm25(users_fts, 10.0, 2.0, 1.0, 1.0) AS score
+                    FROM users_fts
+                    JOIN users u ON u.id = users_fts.rowid
+                """
+                conditions.insert(0, "users_fts MATCH ?")
+                params.insert(0, " ".join(f'"{term}"*' for term in terms))
+                order = "score, u.name, u.id"
+            else:
+                query = f"SELECT {ALUMNI_SEARCH_COLUMNS} FROM users u"
+                for term in terms:
+                    conditions.append("(u.name LIKE ? OR u.email LIKE ? OR u.year_graduated LIKE ? OR u.strand LIKE ?)")
+                    params += [f"%{term}%"] * 4
+                order = "u.name, u.id"
+            
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            query += f" ORDER BY {order} LIMIT ? OFFSET ?"
+            params += [page_size + 1, (page - 1) * page_size]
+            
+            cursor.execute(query, params)
+            return True, "Search successful", [dict(row) for row in cursor.fetchall()]
+            
+        except sqlite3.Error as e:
+            print(f"Error searching alumni in SQLite: {e}")
+            return False, f"Search failed: {str(e)}", None
+            
+        finally:
+            if conn:
+                conn.close()
+
+    def list_alumni(self, after=None, before=None, limit=DEFAULT_LIST_PAGE_SIZE, year_graduated=None, strand=None):
+        """One page of the alumni directory in (name, id) order
+        
+        Pages are found by seeking in the (name, id) index rather than
+        with OFFSET, so every page costs the same however deep it is.
+        Pass the (name, id) of the last row seen as after for the next
+        page, or of the first row seen as before for the previous one.
+        Returns (success, message, {"results", "has_more"}); has_more
+        tells whether rows exist beyond the page in the direction read.
+        """
+        if not self.connected:
+            return False, "Database not connected. Cannot list alumni.", None
+        
+        limit = max(1, min(int(limit), MAX_SEARCH_PAGE_SIZE))
+        placeholder = "%s" if self.db_type == 'mysql' else "?"
+        conditions, params = self._alumni_search_filters(year_graduated, strand, placeholder)
+        
+        # (name, id) > (after) spelled with a leading name bound, so both
+        # databases start a range scan at the cursor instead of the start
+        if after:
+            conditions.append(f"u.name >= {placeholder} AND (u.name > {placeholder} OR u.id > {placeholder})")
+            params += [after[0], after[0], after[1]]
+            order = "u.name, u.id"
+        elif before:
+            conditions.append(f"u.name <= {placeholder} AND (u.name < {placeholder} OR u.id < {placeholder})")
+            params += [before[0], before[0], before[1]]
+            order = "u.name DESC, u.id DESC"
+        else:
+            order = "u.name, u.id"
+        
+        query = f"SELECT {ALUMNI_SEARCH_COLUMNS} FROM users u"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY {order} LIMIT {placeholder}"
+        params.append(limit + 1)
+        
+        conn = None
+        cursor = None
+        try:
+            if self.db_type == 'mysql':
+                conn = mysql.connector.connect(**self.config)
+                cursor = conn.cursor(dictionary=True)
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+            else:
+                conn = sqlite3.connect(str(self.sqlite_db_path))
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                rows = [dict(row) for row in cursor.fetchall()]
+            
+        except (Error, sqlite3.Error) as e:
+            print(f"Error listing alumni: {e}")
+            return False, f"Listing failed: {str(e)}", None
+            
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except:
+                    pass
+            if conn:
+                try:
+                    conn.close()
+                except:
+                    pass
+        
+        # One extra row is fetched to tell whether another page exists
+        results = rows[:limit]
+        if before:
+            results.reverse()
+        return True, f"{len(results)} alumni listed", {"results": results, "has_more": len(rows) > limit}
+    
+    def get_alumni_facets(self, year_graduated=None, strand=None):
+        """Alumni counts per graduation year and per strand for a filter
+        
+        Each facet is counted with the other facet's filter applied, so
+        with strand="STEM" the years show how many STEM alumni each batch
+        has, and with year_graduated="2016" the strands show the 2016
+        batch. Returns (success, message, {"years", "strands", "total"}),
+        where years and strands are lists of (value, count): years newest
+        first, strands largest first. total matches both filters.
+        
+        All counts come from one cached table of (year, strand) pairs, so
+        changing the filter never runs a query.
+        """
+        if not self.connected:
+            return False, "Database not connected. Cannot count alumni.", None
+        
+        ok, message, pair_counts = self._facet_pair_counts()
+        if not ok:
+            return ok, message, None
+        
+        year_filter = str(year_graduated) if year_graduated else None
+        years = {}
+        strands = {}
+        total = 0
+        for (year, pair_strand), count in pair_counts.items():
+            year_match = year_filter is None or year == year_filter
+            strand_match = strand is None or pair_strand == strand
+            if strand_match and year is not None:
+                years[year] = years.get(year, 0) + count
+            if year_match and pair_strand is not None:
+                strands[pair_strand] = strands.get(pair_strand, 0) + count
+            if year_match and strand_match:
+                total += count
+        
+        facets = {
+            "years": sorted(years.items(), key=lambda item: item[0], reverse=True),
+            "strands": sorted(strands.items(), key=lambda item: (-item[1], item[0])),
+            "total": total
+        }
+        return True, f"{total} alumni", facets
+    
+    def invalidate_facet_cache(self):
+        """Forget cached facet counts so the next request recounts"""
+        with self._facet_lock:
+            self._facet_counts = None
+    
+    def _facet_pair_counts(self):
+        """Return the cached {(year_graduated, strand): count}, recounting when stale"""
+        with self._facet_lock:
+            if self._facet_counts is not None and time.monotonic() - self._facet_counts_time < FACET_CACHE_TTL:
+                return True, "Counts cached", self._facet_counts
+        
+        # One GROUP BY, answered from a composite index without reading the table
+        query = "SELECT year_graduated, strand, COUNT(*) FROM users GROUP BY year_graduated, strand"
+        conn = None
+        cursor = None
+        try:
+            if self.db_type == 'mysql':
+                conn = mysql.connector.connect(**self.config)
+            else:
+                conn = sqlite3.connect(str(self.sqlite_db_path))
+            cursor = conn.cursor()
+            cursor.execute(query)
+            counts = {(year, strand): count for year, strand, count in cursor.fetchall()}
+            
+        except (Error, sqlite3.Error) as e:
+            print(f"Error counting alumni facets: {e}")
+            return False, f"Counting failed: {str(e)}", None
+            
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except:
+                    pass
+            if conn:
+                try:
+                    conn.close()
+                except:
+                    pass
+        
+        with self._facet_lock:
+            self._facet_counts = counts
+            self._facet_counts_time = time.monotonic()
+        return True, "Counts updated", counts
+    
+    def _index_name_trigrams(self, cursor, user_id, name, placeholder):
+        """Write the trigram rows for one user's name and bump the trigram counts"""
+        trigrams = name_trigrams(name)
+        if not trigrams:
+            return
+        cursor.executemany(
+            f"INSERT INTO name_trigrams (trigram, user_id) VALUES ({placeholder}, {placeholder})",
+            [(trigram, user_id) for trigram in trigrams]
+        )
+        if placeholder == "%s":
+            upsert = "INSERT INTO name_trigram_counts (trigram, users) VALUES (%s, 1) ON DUPLICATE KEY UPDATE users = users + 1"
+        else:
+            upsert = "INSERT INTO name_trigram_counts (trigram, users) VALUES (?, 1) ON CONFLICT (trigram) DO UPDATE SET users = users + 1"
+        cursor.executemany(upsert, [(trigram,) for trigram in trigrams])
+    
+    def _unindex_name_trigrams(self, cursor, user_id, placeholder):
+        """Remove one user's trigram rows and lower the trigram counts"""
+        cursor.execute(f"SELECT trigram FROM name_trigrams WHERE user_id = {placeholder}", (user_id,))
+        trigrams = [row[0] for row in cursor.fetchall()]
+        if not trigrams:
+            return
+        cursor.execute(f"DELETE FROM name_trigrams WHERE user_id = {placeholder}", (user_id,))
+        cursor.executemany(
+            f"UPDATE name_trigram_counts SET users = users - 1 WHERE trigram = {placeholder}",
+            [(trigram,) for trigram in trigrams]
+        )
+        cursor.execute("DELETE FROM name_trigram_counts WHERE users <= 0")
+    
+    def _backfill_name_trigrams(self, cursor, placeholder, rebuild=False):
+        """Index names of users registered before the trigram table existed"""
+        if rebuild:
+            cursor.execute("DELETE FROM name_trigrams")
+        else:
+            cursor.execute("SELECT 1 FROM name_trigrams LIMIT 1")
+            if cursor.fetchone():
+                return
+        
+        cursor.execute("SELECT id, name FROM users ORDER BY id")
+        users = cursor.fetchall()
+        for start in range(0, len(users), TRIGRAM_BACKFILL_BATCH):
+            rows = [
+                (trigram, user_id)
+                for user_id, name in users[start:start + TRIGRAM_BACKFILL_BATCH]
+                for trigram in name_trigrams(name)
+            ]
+            if rows:
+                cursor.executemany(
+                    f"INSERT INTO name_trigrams (trigram, user_id) VALUES ({placeholder}, {placeholder})",
+                    rows
+                )
+        
+        # Recount from scratch rather than per user
+        cursor.execute("DELETE FROM name_trigram_counts")
+        cursor.execute(
+            "INSERT INTO name_trigram_counts (trigram, users) "
+            "SELECT trigram, COUNT(*) FROM name_trigrams GROUP BY trigram"
+        )
+        if users:
+            print(f"Indexed {len(users)} names for fuzzy search")
+    
+    def rebuild_name_trigrams(self):
+        """Re-index every user's name, e.g. after names were edited directly"""
+        if not self.connected:
+            return False, "Database not connected. Cannot rebuild the name index."
+        
+        conn = None
+        cursor = None
+        try:
+            if self.db_type == 'mysql':
+                conn = mysql.connector.connect(**self.config)
+                cursor = conn.cursor()
+                self._backfill_name_trigrams(cursor, "%s", rebuild=True)
+            else:
+                conn = sqlite3.connect(str(self.sqlite_db_path))
+                cursor = conn.cursor()
+                self._backfill_name_trigrams(cursor, "?", rebuild=True)
+            conn.commit()
+            return True, "Name index rebuilt"
+            
+        except (Error, sqlite3.Error) as e:
+            print(f"Error rebuilding name index: {e}")
+            return False, f"Rebuild failed: {str(e)}"
+            
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except:
+                    pass
+            if conn:
+                try:
+                    conn.close()
+                except:
+                    pass
+    
+    def find_batchmates(self, name, limit=10, year_graduated=None):
+        """Typo-tolerant lookup of alumni by name
+        
+        Candidates are users sharing enough name trigrams with the
+        query, found through the trigram index; they are then reranked
+        by edit-distance similarity, which ignores accents and word
+        order ("Alejandino, Ivan Ray" matches "ivan alejandno").
+        Returns (success, message, results) with a "similarity" from
+        0 to 1 on each result, best first.
+        """
+        if not self.connected:
+            return False, "Database not connected. Cannot search alumni.", None
+        
+        trigrams = sorted(name_trigrams(name))
+        if not trigrams:
+            return True, "0 alumni found", []
+        
+        if self.db_type == 'mysql':
+            ok, message, candidates = self._fuzzy_candidates_mysql(trigrams, year_graduated)
+        else:
+            ok, message, candidates = self._fuzzy_candidates_sqlite(trigrams, year_graduated)
+        if not ok:
+            return ok, message, None
+        
+        # Rerank the candidates by edit distance
+        results = []
+        for candidate in candidates:
+            candidate = dict(candidate)
+            candidate.pop('shared', None)
+            candidate['similarity'] = name_similarity(name, candidate['name'])
+            if candidate['similarity'] >= FUZZY_MIN_SIMILARITY:
+                results.append(candidate)
+        results.sort(key=lambda user: (-user['similarity'], user['name'], user['id']))
+        results = results[:limit]
+        return True, f"{len(results)} alumni found", results
+    
+    def _selective_trigrams(self, trigram_counts):
+        """Pick the rarest trigrams of a query that fit in the posting budget
+        
+        trigram_counts maps each query trigram to the number of users
+        having it. Returns the chosen trigrams and how many of them a
+        candidate must share. Trigrams no user has are left out.
+        """
+        chosen = []
+        postings = 0
+        for trigram, users in sorted(trigram_counts.items(), key=lambda item: item[1]):
+            if chosen and postings + users > FUZZY_POSTING_BUDGET:
+                break
+            chosen.append(trigram)
+            postings += users
+        return chosen, max(1, int(len(chosen) * FUZZY_MIN_TRIGRAM_SHARE))
+    
+    def _fuzzy_candidates_query(self, trigrams, min_shared, year_graduated, placeholder):
+        """Query for users sharing the most trigrams with a name, and its parameters"""
+        params = []
+        batch_join = ""
+        if year_graduated:
+            batch_join = f"JOIN users b ON b.id = t.user_id AND b.year_graduated = {placeholder}"
+            params.append(str(year_graduated))
+        params += list(trigrams) + [min_shared, FUZZY_CANDIDATE_LIMIT]
+        
+        # The primary key (trigram, user_id) makes each IN term an index range scan
+        query = f"""
+            SELECT {ALUMNI_SEARCH_COLUMNS}, c.shared
+            FROM (
+                SELECT t.user_id, COUNT(*) AS shared
+                FROM name_trigrams t
+                {batch_join}
+                WHERE t.trigram IN ({", ".join([placeholder] * len(trigrams))})
+                GROUP BY t.user_id
+                HAVING COUNT(*) >= {placeholder}
+                ORDER BY shared DESC
+                LIMIT {placeholder}
+            ) c
+            JOIN users u ON u.id = c.user_id
+        """
+        return query, params
+    
+    def _fuzzy_candidates_mysql(self, trigrams, year_graduated):
+        """Fetch fuzzy lookup candidates from MySQL"""
+        conn = None
+        cursor = None
+        
+        try:
+            conn = mysql.connector.connect(**self.config)
+            cursor = conn.cursor(dictionary=True)
+            
+            # Trigram frequencies decide which trigrams are worth reading
+            cursor.execute(
+                f"SELECT trigram, users FROM name_trigram_counts WHERE trigram IN ({', '.join(['%s'] * len(trigrams))})",
+                trigrams
+            )
+            chosen, min_shared = self._selective_trigrams({row['trigram']: row['users'] for row in cursor.fetchall()})
+            if not chosen:
+                return True, "Search successful", []
+            
+            query, params = self._fuzzy_candidates_query(chosen, min_shared, year_graduated, "%s")
+            cursor.execute(query, params)
+            return True, "Search successful", cursor.fetchall()
+            
+        except Error as e:
+            print(f"Error searching alumni: {e}")
+            return False, f"Search failed: {str(e)}", None
+            
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except:
+                    pass
+            if conn:
+                try:
+                    conn.close()
+                except:
+                    pass
+    
+    def _fuzzy_candidates_sqlite(self, trigrams, year_graduated):
+        """Fetch fuzzy lookup candidates from SQLite"""
+        conn = None
+        try:
+            conn = sqlite3.connect(str(self.sqlite_db_path))
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            
+            # Trigram frequencies decide which trigrams are worth reading
+            cursor.execute(
+                f"SELECT trigram, users FROM name_trigram_counts WHERE trigram IN ({', '.join(['?'] * len(trigrams))})",
+                trigrams
+            )
+            chosen, min_shared = self._selective_trigrams({row['trigram']: row['users'] for row in cursor.fetchall()})
+            if not chosen:
+                return True, "Search successful", []
+            
+            query, params = self._fuzzy_candidates_query(chosen, min_shared, year_graduated, "?")
+            cursor.execute(query, params)
+            return True, "Search successful", [dict(row) for row in cursor.fetchall()]
+            
+        except sqlite3.Error as e:
+            print(f"Error searching alumni in SQLite: {e}")
+            return False, f"Search failed: {str(e)}", None
+            
+        finally:
+            if conn:
+                conn.close()
+
+    def record_donation(self, campaign, amount, user_id=None, donor_name=None, donor_email=None,
+                        reference=None, created_at=None):
+        """Record a donation in the donations ledger, optionally under a reference made earlier"""
+        if not self.connected:
+            return False, "Database not connected. Donation will not be saved.", None
+        
+        # Build the ledger entry with a unique reference for the receipt
+        donation = {
+            "reference": reference or self.new_donation_reference(),
+            "user_id": user_id,
+            "donor_name": donor_name,
+            "donor_email": donor_email,
+            "campaign": campaign,
+            "amount": round(float(amount), 2),
+            "created_at": created_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        
+        if self.db_type == 'mysql':
+            result = self._record_donation_mysql(donation)
+        else:
+            result = self._record_donation_sqlite(donation)
+        
+        # Let caches built from the ledger know about the new row
+        if result[0]:
+            for listener in list(self.donation_listeners):
+                try:
+                    listener(result[2])
+                except Exception as e:
+                    print(f"Error notifying donation listener: {e}")
+        return result
+    
+    def add_donation_listener(self, callback):
+        """Call callback(donation) whenever a donation is recorded"""
+        if callback not in self.donation_listeners:
+            self.donation_listeners.append(callback)
+    
+    def remove_donation_listener(self, callback):
+        """Stop notifying callback about new donations"""
+        if callback in self.donation_listeners:
+            self.donation_listeners.remove(callback)
+    
+    def donation_fingerprint(self):
+        """Return (highest id, row count, total amount) of the ledger, or None on error
+        
+        Any insert, delete or amount change moves at least one of the three.
+        """
+        if not self.connected:
+            return None
+        
+        conn = None
+        cursor = None
+        try:
+            if self.db_type == 'mysql':
+                conn = mysql.connector.connect(**self.config)
+            else:
+                conn = sqlite3.connect(str(self.sqlite_db_path))
+            cursor = conn.cursor()
+            cursor.execute("SELECT MAX(id), COUNT(*), SUM(amount) FROM donations")
+            row = cursor.fetchone()
+            return row[0] or 0, row[1], round(float(row[2] or 0), 2)
+        except (Error, sqlite3.Error) as e:
+            print(f"Error reading donation fingerprint: {e}")
+            return None
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except:
+                    pass
+            if conn:
+                try:
+                    conn.close()
+                except:
+                    pass
+    
+    def new_donation_reference(self):
+        """Generate a unique donation reference number"""
+        return f"DON-{datetime.now():%Y%m%d}-{secrets.token_hex(4).upper()}"
+    
+    def _record_donation_mysql(self, donation):
+        """Record a donation in MySQL database"""
+        conn = None
+        cursor = None
+        
+        try:
+            conn = mysql.connector.connect(**self.config)
+            cursor = conn.cursor()
+            
+            query = """
+                INSERT INTO donations (reference, user_id, donor_name, donor_email, campaign, amount, created_at)
+                VALUES (%s, %s, %s, %s, %s, %s, %s)
+            """
+            cursor.execute(query, (
+                donation["reference"], donation["user_id"], donation["donor_name"],
+                donation["donor_email"], donation["campaign"], donation["amount"],
+                donation["created_at"]
+            ))
+            conn.commit()
+            donation["id"] = cursor.lastrowid
+            
+            return True, "Donation recorded", donation
+            
+        except Error as e:
+            print(f"Error recording donation: {e}")
+            return False, f"Recording donation failed: {str(e)}", None
+            
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except:
+                    pass
+            if conn:
+                try:
+                    conn.close()
+                except:
+                    pass
+    
+    def _record_donation_sqlite(self, donation):
+        """Record a donation in SQLite database"""
+        conn = None
+        try:
+            conn = sqlite3.connect(str(self.sqlite_db_path))
+            cursor = conn.cursor()
+            
+            query = """
+                INSERT INTO donations (reference, user_id, donor_name, donor_email, campaign, amount, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """
+            cursor.execute(query, (
+                donation["reference"], donation["user_id"], donation["donor_name"],
+                donation["donor_email"], donation["campaign"], donation["amount"],
+                donation["created_at"]
+            ))
+            conn.commit()
+            donation["id"] = cursor.lastrowid
+            
+            return True, "Donation recorded (saved locally)", donation
+            
+        except sqlite3.Error as e:
+            print(f"Error recording donation in SQLite: {e}")
+            return False, f"Recording donation failed: {str(e)}", None
+            
+        finally:
+            if conn:
+                conn.close()
+
+    # Columns produced by iter_donations, in order
+    DONATION_EXPORT_COLUMNS = (
+        "id", "reference", "created_at", "campaign", "amount",
+        "user_id", "year_graduated", "strand"
+    )
+    
+    def iter_donations(self, start=None, end=None, chunk_size=1000):
+        """Stream donations joined with donor batch and strand, one chunk at a time
+        
+        Yields lists of at most chunk_size row tuples ordered by date.
+        Rows are read through the cursor as they are consumed, so the
+        whole ledger is never held in memory. start is inclusive and
+        end exclusive ('YYYY-MM-DD HH:MM:SS' strings). A database error
+        part way through is raised, so a caller never mistakes a cut-off
+        stream for the whole ledger.
+        """
+        if not self.connected:
+            print("Database not connected. No donations to export.")
+            return
+        
+        if self.db_type == 'mysql':
+            yield from self._iter_donations_mysql(start, end, chunk_size)
+        else:
+            yield from self._iter_donations_sqlite(start, end, chunk_size)
+    
+    def _donation_export_query(self, start, end, placeholder):
+        """Build the ledger export query and its parameters"""
+        # users.id is the primary key, so each join is an indexed lookup
+        query = """
+            SELECT d.id, d.reference, d.created_at, d.campaign, d.amount,
+                   d.user_id, u.year_graduated, u.strand
+            FROM donations d
+            LEFT JOIN users u ON u.id = d.user_id
+        """
+        conditions = []
+        params = []
+        if start:
+            conditions.append(f"d.created_at >= {placeholder}")
+            params.append(start)
+        if end:
+            conditions.append(f"d.created_at < {placeholder}")
+            params.append(end)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY d.created_at, d.id"
+        return query, params
+    
+    def _iter_donations_mysql(self, start, end, chunk_size):
+        """Stream donations from MySQL with an unbuffered (server-side) cursor"""
+        conn = None
+        cursor = None
+        
+        try:
+            conn = mysql.connector.connect(**self.config)
+            # An unbuffered cursor leaves the result set on the server
+            cursor = conn.cursor(buffered=False)
+            query, params = self._donation_export_query(start, end, "%s")
+            cursor.execute(query, params)
+            
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield rows
+                
+        except Error as e:
+            print(f"Error reading donations: {e}")
+            raise
+            
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except:
+                    pass
+            if conn:
+                try:
+                    conn.close()
+                except:
+                    pass
+    
+    def _iter_donations_sqlite(self, start, end, chunk_size):
+        """Stream donations from SQLite, stepping the cursor chunk by chunk"""
+        conn = None
+        try:
+            conn = sqlite3.connect(str(self.sqlite_db_path))
+            cursor = conn.cursor()
+            query, params = self._donation_export_query(start, end, "?")
+            cursor.execute(query, params)
+            
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield rows
+                
+        except sqlite3.Error as e:
+            print(f"Error reading donations from SQLite: {e}")
+            raise
+            
+        finally:
+            if conn:
+                conn.close()
+
 # Create an instance for import
 db = DatabaseConnector()
@@ -1,4 +1,3 @@
-from turtle import Screen
 from kivy.app import App
 from kivy.uix.floatlayout import FloatLayout
 from kivy.uix.boxlayout import BoxLayout
@@ -7,28 +6,22 @@ from kivy.uix.label import Label
 from kivy.uix.button import Button
 from kivy.uix.textinput import TextInput
 from kivy.uix.scrollview import ScrollView  # Add missing import
-from kivy.core.window import Window
-from kivy.utils import platform
 from kivy.metrics import dp, sp
-from kivy.graphics import Color, Rectangle, Line, RoundedRectangle
+from kivy.graphics import Color, Rectangle, RoundedRectangle
 from kivy.clock import Clock
 from kivy.uix.widget import Widget
 from pathlib import Path
-import os
 
 # Import the new DonationWidget
 from donation_widget import DonationWidget
 
-# Device profile constants
-DEVICE_PROFILES = {
-    'small': {'width': 392, 'height': 759},  # Match the image proportions
-    'medium': {'width': 1080, 'height': 2340},  # Common smartphone size
-}
+# Shared header and navigation bar, and background image loading
+from app_chrome import HeaderBar, EmptyNavigationBar, ChromeHost, shared_chrome, chrome_height
+from image_loader import get_image_loader
+from resize_dispatcher import get_resize_dispatcher
 
-# For mobile devices, let the system set the window size
-# Only set window size for desktop/development
-if platform not in ('android', 'ios'):
-    Window.size = (DEVICE_PROFILES['small']['width'], DEVICE_PROFILES['small']['height'])
+# Import the shared campaign index for searching
+from campaign_index import get_campaign_index, DEFAULT_PAGE_SIZE
 
 # Colors from the image
 TEAL_COLOR = (26/255, 164/255, 159/255, 1)  # #1AA49F
@@ -39,76 +32,13 @@ LIGHT_TEXT_COLOR = (0.5, 0.5, 0.5, 1)
 
 # Path to assets
 ASSETS_PATH = Path(__file__).parent / Path(r"build\assets\frame7")
-NAVIGATION_ICONS_PATH = Path(__file__).parent / Path(r"navigation_icons")
 
-# Create navigation_icons directory if it doesn't exist
-if not os.path.exists(NAVIGATION_ICONS_PATH):
-    os.makedirs(NAVIGATION_ICONS_PATH)
-
-class HeaderBar(BoxLayout):
-    """Teal header bar with school name and settings button"""
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.orientation = 'horizontal'
-        self.size_hint_y = None
-        self.height = dp(60)
-        self.padding = [dp(10), dp(5), dp(10), dp(5)]
-        
-        # Background color
-        with self.canvas.before:
-            Color(*TEAL_COLOR)
-            self.rect = Rectangle(pos=self.pos, size=self.size)
-        self.bind(pos=self._update_rect, size=self._update_rect)
-        
-        # Left - School logo
-        logo_path = os.path.join(ASSETS_PATH, "image_1.png")
-        self.logo = Image(
-            source=logo_path if os.path.exists(logo_path) else "",
-            size_hint=(None, 1),
-            width=dp(50),
-            allow_stretch=True,
-            keep_ratio=True
-        )
-        self.add_widget(self.logo)
-        
-        # Center - Donate title
-        self.title = Label(
-            text="Donate",
-            font_size=sp(22),
-            color=WHITE_COLOR,
-            halign='center',
-            valign='middle',
-            size_hint=(1, 1),
-            bold=True
-        )
-        self.add_widget(self.title)
-        
-        # Right - Settings gear icon
-        gear_path = os.path.join(ASSETS_PATH, "button_9.png")
-        self.settings_btn = Button(
-            background_normal=gear_path if os.path.exists(gear_path) else "",
-            background_color=(1, 1, 1, 1),
-            size_hint=(None, None),
-            size=(dp(40), dp(40)),
-            pos_hint={'center_y': 0.5}
-        )
-        self.settings_btn.bind(on_press=self.on_settings)
-        self.add_widget(self.settings_btn)
-    
-    def _update_rect(self, instance, value):
-        """Update background when size changes"""
-        self.rect.pos = self.pos
-        self.rect.size = self.size
-    
-    def on_settings(self, instance):
-        """Handle settings button press"""
-        print("Settings button pressed")
-        # Navigate to settings page
-        App.get_running_app().show_settings_page()
+# Number of donation widgets built per frame while rendering results
+RENDER_BATCH_SIZE = 2
 
 class SearchBar(BoxLayout):
     """Search bar with input field and search button"""
-    def __init__(self, **kwargs):
+    def __init__(self, on_search_callback=None, **kwargs):
         super().__init__(**kwargs)
         self.orientation = 'horizontal'
         self.size_hint_y = None
@@ -116,6 +46,9 @@ class SearchBar(BoxLayout):
         self.padding = [dp(20), dp(10), dp(20), dp(10)]
         self.spacing = dp(10)
         
+        # Store the search callback
+        self.on_search_callback = on_search_callback
+        
         # Search input field with border
         self.search_input = TextInput(
             hint_text="",
@@ -139,6 +72,8 @@ class SearchBar(BoxLayout):
                 radius=[dp(5), dp(5), dp(5), dp(5)]
             )
         self.search_input.bind(pos=self._update_search_border, size=self._update_search_border)
+        # Pressing enter searches just like the button
+        self.search_input.bind(on_text_validate=self.on_search)
         self.add_widget(self.search_input)
         
         # Search button
@@ -177,6 +112,8 @@ class SearchBar(BoxLayout):
         """Handle search button press"""
         search_text = self.search_input.text
         print(f"Searching for: {search_text}")
+        if self.on_search_callback:
+            self.on_search_callback(search_text)
 
 class DonationCard(BoxLayout):
     """Card displaying a donation opportunity"""
@@ -203,7 +140,6 @@ class DonationCard(BoxLayout):
         
         # Image at the top
         self.image = Image(
-            source=image_path if os.path.exists(image_path) else "",
             allow_stretch=True,
             keep_ratio=True,
             size_hint=(1, None),
@@ -211,6 +147,9 @@ class DonationCard(BoxLayout):
         )
         self.add_widget(self.image)
         
+        # Decode the image off the main thread, showing a placeholder meanwhile
+        get_image_loader().load(self.image, image_path, 150, owner=self)
+        
         # Title below image with text wrapping (no spacer needed)
         self.title = Label(
             text=title,
@@ -284,54 +223,156 @@ class DonationCard(BoxLayout):
 
 class DonationContent(BoxLayout):
     """Content area for donations page"""
-    def __init__(self, **kwargs):
+    def __init__(self, campaign_index=None, page_size=DEFAULT_PAGE_SIZE, **kwargs):
         super().__init__(**kwargs)
         self.orientation = 'vertical'
         self.padding = [0, dp(10), 0, dp(10)]  # Increased padding for better spacing
         self.spacing = dp(15)  # Increased spacing between widgets
         
+        # Shared searchable campaign catalog
+        self.campaign_index = campaign_index if campaign_index is not None else get_campaign_index()
+        self.page_size = page_size
+        
+        # Current search state
+        self.query = ""
+        self.page = 0
+        self.total_results = 0
+        
+        # Widgets rendered for the current results, keyed by campaign id
+        self.donation_widgets = {}
+        self._pending_campaigns = []
+        self._render_event = None
+        
         # Search bar at the top
-        self.search_bar = SearchBar(size_hint=(1, None), height=dp(50))
+        self.search_bar = SearchBar(
+            size_hint=(1, None),
+            height=dp(50),
+            on_search_callback=self.search
+        )
         self.add_widget(self.search_bar)
         
         # Create a scroll view to contain donation widgets
-        scroll_view = ScrollView(
+        self.scroll_view = ScrollView(
             do_scroll_x=False,
             size_hint=(1, 1)
         )
         
         # Create vertical container for donation widgets
-        donation_container = BoxLayout(
+        self.donation_container = BoxLayout(
             orientation='vertical',
             size_hint_y=None,
             spacing=dp(20),
             padding=[dp(10), dp(10), dp(10), dp(10)]
         )
-        donation_container.bind(minimum_height=donation_container.setter('height'))
-        
-        # Computer labs donation widget
-        computer_labs_image = os.path.join(ASSETS_PATH, "image_3.png")
-        self.computer_labs_widget = DonationWidget(
-            computer_labs_image,
-            "Donate for Computer Labs",
-            on_donate_callback=self.on_donate
+        self.donation_container.bind(minimum_height=self.donation_container.setter('height'))
+        
+        # Status label shown above the results
+        self.results_label = Label(
+            text="",
+            font_size=sp(14),
+            color=LIGHT_TEXT_COLOR,
+            halign='left',
+            valign='middle',
+            size_hint=(1, None),
+            height=dp(20)
         )
-        donation_container.add_widget(self.computer_labs_widget)
-        
-        # Infrastructure donation widget
-        infrastructure_image = os.path.join(ASSETS_PATH, "image_5.png")
-        self.infrastructure_widget = DonationWidget(
-            infrastructure_image,
-            "Donate for Infrastructure",
-            on_donate_callback=self.on_donate
+        self.results_label.bind(width=lambda instance, width:
+                                setattr(instance, 'text_size', (width, None)))
+        self.donation_container.add_widget(self.results_label)
+        
+        # Button to load the next page of results
+        self.load_more_button = Button(
+            text="Load more",
+            font_size=sp(16),
+            background_normal='',
+            background_color=TEAL_COLOR,
+            color=WHITE_COLOR,
+            size_hint=(1, None),
+            height=dp(40)
         )
-        donation_container.add_widget(self.infrastructure_widget)
+        self.load_more_button.bind(on_press=self.load_more)
         
         # Add container to scroll view
-        scroll_view.add_widget(donation_container)
+        self.scroll_view.add_widget(self.donation_container)
         
         # Add scroll view to main layout
-        self.add_widget(scroll_view)
+        self.add_widget(self.scroll_view)
+        
+        # Show the first page of the full catalog
+        self.search("")
+    
+    def search(self, query):
+        """Show the first page of campaigns matching the query"""
+        self.query = query
+        self.page = 0
+        
+        # Drop the widgets of the previous results
+        self._cancel_render()
+        for widget in self.donation_widgets.values():
+            self.donation_container.remove_widget(widget)
+        self.donation_widgets = {}
+        if self.load_more_button.parent:
+            self.donation_container.remove_widget(self.load_more_button)
+        self.scroll_view.scroll_y = 1
+        
+        self._show_page()
+    
+    def load_more(self, instance=None):
+        """Append the next page of results"""
+        if self._render_event is not None:
+            return
+        self.page += 1
+        self._show_page()
+    
+    def _show_page(self):
+        """Queue the current page of results for rendering"""
+        campaigns, self.total_results = self.campaign_index.search(
+            self.query, page=self.page, page_size=self.page_size)
+        
+        if self.total_results == 0:
+            self.results_label.text = "No donation projects found."
+        elif self.query:
+            self.results_label.text = f"{self.total_results} projects found for \"{self.query}\""
+        else:
+            self.results_label.text = f"{self.total_results} donation projects"
+        
+        if self.load_more_button.parent:
+            self.donation_container.remove_widget(self.load_more_button)
+        
+        # Build the cards a few per frame so the page never stalls
+        self._pending_campaigns = list(campaigns)
+        if self._pending_campaigns:
+            self._render_event = Clock.schedule_interval(self._render_batch, 0)
+    
+    def _render_batch(self, dt):
+        """Create the next batch of donation widgets"""
+        for _ in range(RENDER_BATCH_SIZE):
+            if not self._pending_campaigns:
+                break
+            campaign = self._pending_campaigns.pop(0)
+            widget = DonationWidget(
+                campaign['image_path'],
+                campaign['title'],
+                on_donate_callback=self.on_donate
+            )
+            self.donation_container.add_widget(widget)
+            self.donation_widgets[campaign['id']] = widget
+        
+        if self._pending_campaigns:
+            return True
+        
+        # Page finished - offer the next one if there is more
+        self._render_event = None
+        if len(self.donation_widgets) < self.total_results:
+            self.donation_container.add_widget(self.load_more_button)
+        return False
+    
+    def _cancel_render(self):
+        """Stop rendering a page that is no longer wanted"""
+        if self._render_event is not None:
+            self._render_event.cancel()
+            self._render_event = None
+        self._pending_campaigns = []
     
     def on_donate(self, image_source, title):
         """Handle donate button press"""
@@ -339,85 +380,11 @@ class DonationContent(BoxLayout):
         # Navigate to donation details page
         App.get_running_app().show_donation_details(image_source, title)
 
-class EmptyNavigationBar(BoxLayout):
-    """Navigation bar with 5 empty slots ready to be populated"""
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.orientation = 'horizontal'
-        self.size_hint_y = None
-        self.height = dp(60)
-        self.padding = [dp(5), dp(5), dp(5), dp(5)]
-        
-        # Background color
-        with self.canvas.before:
-            Color(*WHITE_COLOR)
-            self.rect = Rectangle(pos=self.pos, size=self.size)
-            Color(0.9, 0.9, 0.9, 1)  # Light gray top border
-            self.border = Line(points=[0, 0, 0, 0], width=1)
-        self.bind(pos=self._update_canvas, size=self._update_canvas)
-        
-        # Store reference to slots
-        self.slots = []
-        
-        # Create 5 empty slots
-        for i in range(5):
-            slot = BoxLayout(orientation='vertical', size_hint=(1, 1))
-            self.add_widget(slot)
-            self.slots.append(slot)
-    
-    def add_icon_to_slot(self, slot_index, icon_source, text, icon_size=None, icon_pos_y=0.5):
-        """Add an icon and text to a specific slot"""
-        if 0 <= slot_index < len(self.slots):
-            # Clear any existing content in the slot
-            self.slots[slot_index].clear_widgets()
-            
-            # Create vertical layout for the icon and text
-            content_layout = BoxLayout(orientation='vertical', size_hint=(1, 1))
-            
-            # Default icon size
-            if icon_size is None:
-                icon_size = (dp(30), dp(30))
-            
-            # Add icon with adjustable vertical position
-            icon = Image(
-                source=icon_source,
-                size_hint=(None, None),
-                size=icon_size,
-                pos_hint={'center_x': 0.5, 'center_y': icon_pos_y}
-            )
-            
-            # Add icon container with increased height for more room
-            icon_container = FloatLayout(size_hint=(1, None), height=dp(45))
-            icon_container.add_widget(icon)
-            
-            # Add text with adjusted position
-            text_label = Label(
-                text=text,
-                font_size=sp(12),
-                size_hint=(1, None),
-                height=dp(15),  # Reduced height to move up closer to icon
-                halign='center',
-                padding=(0, dp(-8))  # Increased negative padding to pull text up
-            )
-            
-            # Add widgets to content layout
-            content_layout.add_widget(icon_container)
-            content_layout.add_widget(text_label)
-            
-            # Add content layout to slot
-            self.slots[slot_index].add_widget(content_layout)
-    
-    def _update_canvas(self, instance, value):
-        """Update background and border when size changes"""
-        self.rect.pos = self.pos
-        self.rect.size = self.size
-        self.border.points = [
-            self.x, self.y + self.height - 1, 
-            self.x + self.width, self.y + self.height - 1
-        ]
-
 class DonatePage(FloatLayout):
     """Main donate page layout"""
+    # Chrome the app's shared header and navigation bar show for this page
+    chrome_options = {'header': True, 'title': "Donate", 'settings': True, 'navigation': True}
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         
@@ -427,84 +394,29 @@ class DonatePage(FloatLayout):
             self.rect = Rectangle(pos=self.pos, size=self.size)
         self.bind(pos=self._update_rect, size=self._update_rect)
         
-        # Add header
-        self.header = HeaderBar(pos_hint={'top': 1})
-        self.add_widget(self.header)
-        
-        # Add navigation bar at bottom
-        self.nav = EmptyNavigationBar(pos_hint={'bottom': 1})
-        self.add_widget(self.nav)
-        
-        # Add icons to navigation bar
-        self._add_navigation_icons()
+        # Header and navigation come from the app's shared chrome when it has one
+        if shared_chrome() is None:
+            self.header = HeaderBar(pos_hint={'top': 1})
+            self.add_widget(self.header)
+            self.nav = EmptyNavigationBar(pos_hint={'bottom': 1})
+            self.add_widget(self.nav)
+            self.nav.add_default_icons(fallback_path=ASSETS_PATH)
+        else:
+            self.header = None
+            self.nav = None
+        header_height = chrome_height(self.header)
+        nav_height = chrome_height(self.nav)
         
         # Add content with donation cards
         self.content = DonationContent(
-            pos_hint={'x': 0, 'y': self.nav.height/self.height},
-            size_hint=(1, 1 - (self.header.height + self.nav.height) / self.height)
+            pos_hint={'x': 0, 'y': nav_height/self.height},
+            size_hint=(1, 1 - (header_height + nav_height) / self.height)
         )
         self.add_widget(self.content)
         
         # Handle window resize
         Clock.schedule_once(self._adjust_layout, 0.1)
-        Window.bind(on_resize=self._on_window_resize)
-    
-    def _add_navigation_icons(self):
-        """Add icons to navigation bar slots"""
-        # Add home icon to first slot
-        home_icon_path = os.path.join(NAVIGATION_ICONS_PATH, "home_icon.png")
-        if not os.path.exists(home_icon_path):
-            home_icon_path = os.path.join(ASSETS_PATH, "home_icon.png")
-        
-        if os.path.exists(home_icon_path):
-            self.nav.add_icon_to_slot(0, home_icon_path, "Home", icon_pos_y=0.3)
-        else:
-            self.nav.slots[0].add_widget(Label(text="Home", font_size=sp(14)))
-        
-        # Add donation icon to second slot
-        donation_icon_path = os.path.join(NAVIGATION_ICONS_PATH, "donation_icon.png")
-        if not os.path.exists(donation_icon_path):
-            donation_icon_path = os.path.join(ASSETS_PATH, "donation_icon.png")
-        
-        if os.path.exists(donation_icon_path):
-            self.nav.add_icon_to_slot(1, donation_icon_path, "Donation", icon_pos_y=0.3)
-        else:
-            self.nav.slots[1].add_widget(Label(text="Donation", font_size=sp(14)))
-        
-        # Add search icon to third slot
-        search_icon_path = os.path.join(NAVIGATION_ICONS_PATH, "search_icon.png")
-        if not os.path.exists(search_icon_path):
-            search_icon_path = os.path.join(ASSETS_PATH, "search_icon.png")
-        
-        if os.path.exists(search_icon_path):
-            self.nav.add_icon_to_slot(2, search_icon_path, "Search", icon_pos_y=0.3)
-        else:
-            self.nav.slots[2].add_widget(Label(text="Search", font_size=sp(14)))
-        
-        # Add calendar icon to fourth slot
-        calendar_icon_path = os.path.join(NAVIGATION_ICONS_PATH, "calendar_icon.png")
-        if not os.path.exists(calendar_icon_path):
-            calendar_icon_path = os.path.join(ASSETS_PATH, "calendar_icon.png")
-        
-        if os.path.exists(calendar_icon_path):
-            self.nav.add_icon_to_slot(3, calendar_icon_path, "Event Calendar", 
-                                     icon_size=(dp(55), dp(55)),
-                                     icon_pos_y=0.3)
-        else:
-            self.nav.slots[3].add_widget(Label(text="Event Calendar", font_size=sp(12)))
-        
-        # Add profile icon to fifth slot
-        profile_icon_path = os.path.join(NAVIGATION_ICONS_PATH, "profile_icon.png")
-        if not os.path.exists(profile_icon_path):
-            profile_icon_path = os.path.join(ASSETS_PATH, "profile_icon.png")
-        
-        if os.path.exists(profile_icon_path):
-            profile_icon_size = dp(25)
-            self.nav.add_icon_to_slot(4, profile_icon_path, "Profile", 
-                                     icon_size=(profile_icon_size, profile_icon_size),
-                                     icon_pos_y=0.3)
-        else:
-            self.nav.slots[4].add_widget(Label(text="Profile", font_size=sp(13)))
+        get_resize_dispatcher().subscribe(self._on_window_resize)
     
     def _update_rect(self, instance, value):
         """Update background rectangle on size/position change"""
@@ -515,15 +427,15 @@ class DonatePage(FloatLayout):
         """Initial layout adjustment"""
         if self.height > 0:  # Avoid division by zero
             # Update content area position and size
-            header_ratio = self.header.height / self.height
-            nav_ratio = self.nav.height / self.height
+            header_ratio = chrome_height(self.header) / self.height
+            nav_ratio = chrome_height(self.nav) / self.height
             self.content.pos_hint = {'x': 0, 'y': nav_ratio, 'top': 1 - header_ratio}
             self.content.size_hint = (1, 1 - header_ratio - nav_ratio)
     
-    def _on_window_resize(self, instance, width, height):
-        """Handle window resize by updating layout"""
+    def _on_window_resize(self, width, height):
+        """Handle window resize by updating layout (at most once per frame)"""
         if height > 0:  # Avoid division by zero
-            Clock.schedule_once(self._adjust_layout, 0.1)
+            self._adjust_layout(0)
     
     def show_donation_details(self, image_path, title):
         """Show donation details page"""
@@ -534,11 +446,22 @@ class DonatePage(FloatLayout):
 
 class DonatePageApp(App):
     """Main application class"""
+    # Donation pages cached per campaign, created on first use
+    details_pages = None
+    amount_pages = None
+    
     def build(self):
         from kivy.uix.screenmanager import ScreenManager, Screen
+        from app_bootstrap import bootstrap
+        bootstrap()
         
         # Create the screen manager
         sm = ScreenManager()
+        get_resize_dispatcher().watch(sm)
+        
+        # One header and navigation bar shared by every screen; pages
+        # created from here on leave theirs out
+        self.chrome = ChromeHost(sm)
         
         # Create the login page first to ensure it exists
         try:
@@ -566,8 +489,13 @@ class DonatePageApp(App):
         
         return sm
     
+    def on_start(self):
+        """Put the shared header and navigation bar on the window"""
+        self.chrome.attach()
+    
     def show_login_page(self):
         """Show login page"""
+        from kivy.uix.screenmanager import Screen
         print("Showing login page")
         try:
             # Get the screen manager
@@ -599,42 +527,22 @@ class DonatePageApp(App):
     def show_donation_details(self, image_path, title):
         """Show donation details page"""
         from donation_details_page import DonationDetailsPage
-        from kivy.uix.screenmanager import Screen
-        
-        # Get the screen manager
-        sm = self.root
-        
-        # Remove the donation details screen if it exists
-        if sm.has_screen('donation_details'):
-            sm.remove_widget(sm.get_screen('donation_details'))
+        from page_cache import PageCache
         
-        # Create the donation details screen
-        details_screen = Screen(name='donation_details')
-        details_screen.add_widget(DonationDetailsPage(image_path=image_path, title=title))
-        sm.add_widget(details_screen)
-        
-        # Switch to the donation details screen
-        sm.current = 'donation_details'
+        # Reuse a cached page for this campaign instead of rebuilding it
+        if self.details_pages is None:
+            self.details_pages = PageCache(DonationDetailsPage)
+        self.details_pages.show(self.root, 'donation_details', image_path, title)
     
     def show_donation_amount(self, image_path, title):
         """Show donation amount selection page"""
         from donation_amount_page import DonationAmountPage
-        from kivy.uix.screenmanager import Screen
-        
-        # Get the screen manager
-        sm = self.root
-        
-        # Remove the amount screen if it exists
-        if sm.has_screen('donation_amount'):
-            sm.remove_widget(sm.get_screen('donation_amount'))
-        
-        # Create the amount selection screen
-        amount_screen = Screen(name='donation_amount')
-        amount_screen.add_widget(DonationAmountPage(image_path=image_path, title=title))
-        sm.add_widget(amount_screen)
+        from page_cache import PageCache
         
-        # Switch to the amount selection screen
-        sm.current = 'donation_amount'
+        # Reuse a cached page for this campaign instead of rebuilding it
+        if self.amount_pages is None:
+            self.amount_pages = PageCache(DonationAmountPage)
+        self.amount_pages.show(self.root, 'donation_amount', image_path, title)
     
     def show_event_calendar(self):
         """Show event calendar page"""
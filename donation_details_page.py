@@ -4,25 +4,17 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.image import Image
 from kivy.uix.label import Label
 from kivy.uix.button import Button
-from kivy.core.window import Window
-from kivy.utils import platform
 from kivy.metrics import dp, sp
-from kivy.graphics import Color, Rectangle, Line, RoundedRectangle
+from kivy.graphics import Color, Rectangle, RoundedRectangle
 from kivy.clock import Clock
 from kivy.uix.widget import Widget
 from pathlib import Path
 import os
 
-# Device profile constants
-DEVICE_PROFILES = {
-    'small': {'width': 392, 'height': 759},  # Match the image proportions
-    'medium': {'width': 1080, 'height': 2340},  # Common smartphone size
-}
-
-# For mobile devices, let the system set the window size
-# Only set window size for desktop/development
-if platform not in ('android', 'ios'):
-    Window.size = (DEVICE_PROFILES['small']['width'], DEVICE_PROFILES['small']['height'])
+# Shared header bar and background image loading
+from app_chrome import HeaderBar, shared_chrome, chrome_height
+from image_loader import get_image_loader
+from resize_dispatcher import get_resize_dispatcher
 
 # Colors from the image
 TEAL_COLOR = (26/255, 164/255, 159/255, 1)  # #1AA49F
@@ -34,136 +26,6 @@ BLUE_TEXT_COLOR = (0/255, 122/255, 255/255, 1)  # Blue color for links and title
 
 # Path to assets
 ASSETS_PATH = Path(__file__).parent / Path(r"build\assets\frame7")
-NAVIGATION_ICONS_PATH = Path(__file__).parent / Path(r"navigation_icons")
-
-# Create navigation_icons directory if it doesn't exist
-if not os.path.exists(NAVIGATION_ICONS_PATH):
-    os.makedirs(NAVIGATION_ICONS_PATH)
-
-class HeaderBar(BoxLayout):
-    """Teal header bar with school name"""
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.orientation = 'horizontal'
-        self.size_hint_y = None
-        self.height = dp(60)
-        self.padding = [dp(10), dp(5), dp(10), dp(5)]
-        
-        # Background color
-        with self.canvas.before:
-            Color(*TEAL_COLOR)
-            self.rect = Rectangle(pos=self.pos, size=self.size)
-        self.bind(pos=self._update_rect, size=self._update_rect)
-        
-        # Left - School logo
-        logo_path = os.path.join(ASSETS_PATH, "image_1.png")
-        self.logo = Image(
-            source=logo_path if os.path.exists(logo_path) else "",
-            size_hint=(None, 1),
-            width=dp(50),
-            allow_stretch=True,
-            keep_ratio=True
-        )
-        self.add_widget(self.logo)
-        
-        # Center - Donate title
-        self.title = Label(
-            text="Donate",
-            font_size=sp(22),
-            color=WHITE_COLOR,
-            halign='center',
-            valign='middle',
-            size_hint=(1, 1),
-            bold=True
-        )
-        self.add_widget(self.title)
-        
-        # Right spacer to balance the logo
-        spacer = Widget(size_hint=(None, 1), width=dp(50))
-        self.add_widget(spacer)
-    
-    def _update_rect(self, instance, value):
-        """Update background when size changes"""
-        self.rect.pos = self.pos
-        self.rect.size = self.size
-
-
-class EmptyNavigationBar(BoxLayout):
-    """Navigation bar with 5 empty slots ready to be populated"""
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.orientation = 'horizontal'
-        self.size_hint_y = None
-        self.height = dp(60)
-        self.padding = [dp(5), dp(5), dp(5), dp(5)]
-        
-        # Background color
-        with self.canvas.before:
-            Color(*WHITE_COLOR)
-            self.rect = Rectangle(pos=self.pos, size=self.size)
-            Color(0.9, 0.9, 0.9, 1)  # Light gray top border
-            self.border = Line(points=[0, 0, 0, 0], width=1)
-        self.bind(pos=self._update_canvas, size=self._update_canvas)
-        
-        # Store reference to slots
-        self.slots = []
-        
-        # Create 5 empty slots
-        for i in range(5):
-            slot = BoxLayout(orientation='vertical', size_hint=(1, 1))
-            self.add_widget(slot)
-            self.slots.append(slot)
-    
-    def add_icon_to_slot(self, slot_index, icon_source, text, icon_size=None, icon_pos_y=0.5):
-        """Add an icon and text to a specific slot"""
-        if 0 <= slot_index < len(self.slots):
-            # Clear any existing content in the slot
-            self.slots[slot_index].clear_widgets()
-            
-            # Create vertical layout for the icon and text
-            content_layout = BoxLayout(orientation='vertical', size_hint=(1, 1))
-            
-            # Default icon size
-            if icon_size is None:
-                icon_size = (dp(30), dp(30))
-            
-            # Add icon with adjustable vertical position
-            icon = Image(
-                source=icon_source,
-                size_hint=(None, None),
-                size=icon_size,
-                pos_hint={'center_x': 0.5, 'center_y': icon_pos_y}
-            )
-            
-            # Add icon container with increased height for more room
-            icon_container = FloatLayout(size_hint=(1, None), height=dp(45))
-            icon_container.add_widget(icon)
-            
-            # Add text with adjusted position
-            text_label = Label(
-                text=text,
-                font_size=sp(12),
-                size_hint=(1, None),
-                height=dp(15),  # Reduced height to move up closer to icon
-                halign='center',
-                padding=(0, dp(-8))  # Increased negative padding to pull text up
-            )
-            
-            # Add widgets to content layout
-            content_layout.add_widget(icon_container)
-            content_layout.add_widget(text_label)
-            
-            # Add content layout to slot
-            self.slots[slot_index].add_widget(content_layout)
-    
-    def _update_canvas(self, instance, value):
-        """Update background and border when size changes"""
-        self.rect.pos = self.pos
-        self.rect.size = self.size
-        self.border.points = [
-            self.x, self.y + self.height - 1, 
-            self.x + self.width, self.y + self.height - 1
-        ]
 
 class DonationDetailsContent(BoxLayout):
     """Content area for donation details page"""
@@ -198,7 +60,6 @@ class DonationDetailsContent(BoxLayout):
         
         # Donation image
         self.donation_image = Image(
-            source=image_path if os.path.exists(image_path) else "",
             allow_stretch=True,
             keep_ratio=True,
             size_hint=(1, None),
@@ -206,6 +67,12 @@ class DonationDetailsContent(BoxLayout):
         )
         self.add_widget(self.donation_image)
         
+        # The image is shown through its texture, so keep the path for the amount page
+        self.image_path = image_path
+        
+        # Decode the image off the main thread, showing a placeholder meanwhile
+        get_image_loader().load(self.donation_image, image_path, 200, owner=self)
+        
         # Add a small spacer widget to create distance between image and title
         self.add_widget(Widget(size_hint=(1, None), height=dp(5)))
         
@@ -314,6 +181,12 @@ class DonationDetailsContent(BoxLayout):
         self.donate_button.bind(on_press=self.on_donate_now)
         self.add_widget(self.donate_button)
     
+    def set_campaign(self, image_path, title):
+        """Show another campaign in the existing widgets"""
+        self.image_path = image_path
+        get_image_loader().load(self.donation_image, image_path, 200, owner=self)
+        self.title.text = title
+    
     def _update_divider(self, instance, value):
         """Update divider line when size changes"""
         if hasattr(self, 'divider'):
@@ -334,7 +207,7 @@ class DonationDetailsContent(BoxLayout):
         
         # Check if the app has the show_donation_amount method
         if hasattr(app, 'show_donation_amount'):
-            app.show_donation_amount(self.donation_image.source, self.title.text)
+            app.show_donation_amount(self.image_path, self.title.text)
         else:
             print("show_donation_amount method not found in app - using fallback")
             try:
@@ -354,7 +227,7 @@ class DonationDetailsContent(BoxLayout):
                     # Add the donation amount screen
                     amount_screen = Screen(name=screen_name)
                     amount_screen.add_widget(DonationAmountPage(
-                        image_path=self.donation_image.source, 
+                        image_path=self.image_path, 
                         title=self.title.text
                     ))
                     app.root.add_widget(amount_screen)
@@ -406,6 +279,9 @@ class DonationDetailsContent(BoxLayout):
 
 class DonationDetailsPage(FloatLayout):
     """Main donation details page layout"""
+    # Chrome the app's shared header bar shows for this page
+    chrome_options = {'header': True, 'title': "Donate", 'settings': False}
+    
     def __init__(self, image_path=None, title=None, **kwargs):
         super().__init__(**kwargs)
         
@@ -419,22 +295,26 @@ class DonationDetailsPage(FloatLayout):
             self.rect = Rectangle(pos=self.pos, size=self.size)
         self.bind(pos=self._update_rect, size=self._update_rect)
         
-        # Add header
-        self.header = HeaderBar(pos_hint={'top': 1})
-        self.add_widget(self.header)
+        # The header comes from the app's shared chrome when it has one
+        if shared_chrome() is None:
+            self.header = HeaderBar(settings=False, pos_hint={'top': 1})
+            self.add_widget(self.header)
+        else:
+            self.header = None
+        header_height = chrome_height(self.header)
         
         # Add content with donation details (now takes full remaining space)
         self.content = DonationDetailsContent(
             self.image_path,
             self.title,
             pos_hint={'x': 0, 'y': 0},
-            size_hint=(1, 1 - self.header.height / self.height)
+            size_hint=(1, 1 - header_height / self.height)
         )
         self.add_widget(self.content)
         
         # Handle window resize
         Clock.schedule_once(self._adjust_layout, 0.1)
-        Window.bind(on_resize=self._on_window_resize)
+        get_resize_dispatcher().subscribe(self._on_window_resize)
     
     def _update_rect(self, instance, value):
         """Update background rectangle on size/position change"""
@@ -445,18 +325,27 @@ class DonationDetailsPage(FloatLayout):
         """Initial layout adjustment"""
         if self.height > 0:  # Avoid division by zero
             # Update content area position and size (no navigation bar)
-            header_ratio = self.header.height / self.height
+            header_ratio = chrome_height(self.header) / self.height
             self.content.pos_hint = {'x': 0, 'y': 0}
             self.content.size_hint = (1, 1 - header_ratio)
     
-    def _on_window_resize(self, instance, width, height):
-        """Handle window resize by updating layout"""
+    def _on_window_resize(self, width, height):
+        """Handle window resize by updating layout (at most once per frame)"""
         if height > 0:  # Avoid division by zero
-            Clock.schedule_once(self._adjust_layout, 0.1)
+            self._adjust_layout(0)
+    
+    def set_campaign(self, image_path=None, title=None):
+        """Rebind a cached page to another campaign without rebuilding it"""
+        self.image_path = image_path or os.path.join(ASSETS_PATH, "image_3.png")
+        self.title = title or "Donate for Infrastructure"
+        self.content.set_campaign(self.image_path, self.title)
 
 class DonationDetailsApp(App):
     """Main application class for testing"""
     def build(self):
+        from app_bootstrap import bootstrap
+        bootstrap()
+        
         return DonationDetailsPage()
     
     def go_back(self):
@@ -470,6 +359,7 @@ class DonationDetailsApp(App):
     
     def show_donation_amount(self, image_path, title):
         """Show donation amount selection page"""
+        from kivy.core.window import Window
         try:
             from donation_amount_page import DonationAmountPage
             from kivy.uix.screenmanager import ScreenManager, Screen
@@ -0,0 +1,287 @@
+import threading
+import time
+
+import numpy as np
+
+# Rows pulled from the ledger per batch
+DEFAULT_BATCH_SIZE = 20000
+
+# How often the cache asks the database whether another process added donations
+FINGERPRINT_CHECK_INTERVAL = 5.0  # Seconds
+
+DEFAULT_PERCENTILES = (50, 90, 99)
+
+class DonationLedgerArrays:
+    """Donation ledger held as NumPy columns
+
+    amounts  - float64 donation amounts
+    days     - datetime64[D] donation dates
+    campaign - int32 codes into the campaigns list
+    """
+    def __init__(self):
+        self.campaigns = []
+        self._campaign_codes = {}
+        self.amounts = np.empty(0, dtype=np.float64)
+        self.days = np.empty(0, dtype='datetime64[D]')
+        self.campaign = np.empty(0, dtype=np.int32)
+        self.last_id = 0
+
+    def __len__(self):
+        return len(self.amounts)
+
+    def fingerprint(self):
+        """(highest id, row count, total amount), as db.donation_fingerprint reports them"""
+        return self.last_id, len(self), round(float(self.amounts.sum()), 2)
+
+    @classmethod
+    def from_database(cls, db, batch_size=DEFAULT_BATCH_SIZE):
+        """Load the ledger columns from the database in batches"""
+        ledger = cls()
+        amount_parts = []
+        day_parts = []
+        campaign_parts = []
+
+        for rows in db.iter_donations(chunk_size=batch_size):
+            ids, amounts, days, codes = ledger._batch_to_arrays(rows)
+            amount_parts.append(amounts)
+            day_parts.append(days)
+            campaign_parts.append(codes)
+            ledger.last_id = max(ledger.last_id, int(ids.max()))
+
+        if amount_parts:
+            ledger.amounts = np.concatenate(amount_parts)
+            ledger.days = np.concatenate(day_parts)
+            ledger.campaign = np.concatenate(campaign_parts)
+        return ledger
+
+    def append(self, donations):
+        """Append newly recorded donation dicts to the columns"""
+        if not donations:
+            return
+        rows = [
+            (d['id'], d['reference'], d['created_at'], d['campaign'], d['amount'])
+            for d in donations
+        ]
+        ids, amounts, days, codes = self._batch_to_arrays(rows)
+        self.amounts = np.concatenate([self.amounts, amounts])
+        self.days = np.concatenate([self.days, days])
+        self.campaign = np.concatenate([self.campaign, codes])
+        self.last_id = max(self.last_id, int(ids.max()))
+
+    def _batch_to_arrays(self, rows):
+        """Convert one batch of ledger rows into column arrays"""
+        ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+        amounts = np.fromiter((float(row[4]) for row in rows), dtype=np.float64, count=len(rows))
+        days = np.array([str(row[2])[:10] for row in rows], dtype='datetime64[D]')
+
+        # Encode campaign names once per distinct name in the batch
+        names, inverse = np.unique(np.array([row[3] for row in rows], dtype=object), return_inverse=True)
+        lookup = np.array([self._campaign_code(name) for name in names], dtype=np.int32)
+        return ids, amounts, days, lookup[inverse]
+
+    def _campaign_code(self, name):
+        """Return the integer code of a campaign name"""
+        code = self._campaign_codes.get(name)
+        if code is None:
+            code = len(self.campaigns)
+            self._campaign_codes[name] = code
+            self.campaigns.append(name)
+        return code
+
+class DonationStats:
+    """Vectorized dashboard statistics over a DonationLedgerArrays"""
+    def __init__(self, ledger):
+        self.ledger = ledger
+
+    def campaign_totals(self):
+        """Return {campaign: (count, total, mean)}"""
+        ledger = self.ledger
+        n = len(ledger.campaigns)
+        counts = np.bincount(ledger.campaign, minlength=n)
+        totals = np.bincount(ledger.campaign, weights=ledger.amounts, minlength=n)
+        means = np.divide(totals, counts, out=np.zeros(n), where=counts > 0)
+        return {
+            name: (int(counts[i]), float(totals[i]), float(means[i]))
+            for i, name in enumerate(ledger.campaigns)
+        }
+
+    def campaign_histograms(self, bins=10):
+        """Return (bin_edges, {campaign: counts}) with shared amount bins"""
+        ledger = self.ledger
+        if len(ledger) == 0:
+            return np.empty(0), {}
+
+        edges = np.histogram_bin_edges(ledger.amounts, bins=bins)
+        # Bin index per donation, then one 2-D bincount across campaigns
+        bin_index = np.clip(np.searchsorted(edges, ledger.amounts, side='right') - 1, 0, len(edges) - 2)
+        n_bins = len(edges) - 1
+        flat = ledger.campaign.astype(np.int64) * n_bins + bin_index
+        counts = np.bincount(flat, minlength=len(ledger.campaigns) * n_bins)
+        counts = counts.reshape(len(ledger.campaigns), n_bins)
+        return edges, {name: counts[i] for i, name in enumerate(ledger.campaigns)}
+
+    def daily_series(self, campaign=None):
+        """Return (days, totals, counts) for every day from first to last donation"""
+        ledger = self.ledger
+        mask = self._campaign_mask(campaign)
+        days = ledger.days[mask]
+        amounts = ledger.amounts[mask]
+        if len(days) == 0:
+            return np.empty(0, dtype='datetime64[D]'), np.empty(0), np.empty(0, dtype=np.int64)
+
+        first = days.min()
+        offsets = (days - first).astype(np.int64)
+        length = int(offsets.max()) + 1
+        totals = np.bincount(offsets, weights=amounts, minlength=length)
+        counts = np.bincount(offsets, minlength=length)
+        return first + np.arange(length), totals, counts
+
+    def rolling_daily_totals(self, window=7, campaign=None):
+        """Return (days, rolling sum, rolling mean) over a trailing window of days"""
+        days, totals, _ = self.daily_series(campaign)
+        if len(totals) == 0:
+            return days, totals, totals
+
+        cumulative = np.cumsum(np.concatenate([[0.0], totals]))
+        # Window sums via the difference of cumulative totals
+        starts = np.maximum(np.arange(len(totals)) + 1 - window, 0)
+        sums = cumulative[1:] - cumulative[starts]
+        widths = np.arange(len(totals)) + 1 - starts
+        return days, sums, sums / widths
+
+    def percentiles(self, q=DEFAULT_PERCENTILES):
+        """Return percentiles of the donation amount across the ledger"""
+        if len(self.ledger) == 0:
+            return {p: 0.0 for p in q}
+        values = np.percentile(self.ledger.amounts, q)
+        return {p: float(v) for p, v in zip(q, values)}
+
+    def campaign_percentiles(self, q=DEFAULT_PERCENTILES):
+        """Return {campaign: {percentile: amount}} without a per-campaign loop over rows"""
+        ledger = self.ledger
+        if len(ledger) == 0:
+            return {}
+
+        # Sort by campaign then amount so each campaign is a sorted slice
+        order = np.lexsort((ledger.amounts, ledger.campaign))
+        amounts = ledger.amounts[order]
+        counts = np.bincount(ledger.campaign, minlength=len(ledger.campaigns))
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+        # Linear interpolation between closest ranks, as np.percentile does
+        fractions = np.asarray(q, dtype=np.float64) / 100.0
+        positions = fractions[None, :] * np.maximum(counts - 1, 0)[:, None]
+        lower = np.floor(positions).astype(np.int64)
+        upper = np.minimum(lower + 1, np.maximum(counts - 1, 0)[:, None])
+        weight = positions - lower
+        base = starts[:, None]
+        valid = counts > 0
+        lower_values = amounts[np.where(valid[:, None], base + lower, 0)]
+        upper_values = amounts[np.where(valid[:, None], base + upper, 0)]
+        result = lower_values + (upper_values - lower_values) * weight
+
+        return {
+            name: {p: float(result[i, j]) for j, p in enumerate(q)}
+            for i, name in enumerate(ledger.campaigns) if valid[i]
+        }
+
+    def _campaign_mask(self, campaign):
+        """Boolean mask selecting one campaign, or everything"""
+        if campaign is None:
+            return slice(None)
+        code = self.ledger._campaign_codes.get(campaign)
+        if code is None:
+            return np.zeros(len(self.ledger), dtype=bool)
+        return self.ledger.campaign == code
+
+class DonationStatsCache:
+    """Cached dashboard statistics, invalidated by new donations
+
+    The ledger columns are loaded once. Donations recorded in this
+    process are appended to the arrays as they arrive; donations added
+    or changed by another process are detected by comparing the highest
+    id, row count and total amount of the ledger, at most every
+    FINGERPRINT_CHECK_INTERVAL seconds, and trigger a reload. Computed
+    results are memoized until the next change.
+    """
+    def __init__(self, db, batch_size=DEFAULT_BATCH_SIZE):
+        self.db = db
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._ledger = None
+        self._stats = None
+        self._results = {}
+        self._new_donations = []
+        self._last_check = 0.0
+        db.add_donation_listener(self._on_donation)
+
+    def close(self):
+        """Stop listening for new donations"""
+        self.db.remove_donation_listener(self._on_donation)
+
+    def invalidate(self):
+        """Drop everything and reload the ledger on next use"""
+        with self._lock:
+            self._ledger = None
+            self._stats = None
+            self._results = {}
+            self._new_donations = []
+
+    def campaign_totals(self):
+        return self._cached('campaign_totals')
+
+    def campaign_histograms(self, bins=10):
+        return self._cached('campaign_histograms', bins)
+
+    def daily_series(self, campaign=None):
+        return self._cached('daily_series', campaign)
+
+    def rolling_daily_totals(self, window=7, campaign=None):
+        return self._cached('rolling_daily_totals', window, campaign)
+
+    def percentiles(self, q=DEFAULT_PERCENTILES):
+        return self._cached('percentiles', tuple(q))
+
+    def campaign_percentiles(self, q=DEFAULT_PERCENTILES):
+        return self._cached('campaign_percentiles', tuple(q))
+
+    def _on_donation(self, donation):
+        """Queue a newly recorded donation for appending"""
+        with self._lock:
+            self._new_donations.append(donation)
+
+    def _cached(self, name, *args):
+        """Return a memoized statistic, refreshing the ledger first if needed"""
+        with self._lock:
+            self._refresh()
+            key = (name,) + args
+            if key not in self._results:
+                self._results[key] = getattr(self._stats, name)(*args)
+            return self._results[key]
+
+    def _refresh(self):
+        """Bring the ledger arrays up to date (caller holds the lock)"""
+        if self._ledger is None:
+            self._load()
+            return
+
+        if self._new_donations:
+            new = [d for d in self._new_donations if d.get('id', 0) > self._ledger.last_id]
+            self._new_donations = []
+            self._ledger.append(new)
+            self._results = {}
+
+        now = time.monotonic()
+        if now - self._last_check >= FINGERPRINT_CHECK_INTERVAL:
+            self._last_check = now
+            fingerprint = self.db.donation_fingerprint()
+            if fingerprint is not None and fingerprint != self._ledger.fingerprint():
+                self._load()
+
+    def _load(self):
+        """Load the ledger from scratch (caller holds the lock)"""
+        self._ledger = DonationLedgerArrays.from_database(self.db, self.batch_size)
+        self._stats = DonationStats(self._ledger)
+        self._results = {}
+        self._new_donations = []
+        self._last_check = time.monotonic()
@@ -8,6 +8,9 @@ from kivy.uix.widget import Widget
 from pathlib import Path
 import os
 
+# Campaign images are decoded in the background and shared per file and size
+from image_loader import get_image_loader
+
 # Colors from the image
 TEAL_COLOR = (26/255, 164/255, 159/255, 1)  # #1AA49F
 WHITE_COLOR = (1, 1, 1, 1)
@@ -50,7 +53,6 @@ class DonationWidget(BoxLayout):
         
         # Image at the top (using exact proportions from your image)
         self.image = Image(
-            source=image_source,
             allow_stretch=True,
             keep_ratio=True,
             size_hint=(1, None),
@@ -58,6 +60,9 @@ class DonationWidget(BoxLayout):
         )
         self.container.add_widget(self.image)
         
+        # Decode the image off the main thread, showing a placeholder meanwhile
+        get_image_loader().load(self.image, image_source, 190, owner=self)
+        
         # Title with proper styling
         self.title = Label(
             text=title,
@@ -69,6 +74,9 @@ class DonationWidget(BoxLayout):
             size_hint=(1, None),
             height=dp(50)
         )
+        # Wrap long campaign titles inside the card
+        self.title.bind(width=lambda instance, width: 
+                        setattr(instance, 'text_size', (width - dp(20), None)))
         self.container.add_widget(self.title)
         
         # Thank you message
@@ -150,6 +158,9 @@ if __name__ == "__main__":
     
     class DonationWidgetDemoApp(App):
         def build(self):
+            from app_bootstrap import bootstrap
+            bootstrap()
+            
             scroll_view = ScrollView(do_scroll_x=False)
             container = BoxLayout(
                 orientation='vertical',
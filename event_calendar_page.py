@@ -3,11 +3,8 @@ from kivy.uix.floatlayout import FloatLayout
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.scrollview import ScrollView
-from kivy.uix.image import Image
 from kivy.uix.label import Label
 from kivy.uix.button import Button
-from kivy.core.window import Window
-from kivy.utils import platform
 from kivy.metrics import dp, sp
 from kivy.graphics import Color, Rectangle, Line, RoundedRectangle
 from kivy.clock import Clock
@@ -17,15 +14,9 @@ import os
 import calendar
 from datetime import datetime, date
 
-# Device profile constants
-DEVICE_PROFILES = {
-    'small': {'width': 392, 'height': 759},  # Match the image proportions
-    'medium': {'width': 1080, 'height': 2340},  # Common smartphone size
-}
-
-# For mobile devices, let the system set the window size
-if platform not in ('android', 'ios'):
-    Window.size = (DEVICE_PROFILES['small']['width'], DEVICE_PROFILES['small']['height'])
+# Shared header and navigation bar
+from app_chrome import HeaderBar, EmptyNavigationBar, shared_chrome, chrome_height
+from resize_dispatcher import get_resize_dispatcher
 
 # Colors from the image
 TEAL_COLOR = (26/255, 164/255, 159/255, 1)  # #1AA49F
@@ -38,65 +29,6 @@ BLUE_COLOR = (0/255, 122/255, 255/255, 1)  # Blue for selected date
 
 # Path to assets
 ASSETS_PATH = Path(__file__).parent / Path(r"build\assets\frame9")
-NAVIGATION_ICONS_PATH = Path(__file__).parent / Path(r"navigation_icons")
-
-# Create navigation_icons directory if it doesn't exist
-if not os.path.exists(NAVIGATION_ICONS_PATH):
-    os.makedirs(NAVIGATION_ICONS_PATH)
-
-class HeaderBar(BoxLayout):
-    """Teal header bar with title and settings button"""
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.orientation = 'horizontal'
-        self.size_hint_y = None
-        self.height = dp(60)
-        self.padding = [dp(10), dp(5), dp(10), dp(5)]
-        
-        # Background color
-        with self.canvas.before:
-            Color(*TEAL_COLOR)
-            self.rect = Rectangle(pos=self.pos, size=self.size)
-        self.bind(pos=self._update_rect, size=self._update_rect)
-        
-        # Left - School logo
-        logo_path = os.path.join(ASSETS_PATH, "image_1.png")
-        self.logo = Image(
-            source=logo_path if os.path.exists(logo_path) else "",
-            size_hint=(None, 1),
-            width=dp(50),
-            allow_stretch=True,
-            keep_ratio=True
-        )
-        self.add_widget(self.logo)
-        
-        # Center - Event Calendar title
-        self.title = Label(
-            text="Event Calendar",
-            font_size=sp(22),
-            color=WHITE_COLOR,
-            halign='center',
-            valign='middle',
-            size_hint=(1, 1),
-            bold=True
-        )
-        self.add_widget(self.title)
-        
-        # Right - Settings gear icon
-        gear_path = os.path.join(ASSETS_PATH, "button_11.png")
-        self.settings_btn = Button(
-            background_normal=gear_path if os.path.exists(gear_path) else "",
-            background_color=(1, 1, 1, 1),
-            size_hint=(None, None),
-            size=(dp(40), dp(40)),
-            pos_hint={'center_y': 0.5}
-        )
-        self.add_widget(self.settings_btn)
-    
-    def _update_rect(self, instance, value):
-        """Update background when size changes"""
-        self.rect.pos = self.pos
-        self.rect.size = self.size
 
 class CalendarCell(Button):
     """A single day cell in the calendar grid"""
@@ -621,83 +553,6 @@ class AttendanceButtons(BoxLayout):
         print("User will not attend the event")
         # Here you could save the attendance response
 
-class EmptyNavigationBar(BoxLayout):
-    """Navigation bar with 5 empty slots ready to be populated"""
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.orientation = 'horizontal'
-        self.size_hint_y = None
-        self.height = dp(60)
-        self.padding = [dp(5), dp(5), dp(5), dp(5)]
-        
-        # Background color
-        with self.canvas.before:
-            Color(*WHITE_COLOR)
-            self.rect = Rectangle(pos=self.pos, size=self.size)
-            Color(0.9, 0.9, 0.9, 1)  # Light gray top border
-            self.border = Line(points=[0, 0, 0, 0], width=1)
-        self.bind(pos=self._update_canvas, size=self._update_canvas)
-        
-        # Store reference to slots
-        self.slots = []
-        
-        # Create 5 empty slots
-        for i in range(5):
-            slot = BoxLayout(orientation='vertical', size_hint=(1, 1))
-            self.add_widget(slot)
-            self.slots.append(slot)
-    
-    def add_icon_to_slot(self, slot_index, icon_source, text, icon_size=None, icon_pos_y=0.5):
-        """Add an icon and text to a specific slot"""
-        if 0 <= slot_index < len(self.slots):
-            # Clear any existing content in the slot
-            self.slots[slot_index].clear_widgets()
-            
-            # Create vertical layout for the icon and text
-            content_layout = BoxLayout(orientation='vertical', size_hint=(1, 1))
-            
-            # Default icon size
-            if icon_size is None:
-                icon_size = (dp(30), dp(30))
-            
-            # Add icon with adjustable vertical position
-            icon = Image(
-                source=icon_source,
-                size_hint=(None, None),
-                size=icon_size,
-                pos_hint={'center_x': 0.5, 'center_y': icon_pos_y}
-            )
-            
-            # Add icon container with increased height for more room
-            icon_container = FloatLayout(size_hint=(1, None), height=dp(45))
-            icon_container.add_widget(icon)
-            
-            # Add text with adjusted position
-            text_label = Label(
-                text=text,
-                font_size=sp(12),
-                size_hint=(1, None),
-                height=dp(15),
-                halign='center',
-                padding=(0, dp(-8))
-            )
-            
-            # Add widgets to content layout
-            content_layout.add_widget(icon_container)
-            content_layout.add_widget(text_label)
-            
-            # Add content layout to slot
-            self.slots[slot_index].add_widget(content_layout)
-    
-    def _update_canvas(self, instance, value):
-        """Update background and border when size changes"""
-        self.rect.pos = self.pos
-        self.rect.size = self.size
-        self.border.points = [
-            self.x, self.y + self.height - 1, 
-            self.x + self.width, self.y + self.height - 1
-        ]
-
 class EventCalendarContent(BoxLayout):
     """Content area for event calendar page"""
     def __init__(self, **kwargs):
@@ -736,6 +591,9 @@ class EventCalendarContent(BoxLayout):
 
 class EventCalendarPage(FloatLayout):
     """Main event calendar page layout"""
+    # Chrome the app's shared header and navigation bar show for this page
+    chrome_options = {'header': True, 'title': "Event Calendar", 'settings': True, 'navigation': True}
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         
@@ -745,84 +603,34 @@ class EventCalendarPage(FloatLayout):
             self.rect = Rectangle(pos=self.pos, size=self.size)
         self.bind(pos=self._update_rect, size=self._update_rect)
         
-        # Add header
-        self.header = HeaderBar(pos_hint={'top': 1})
-        self.add_widget(self.header)
-        
-        # Add navigation bar at bottom
-        self.nav = EmptyNavigationBar(pos_hint={'bottom': 1})
-        self.add_widget(self.nav)
-        
-        # Add icons to navigation bar
-        self._add_navigation_icons()
+        # Header and navigation come from the app's shared chrome when it has one
+        if shared_chrome() is None:
+            self.header = HeaderBar(
+                title="Event Calendar",
+                logo_path=os.path.join(ASSETS_PATH, "image_1.png"),
+                settings_icon=os.path.join(ASSETS_PATH, "button_11.png"),
+                pos_hint={'top': 1}
+            )
+            self.add_widget(self.header)
+            self.nav = EmptyNavigationBar(pos_hint={'bottom': 1})
+            self.add_widget(self.nav)
+            self.nav.add_default_icons(fallback_path=ASSETS_PATH)
+        else:
+            self.header = None
+            self.nav = None
+        header_height = chrome_height(self.header)
+        nav_height = chrome_height(self.nav)
         
         # Add content
         self.content = EventCalendarContent(
-            pos_hint={'x': 0, 'y': self.nav.height/self.height},
-            size_hint=(1, 1 - (self.header.height + self.nav.height) / self.height)
+            pos_hint={'x': 0, 'y': nav_height/self.height},
+            size_hint=(1, 1 - (header_height + nav_height) / self.height)
         )
         self.add_widget(self.content)
         
         # Handle window resize
         Clock.schedule_once(self._adjust_layout, 0.1)
-        Window.bind(on_resize=self._on_window_resize)
-    
-    def _add_navigation_icons(self):
-        """Add icons to navigation bar slots"""
-        # Add home icon to first slot
-        home_icon_path = os.path.join(NAVIGATION_ICONS_PATH, "home_icon.png")
-        if not os.path.exists(home_icon_path):
-            home_icon_path = os.path.join(ASSETS_PATH, "home_icon.png")
-        
-        if os.path.exists(home_icon_path):
-            self.nav.add_icon_to_slot(0, home_icon_path, "Home", icon_pos_y=0.3)
-        else:
-            self.nav.slots[0].add_widget(Label(text="Home", font_size=sp(14)))
-        
-        # Add donation icon to second slot
-        donation_icon_path = os.path.join(NAVIGATION_ICONS_PATH, "donation_icon.png")
-        if not os.path.exists(donation_icon_path):
-            donation_icon_path = os.path.join(ASSETS_PATH, "donation_icon.png")
-        
-        if os.path.exists(donation_icon_path):
-            self.nav.add_icon_to_slot(1, donation_icon_path, "Donation", icon_pos_y=0.3)
-        else:
-            self.nav.slots[1].add_widget(Label(text="Donation", font_size=sp(14)))
-        
-        # Add search icon to third slot
-        search_icon_path = os.path.join(NAVIGATION_ICONS_PATH, "search_icon.png")
-        if not os.path.exists(search_icon_path):
-            search_icon_path = os.path.join(ASSETS_PATH, "search_icon.png")
-        
-        if os.path.exists(search_icon_path):
-            self.nav.add_icon_to_slot(2, search_icon_path, "Search", icon_pos_y=0.3)
-        else:
-            self.nav.slots[2].add_widget(Label(text="Search", font_size=sp(14)))
-        
-        # Add calendar icon to fourth slot - highlighted
-        calendar_icon_path = os.path.join(NAVIGATION_ICONS_PATH, "calendar_icon.png")
-        if not os.path.exists(calendar_icon_path):
-            calendar_icon_path = os.path.join(ASSETS_PATH, "calendar_icon.png")
-        
-        if os.path.exists(calendar_icon_path):
-            self.nav.add_icon_to_slot(3, calendar_icon_path, "Event Calendar", 
-                                     icon_size=(dp(55), dp(55)),
-                                     icon_pos_y=0.3)
-        else:
-            self.nav.slots[3].add_widget(Label(text="Event Calendar", font_size=sp(12)))
-        
-        # Add profile icon to fifth slot
-        profile_icon_path = os.path.join(NAVIGATION_ICONS_PATH, "profile_icon.png")
-        if not os.path.exists(profile_icon_path):
-            profile_icon_path = os.path.join(ASSETS_PATH, "profile_icon.png")
-        
-        if os.path.exists(profile_icon_path):
-            profile_icon_size = dp(25)
-            self.nav.add_icon_to_slot(4, profile_icon_path, "Profile", 
-                                     icon_size=(profile_icon_size, profile_icon_size),
-                                     icon_pos_y=0.3)
-        else:
-            self.nav.slots[4].add_widget(Label(text="Profile", font_size=sp(13)))
+        get_resize_dispatcher().subscribe(self._on_window_resize)
     
     def _update_rect(self, instance, value):
         """Update background rectangle on size/position change"""
@@ -833,19 +641,22 @@ class EventCalendarPage(FloatLayout):
         """Initial layout adjustment"""
         if self.height > 0:  # Avoid division by zero
             # Update content area position and size
-            header_ratio = self.header.height / self.height
-            nav_ratio = self.nav.height / self.height
+            header_ratio = chrome_height(self.header) / self.height
+            nav_ratio = chrome_height(self.nav) / self.height
             self.content.pos_hint = {'x': 0, 'y': nav_ratio, 'top': 1 - header_ratio}
             self.content.size_hint = (1, 1 - header_ratio - nav_ratio)
     
-    def _on_window_resize(self, instance, width, height):
-        """Handle window resize by updating layout"""
+    def _on_window_resize(self, width, height):
+        """Handle window resize by updating layout (at most once per frame)"""
         if height > 0:  # Avoid division by zero
-            Clock.schedule_once(self._adjust_layout, 0.1)
+            self._adjust_layout(0)
 
 class EventCalendarApp(App):
     """Main application class for testing"""
     def build(self):
+        from app_bootstrap import bootstrap
+        bootstrap()
+        
         return EventCalendarPage()
 
 if __name__ == "__main__":
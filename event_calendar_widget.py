@@ -7,8 +7,6 @@ from kivy.uix.image import Image
 from kivy.uix.label import Label
 from kivy.uix.button import Button
 from kivy.uix.widget import Widget  # Add missing Widget import
-from kivy.core.window import Window
-from kivy.utils import platform
 from kivy.metrics import dp, sp
 from kivy.graphics import Color, Rectangle, Line, RoundedRectangle
 from kivy.clock import Clock
@@ -653,6 +651,9 @@ class EventCalendarWidget(BoxLayout):
 class EventCalendarWidgetApp(App):
     """Test application to demonstrate the widget"""
     def build(self):
+        from app_bootstrap import bootstrap
+        bootstrap()
+        
         widget = EventCalendarWidget()
         
         # You can set callbacks like this:
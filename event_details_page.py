@@ -5,8 +5,6 @@ from kivy.uix.gridlayout import GridLayout
 from kivy.uix.image import Image
 from kivy.uix.label import Label
 from kivy.uix.button import Button
-from kivy.core.window import Window
-from kivy.utils import platform
 from kivy.metrics import dp, sp
 from kivy.graphics import Color, Rectangle, Line, RoundedRectangle
 from kivy.clock import Clock
@@ -15,15 +13,10 @@ from pathlib import Path
 import os
 from datetime import datetime
 
-# Device profile constants
-DEVICE_PROFILES = {
-    'small': {'width': 392, 'height': 759},  # Match the image proportions
-    'medium': {'width': 1080, 'height': 2340},  # Common smartphone size
-}
-
-# For mobile devices, let the system set the window size
-if platform not in ('android', 'ios'):
-    Window.size = (DEVICE_PROFILES['small']['width'], DEVICE_PROFILES['small']['height'])
+# Shared header bar, and background image loading with placeholders
+from app_chrome import HeaderBar, shared_chrome, chrome_height
+from image_loader import get_image_loader
+from resize_dispatcher import get_resize_dispatcher
 
 # Colors from the image
 TEAL_COLOR = (26/255, 164/255, 159/255, 1)  # #1AA49F
@@ -37,66 +30,11 @@ PURPLE_COLOR = (81/255, 45/255, 168/255, 1)  # Purple for event title
 
 # Path to assets
 ASSETS_PATH = Path(__file__).parent / Path(r"build\assets\frame11")
-NAVIGATION_ICONS_PATH = Path(__file__).parent / Path(r"navigation_icons")
-
-# Create assets directory if it doesn't exist
-if not os.path.exists(ASSETS_PATH):
-    os.makedirs(ASSETS_PATH)
-
-# Create navigation_icons directory if it doesn't exist
-if not os.path.exists(NAVIGATION_ICONS_PATH):
-    os.makedirs(NAVIGATION_ICONS_PATH)
-
-class HeaderBar(BoxLayout):
-    """Teal header bar with title"""
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.orientation = 'horizontal'
-        self.size_hint_y = None
-        self.height = dp(60)
-        self.padding = [dp(10), dp(5), dp(10), dp(5)]
-        
-        # Background color
-        with self.canvas.before:
-            Color(*TEAL_COLOR)
-            self.rect = Rectangle(pos=self.pos, size=self.size)
-        self.bind(pos=self._update_rect, size=self._update_rect)
-        
-        # Left - School logo
-        logo_path = os.path.join(ASSETS_PATH, "image_1.png")
-        self.logo = Image(
-            source=logo_path if os.path.exists(logo_path) else "",
-            size_hint=(None, 1),
-            width=dp(50),
-            allow_stretch=True,
-            keep_ratio=True
-        )
-        self.add_widget(self.logo)
-        
-        # Center - Event Calendar title
-        self.title = Label(
-            text="Event Calendar",
-            font_size=sp(22),
-            color=WHITE_COLOR,
-            halign='center',
-            valign='middle',
-            size_hint=(1, 1),
-            bold=True
-        )
-        self.add_widget(self.title)
-        
-        # Right - Empty space (settings button removed)
-        spacer = Widget(size_hint=(None, None), width=dp(50))
-        self.add_widget(spacer)
-    
-    def _update_rect(self, instance, value):
-        """Update background when size changes"""
-        self.rect.pos = self.pos
-        self.rect.size = self.size
 
 class EventDetailsContent(BoxLayout):
     """Fixed content area for event details with responsive layout"""
     def __init__(self, **kwargs):
+        from kivy.core.window import Window
         super().__init__(**kwargs)
         self.orientation = 'vertical'
         self.padding = [dp(15), dp(10), dp(15), dp(15)]
@@ -127,13 +65,15 @@ class EventDetailsContent(BoxLayout):
         # Event image with proper sizing
         event_image_path = os.path.join(ASSETS_PATH, "image_2.png")
         self.event_image = Image(
-            source=event_image_path if os.path.exists(event_image_path) else "",
             size_hint=(1, None),
             height=dp(200),  # Fixed height like donation page
             allow_stretch=True,
             keep_ratio=True
         )
         
+        # Decode the image off the main thread, showing a placeholder meanwhile
+        get_image_loader().load(self.event_image, event_image_path, 200, owner=self)
+        
         # Round the corners of the image container
         with self.event_image.canvas.before:
             Color(1, 1, 1, 1)
@@ -311,11 +251,24 @@ class EventDetailsContent(BoxLayout):
         
         self.add_widget(self.details_section)
         
+        # Door check-in for this event, for organizers with a QR scanner
+        self.checkin_btn = Button(
+            text="Check-in Mode",
+            font_size=sp(16),
+            color=WHITE_COLOR,
+            background_normal='',
+            background_color=TEAL_COLOR,
+            size_hint=(1, None),
+            height=dp(45)
+        )
+        self.checkin_btn.bind(on_press=self.on_checkin)
+        self.add_widget(self.checkin_btn)
+        
         # Add spacer to push everything up properly
         self.add_widget(Widget(size_hint=(1, 1)))
         
-        # Bind window resize to update layout
-        Window.bind(on_resize=self._adjust_layout)
+        # Update layout when the window is resized
+        get_resize_dispatcher().subscribe(self._adjust_layout)
     
     def on_back(self, instance):
         """Handle back button press - return to calendar page"""
@@ -348,7 +301,25 @@ class EventDetailsContent(BoxLayout):
             except ImportError:
                 print("Could not navigate back - event_calendar_page not found")
 
-    def _adjust_layout(self, instance, width, height):
+    def event_date(self):
+        """Shown date as YYYY-MM-DD, the form RSVPs and check-ins are stored in"""
+        try:
+            return datetime.strptime(self.date_value.text.strip(), "%d %B %Y").strftime("%Y-%m-%d")
+        except ValueError:
+            return self.date_value.text.strip()
+    
+    def on_checkin(self, instance):
+        """Open check-in mode for the event shown"""
+        from checkin_page import show_checkin
+        app = App.get_running_app()
+        
+        # Check-in is its own screen, so it needs the app's ScreenManager
+        if hasattr(app.root, 'current') and hasattr(app.root, 'has_screen'):
+            show_checkin(app.root, self.event_title.text, self.event_date())
+        else:
+            print("Check-in mode needs the app's screen manager")
+    
+    def _adjust_layout(self, width, height):
         """Adjust layout elements when window is resized"""
         # Update text size constraints
         self.event_title.text_size = (width - dp(40), None)
@@ -369,6 +340,7 @@ class EventDetailsContent(BoxLayout):
     
     def _update_separator(self, instance, value):
         """Update separator line when size/position changes"""
+        from kivy.core.window import Window
         with instance.canvas:
             instance.canvas.clear()
             Color(*LIGHT_TEXT_COLOR)
@@ -377,7 +349,11 @@ class EventDetailsContent(BoxLayout):
 
 class EventDetailsPage(FloatLayout):
     """Main event details page layout"""
+    # Chrome the app's shared header bar shows for this page
+    chrome_options = {'header': True, 'title': "Event Calendar", 'settings': False}
+    
     def __init__(self, **kwargs):
+        from kivy.core.window import Window
         super().__init__(**kwargs)
         
         # White background
@@ -386,20 +362,29 @@ class EventDetailsPage(FloatLayout):
             self.rect = Rectangle(pos=self.pos, size=self.size)
         self.bind(pos=self._update_rect, size=self._update_rect)
         
-        # Add header
-        self.header = HeaderBar(pos_hint={'top': 1})
-        self.add_widget(self.header)
+        # The header comes from the app's shared chrome when it has one
+        if shared_chrome() is None:
+            self.header = HeaderBar(
+                title="Event Calendar",
+                settings=False,
+                logo_path=os.path.join(ASSETS_PATH, "image_1.png"),
+                pos_hint={'top': 1}
+            )
+            self.add_widget(self.header)
+        else:
+            self.header = None
+        header_height = chrome_height(self.header)
         
         # Add content with proper positioning (removed the old back button)
         self.content = EventDetailsContent(
             pos_hint={'x': 0, 'y': 0},
-            size_hint=(1, 1 - self.header.height / Window.height)
+            size_hint=(1, 1 - header_height / Window.height)
         )
         self.add_widget(self.content)
         
         # Handle window resize
         Clock.schedule_once(self._adjust_layout, 0.1)
-        Window.bind(on_resize=self._on_window_resize)
+        get_resize_dispatcher().subscribe(self._on_window_resize)
         
     def _update_rect(self, instance, value):
         """Update background rectangle on size/position change"""
@@ -410,17 +395,20 @@ class EventDetailsPage(FloatLayout):
         """Initial layout adjustment"""
         if self.height > 0:  # Avoid division by zero
             # Update content area size (no navigation bar anymore)
-            header_ratio = self.header.height / self.height
+            header_ratio = chrome_height(self.header) / self.height
             self.content.size_hint = (1, 1 - header_ratio)
     
-    def _on_window_resize(self, instance, width, height):
-        """Handle window resize by updating layout"""
+    def _on_window_resize(self, width, height):
+        """Handle window resize by updating layout (at most once per frame)"""
         if height > 0:  # Avoid division by zero
-            Clock.schedule_once(self._adjust_layout, 0.1)
+            self._adjust_layout(0)
 
 class EventDetailsApp(App):
     """Main application class for testing"""
     def build(self):
+        from app_bootstrap import bootstrap
+        bootstrap(asset_dirs=(ASSETS_PATH,))
+        
         return EventDetailsPage()
 
 if __name__ == "__main__":
@@ -0,0 +1,133 @@
+import csv
+import math
+from pathlib import Path
+
+from name_matching import normalize_name
+
+# Local gazetteer: one place per row with name, province, latitude, longitude
+GAZETTEER_PATH = Path(__file__).parent / "data" / "gazetteer.csv"
+
+# Side of a grid cell in degrees (about 11 km of latitude)
+GEO_CELL_DEGREES = 0.1
+
+# "Near me" radius, and the largest radius a lookup may ask for
+NEARBY_RADIUS_KM = 25
+MAX_NEARBY_RADIUS_KM = 100
+
+KM_PER_DEGREE = 111.32
+EARTH_RADIUS_KM = 6371.0
+
+# Longest run of words tried as a place name in a free-form address
+MAX_PLACE_WORDS = 4
+
+def _strip_city(name):
+    """Place name without a leading "city of" or a trailing "city" word"""
+    if name.startswith("city of "):
+        return name[len("city of "):]
+    if name.endswith(" city"):
+        return name[:-len(" city")]
+    return name
+
+class Gazetteer:
+    """Offline geocoder over the local gazetteer file
+
+    Addresses are matched at the city or municipality level: each
+    comma-separated part is looked up by normalized name (so "Las
+    Piñas" and "las pinas" match, and "Cebu City" matches "Cebu"),
+    and a province named elsewhere in the address picks between
+    places with the same name. Addresses without commas are scanned
+    for the longest run of words that is a place name.
+    """
+    def __init__(self, path=GAZETTEER_PATH):
+        self.path = Path(path)
+        self.places = {}  # normalized name -> list of places
+        self._load()
+
+    def _load(self):
+        """Read the gazetteer into the name index"""
+        try:
+            with open(self.path, newline="", encoding="utf-8") as f:
+                for row in csv.DictReader(f):
+                    place = {
+                        "place": row["name"],
+                        "province": row["province"],
+                        "latitude": float(row["latitude"]),
+                        "longitude": float(row["longitude"]),
+                    }
+                    name = normalize_name(row["name"])
+                    for key in {name, _strip_city(name)}:
+                        self.places.setdefault(key, []).append(place)
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Error loading gazetteer {self.path}: {e}")
+
+    def geocode(self, address):
+        """Return the place an address is in, or None if it is not known"""
+        parts = [normalize_name(part) for part in (address or "").split(",")]
+        parts = [part for part in parts if part]
+
+        # Comma-separated parts, most specific first
+        for part in parts:
+            place = self._lookup(part, parts)
+            if place:
+                return place
+
+        # No part is a place name on its own; try runs of words, longest first
+        words = " ".join(parts).split()
+        for size in range(min(MAX_PLACE_WORDS, len(words)), 0, -1):
+            for start in range(len(words) - size, -1, -1):
+                place = self._lookup(" ".join(words[start:start + size]), parts)
+                if place:
+                    return place
+        return None
+
+    def _lookup(self, name, parts):
+        """Place with a normalized name, preferring one whose province is in parts"""
+        places = self.places.get(name) or self.places.get(_strip_city(name))
+        if not places:
+            return None
+        address_text = " ".join(parts)
+        for place in places:
+            if normalize_name(place["province"]) in address_text:
+                return dict(place)
+        return dict(places[0])
+
+def grid_cell(latitude, longitude):
+    """Key of the grid cell containing a point, such as "145:1209" for Manila"""
+    return f"{math.floor(latitude / GEO_CELL_DEGREES)}:{math.floor(longitude / GEO_CELL_DEGREES)}"
+
+def neighborhood_cells(latitude, longitude, radius_km):
+    """Keys of every grid cell within radius_km of a point
+
+    The cells cover the bounding box of the circle, so a lookup reads
+    only those cells' rows and the exact distance is checked after.
+    """
+    radius_km = min(radius_km, MAX_NEARBY_RADIUS_KM)
+    lat_delta = radius_km / KM_PER_DEGREE
+    lon_delta = radius_km / (KM_PER_DEGREE * max(math.cos(math.radians(latitude)), 0.01))
+
+    lat_low = math.floor(max(latitude - lat_delta, -90) / GEO_CELL_DEGREES)
+    lat_high = math.floor(min(latitude + lat_delta, 90) / GEO_CELL_DEGREES)
+    lon_low = math.floor((longitude - lon_delta) / GEO_CELL_DEGREES)
+    lon_high = math.floor((longitude + lon_delta) / GEO_CELL_DEGREES)
+    return [
+        f"{lat}:{lon}"
+        for lat in range(lat_low, lat_high + 1)
+        for lon in range(lon_low, lon_high + 1)
+    ]
+
+def distance_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance between two points"""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (math.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+# Shared gazetteer, loaded on first geocode
+_gazetteer = None
+
+def get_gazetteer():
+    """Return the shared gazetteer, loading it on first use"""
+    global _gazetteer
+    if _gazetteer is None:
+        _gazetteer = Gazetteer()
+    return _gazetteer
@@ -0,0 +1,145 @@
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from kivy.clock import Clock
+
+from texture_cache import display_size, peek_texture, store_texture
+from thumbnails import thumbnail
+
+# Images decoded at the same time
+LOADER_WORKERS = 2
+
+# Light gray shown until the real image arrives
+PLACEHOLDER_COLOR = (235, 235, 235, 255)
+
+class ImageRequest:
+    """One pending image load for an Image widget
+
+    The file is picked (thumbnail) and decoded on a worker thread; the
+    texture is created and assigned on the main thread. If the owning
+    widget leaves the widget tree before the work starts, the load is
+    dropped and resumed when it is added again.
+    """
+    def __init__(self, loader, image, path, height_dp, owner):
+        self.loader = loader
+        self.image_ref = weakref.ref(image)
+        self.owner_ref = weakref.ref(owner)
+        self.path = path
+        self.height_dp = height_dp
+        self.size = display_size(height_dp)
+        self.future = None
+        self.cancelled = False
+        self.suspended = False
+        owner.bind(parent=self._on_owner_parent)
+
+    def start(self):
+        """Queue the decode on the worker pool"""
+        self.suspended = False
+        self.future = self.loader.executor.submit(self._decode)
+        self.future.add_done_callback(
+            lambda future: Clock.schedule_once(lambda dt: self._finish(future)))
+
+    def cancel(self):
+        """Drop the load; the widget keeps whatever it shows now"""
+        self.cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+        self._release_owner()
+
+    def _decode(self):
+        """Worker thread: choose the file and decode it without touching GL"""
+        from kivy.core.image import ImageLoader
+
+        if self.cancelled:
+            return None
+        source = thumbnail(self.path, self.height_dp)
+        return ImageLoader.load(str(source), keep_data=True, nocache=True)
+
+    def _finish(self, future):
+        """Main thread: turn the decoded image into a texture and show it"""
+        if self.cancelled or future.cancelled():
+            return
+        image = self.image_ref()
+        if image is None or self.loader.requests.get(image) is not self:
+            return
+        del self.loader.requests[image]
+        self._release_owner()
+
+        try:
+            data = future.result()
+        except Exception as e:
+            print(f"Error loading image {self.path}: {e}")
+            return
+        if data is not None:
+            image.texture = store_texture(self.path, self.size, data.texture)
+
+    def _on_owner_parent(self, owner, parent):
+        """Pause the load while the owner is out of the tree, resume after"""
+        if parent is None:
+            if self.future is not None and self.future.cancel():
+                self.suspended = True
+        elif self.suspended and not self.cancelled:
+            self.start()
+
+    def _release_owner(self):
+        """Stop watching the owner widget"""
+        owner = self.owner_ref()
+        if owner is not None:
+            owner.unbind(parent=self._on_owner_parent)
+
+class AsyncImageLoader:
+    """Loads campaign and event images off the main thread
+
+    load() shows a cached texture straight away when there is one;
+    otherwise the widget gets a placeholder and the image is decoded
+    on a small, bounded worker pool. A newer load for the same widget,
+    or cancel(), drops the older one.
+    """
+    def __init__(self, max_workers=LOADER_WORKERS):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image-loader")
+        self.requests = weakref.WeakKeyDictionary()
+        self._placeholder = None
+
+    def placeholder(self):
+        """Shared placeholder texture"""
+        if self._placeholder is None:
+            from kivy.graphics.texture import Texture
+            self._placeholder = Texture.create(size=(1, 1), colorfmt='rgba')
+            self._placeholder.blit_buffer(bytes(PLACEHOLDER_COLOR), colorfmt='rgba', bufferfmt='ubyte')
+        return self._placeholder
+
+    def load(self, image, path, height_dp, owner=None):
+        """Show path in an Image widget drawn height_dp tall, without blocking"""
+        self.cancel(image)
+
+        if not path or not os.path.exists(path):
+            image.texture = None
+            return None
+
+        texture = peek_texture(path, display_size(height_dp))
+        if texture is not None:
+            image.texture = texture
+            return None
+
+        image.texture = self.placeholder()
+        request = ImageRequest(self, image, path, height_dp, owner or image)
+        self.requests[image] = request
+        request.start()
+        return request
+
+    def cancel(self, image):
+        """Cancel the pending load of an Image widget, if any"""
+        request = self.requests.pop(image, None)
+        if request is not None:
+            request.cancel()
+
+# Shared loader used by the pages
+_image_loader = None
+
+def get_image_loader():
+    """Return the shared image loader, creating it on first use"""
+    global _image_loader
+    if _image_loader is None:
+        _image_loader = AsyncImageLoader()
+    return _image_loader
@@ -0,0 +1,74 @@
+import re
+import unicodedata
+from functools import lru_cache
+
+# Trigrams are taken from each word padded like " ivan ", so the start
+# and end of a word count as well as its middle
+TRIGRAM_PADDING = " "
+
+# Distinct word pairs whose similarity is remembered; names share words
+# so reranking many candidates mostly hits the cache
+WORD_SIMILARITY_CACHE_SIZE = 65536
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+def normalize_name(name):
+    """Lowercase a name and strip accents and punctuation"""
+    text = unicodedata.normalize("NFKD", name or "")
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(_WORD_RE.findall(text.lower()))
+
+def sorted_name(name):
+    """Normalized name with its words sorted, so word order doesn't matter
+
+    "Alejandino, Ivan Ray" and "Ivan Ray Alejandino" give the same value.
+    """
+    return " ".join(sorted(normalize_name(name).split()))
+
+def name_trigrams(name):
+    """Set of padded three-letter substrings of every word in a name"""
+    trigrams = set()
+    for word in normalize_name(name).split():
+        padded = TRIGRAM_PADDING + word + TRIGRAM_PADDING
+        for i in range(len(padded) - 2):
+            trigrams.add(padded[i:i + 3])
+    return trigrams
+
+def levenshtein(a, b):
+    """Edit distance between two strings"""
+    if len(a) < len(b):
+        a, b = b, a
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,                       # deletion
+                current[j - 1] + 1,                    # insertion
+                previous[j - 1] + (char_a != char_b)   # substitution
+            ))
+        previous = current
+    return previous[-1]
+
+@lru_cache(maxsize=WORD_SIMILARITY_CACHE_SIZE)
+def _word_similarity(a, b):
+    """Similarity of two words from 0 to 1"""
+    return 1.0 - levenshtein(a, b) / max(len(a), len(b))
+
+def name_similarity(query, name):
+    """Similarity of two names from 0 to 1, ignoring case, accents and word order
+
+    The better of two scores is used: the whole names compared, and
+    each query word against its closest word in the name, so a query
+    with only a surname still scores well against a full name.
+    """
+    a = sorted_name(query)
+    b = sorted_name(name)
+    if not a or not b:
+        return 0.0
+    whole = _word_similarity(a, b)
+
+    name_words = b.split()
+    per_word = [max(_word_similarity(word, other) for other in name_words) for word in a.split()]
+    return max(whole, sum(per_word) / len(per_word))
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+
+# Page instances kept per cache; beyond this the least recently used page is reused
+MAX_CACHED_PAGES = 4
+
+class PageCache:
+    """LRU cache of campaign page instances keyed by (image_path, title)
+
+    Revisiting a campaign returns the page that was already built for
+    it. When the cache is full, the least recently used page is rebound
+    to the new campaign with set_campaign() instead of building another
+    page, so image loads and canvas setup happen at most max_pages times.
+    """
+    def __init__(self, page_class, max_pages=MAX_CACHED_PAGES):
+        self.page_class = page_class
+        self.max_pages = max_pages
+        self.pages = OrderedDict()
+
+    def get(self, image_path, title):
+        """Return a page showing the campaign, reusing a cached one if possible"""
+        key = (image_path, title)
+        page = self.pages.get(key)
+        if page is not None:
+            self.pages.move_to_end(key)
+            return page
+
+        if len(self.pages) >= self.max_pages:
+            # Recycle the least recently used page for this campaign
+            _, page = self.pages.popitem(last=False)
+            page.set_campaign(image_path, title)
+        else:
+            page = self.page_class(image_path=image_path, title=title)
+        self.pages[key] = page
+        return page
+
+    def show(self, sm, screen_name, image_path, title):
+        """Put the campaign's page on the named screen and switch to it"""
+        from kivy.uix.screenmanager import Screen
+
+        page = self.get(image_path, title)
+
+        # Keep a single screen and swap the page it hosts
+        if sm.has_screen(screen_name):
+            screen = sm.get_screen(screen_name)
+        else:
+            screen = Screen(name=screen_name)
+            sm.add_widget(screen)
+
+        if page.parent is not screen:
+            if page.parent is not None:
+                page.parent.remove_widget(page)
+            screen.clear_widgets()
+            screen.add_widget(page)
+
+        sm.current = screen_name
+        return page
+
+    def clear(self):
+        """Forget every cached page"""
+        self.pages.clear()
@@ -0,0 +1,274 @@
+import asyncio
+import itertools
+import random
+import secrets
+import threading
+import time
+
+# Payment client settings
+DEFAULT_TIMEOUT = 5.0  # Seconds allowed for a single gateway call
+DEFAULT_MAX_RETRIES = 3
+RETRY_BASE_DELAY = 0.5  # Seconds, doubled after every failed attempt
+RETRY_MAX_DELAY = 8.0
+MAX_CONCURRENT_PAYMENTS = 4  # Payments allowed in flight at the same time
+
+# Circuit breaker settings
+FAILURE_THRESHOLD = 5
+RESET_TIMEOUT = 30.0  # Seconds before a tripped breaker lets a trial call through
+
+class PaymentError(Exception):
+    """Transient payment failure that is safe to retry"""
+
+class GatewayTimeout(PaymentError):
+    """The gateway did not answer in time"""
+
+class CircuitOpenError(PaymentError):
+    """The circuit breaker is refusing calls to a failing gateway"""
+
+class PaymentAdapter:
+    """Interface every payment gateway adapter implements
+
+    charge() is a coroutine that takes a payment request dict with
+    'reference', 'amount', 'currency', 'description' and
+    'idempotency_key', and returns a result dict with 'status'
+    ('approved' or 'declined'), 'transaction_id' and 'message'.
+    Transient problems are raised as PaymentError so they can be
+    retried; a declined card is a normal result, not an error.
+    """
+    name = "adapter"
+
+    async def charge(self, request):
+        raise NotImplementedError
+
+class LocalGateway(PaymentAdapter):
+    """In-process stand-in gateway for development and tests
+
+    Simulates network latency, random transient failures and declines
+    above a per-transaction limit. Charges are remembered by
+    idempotency key so a retried request never charges twice.
+    """
+    name = "local"
+
+    def __init__(self, latency=(0.2, 0.8), failure_rate=0.1, decline_above=100000, seed=None):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.decline_above = decline_above
+        self.random = random.Random(seed)
+        self.charges = {}
+        self._ids = itertools.count(1)
+
+    async def charge(self, request):
+        await asyncio.sleep(self.random.uniform(*self.latency))
+
+        # Replay the stored answer for a retried request
+        key = request['idempotency_key']
+        if key in self.charges:
+            return self.charges[key]
+
+        if self.random.random() < self.failure_rate:
+            raise PaymentError("Local gateway temporarily unavailable")
+
+        if request['amount'] > self.decline_above:
+            result = {
+                'status': 'declined',
+                'transaction_id': None,
+                'message': "Amount exceeds the per-transaction limit"
+            }
+        else:
+            result = {
+                'status': 'approved',
+                'transaction_id': f"LOCAL-{next(self._ids):06d}",
+                'message': "Payment approved"
+            }
+        self.charges[key] = result
+        return result
+
+class CircuitBreaker:
+    """Stops calling a gateway after repeated failures
+
+    After failure_threshold consecutive failures the breaker opens and
+    rejects calls immediately. Once reset_timeout has passed it lets a
+    single trial call through; success closes it again.
+    """
+    def __init__(self, failure_threshold=FAILURE_THRESHOLD, reset_timeout=RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_running = False
+
+    def allow(self):
+        """Return True if a call may be attempted now"""
+        if self.state == 'closed':
+            return True
+        if self.state == 'open' and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = 'half_open'
+        if self.state == 'half_open' and not self._trial_running:
+            self._trial_running = True
+            return True
+        return False
+
+    def record_success(self):
+        """Close the breaker after a successful call"""
+        self.state = 'closed'
+        self.failures = 0
+        self._trial_running = False
+
+    def record_failure(self):
+        """Count a failure and open the breaker if needed"""
+        self.failures += 1
+        self._trial_running = False
+        if self.state == 'half_open' or self.failures >= self.failure_threshold:
+            self.state = 'open'
+            self.opened_at = time.monotonic()
+
+class PaymentClient:
+    """Asynchronous payment client running on its own event loop thread
+
+    submit() returns straight away with a concurrent.futures.Future, so
+    the UI thread never waits on the gateway. Up to max_concurrent
+    payments are pipelined to the gateway at once; each one gets a
+    timeout, retries with jittered exponential backoff and goes through
+    a shared circuit breaker.
+    """
+    def __init__(self, adapter=None, timeout=DEFAULT_TIMEOUT, max_retries=DEFAULT_MAX_RETRIES,
+                 max_concurrent=MAX_CONCURRENT_PAYMENTS, breaker=None):
+        self.adapter = adapter or LocalGateway()
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_concurrent = max_concurrent
+        self.breaker = breaker or CircuitBreaker()
+
+        self._loop = None
+        self._thread = None
+        self._semaphore = None
+        self._started = threading.Event()
+
+    def start(self):
+        """Start the background event loop"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run_loop, name="payment-client", daemon=True)
+        self._thread.start()
+        self._started.wait()
+
+    def stop(self):
+        """Cancel payments still in flight, then stop the background event loop"""
+        if self._loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._cancel_pending(), self._loop).result(5)
+        except Exception as e:
+            print(f"Error cancelling pending payments: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(5)
+        self._loop = None
+        self._thread = None
+        self._started.clear()
+
+    def set_adapter(self, adapter):
+        """Swap the gateway adapter and reset the circuit breaker"""
+        self.adapter = adapter
+        self.breaker = CircuitBreaker(self.breaker.failure_threshold, self.breaker.reset_timeout)
+
+    def submit(self, amount, description, reference=None, currency="PHP", on_complete=None):
+        """Queue a payment and return a Future for its result
+
+        on_complete, if given, is called with the result dict from the
+        payment thread; UI code should hop back to the main thread
+        (e.g. with Clock.schedule_once) before touching widgets.
+        """
+        self.start()
+        request = {
+            'reference': reference or f"PAY-{secrets.token_hex(4).upper()}",
+            'amount': float(amount),
+            'currency': currency,
+            'description': description,
+            'idempotency_key': secrets.token_hex(16)
+        }
+        future = asyncio.run_coroutine_threadsafe(self._process(request), self._loop)
+        if on_complete:
+            future.add_done_callback(lambda f: on_complete(self._result(f, request)))
+        return future
+
+    def submit_many(self, payments):
+        """Pipeline several (amount, description) payments at once"""
+        return [self.submit(amount, description) for amount, description in payments]
+
+    def _result(self, future, request):
+        """Result dict of a finished payment future; a cancelled payment counts as failed"""
+        if future.cancelled():
+            return {'status': 'error', 'transaction_id': None, 'message': "Payment was cancelled",
+                    'reference': request['reference'], 'amount': request['amount']}
+        return future.result()
+
+    async def _cancel_pending(self):
+        """Cancel every other task on the loop and wait for them to unwind"""
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _run_loop(self):
+        """Body of the event loop thread"""
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        self._started.set()
+        self._loop.run_forever()
+        self._loop.close()
+
+    async def _process(self, request):
+        """Charge one request, never raising to the caller"""
+        async with self._semaphore:
+            try:
+                result = await self._charge_with_retries(request)
+            except PaymentError as e:
+                result = {'status': 'error', 'transaction_id': None, 'message': str(e)}
+            except Exception as e:
+                print(f"Unexpected payment error: {e}")
+                result = {'status': 'error', 'transaction_id': None, 'message': "Payment failed"}
+        result['reference'] = request['reference']
+        result['amount'] = request['amount']
+        return result
+
+    async def _charge_with_retries(self, request):
+        """Call the adapter with timeout, retries and the circuit breaker"""
+        last_error = None
+        for attempt in range(self.max_retries + 1):
+            if not self.breaker.allow():
+                raise CircuitOpenError("Payment service is unavailable, please try again later")
+
+            try:
+                result = await asyncio.wait_for(self.adapter.charge(request), self.timeout)
+            except asyncio.TimeoutError:
+                last_error = GatewayTimeout(f"{self.adapter.name} gateway timed out")
+                self.breaker.record_failure()
+            except PaymentError as e:
+                last_error = e
+                self.breaker.record_failure()
+            except BaseException:
+                # Adapter bugs and cancellation must not leave a half-open trial running forever
+                self.breaker.record_failure()
+                raise
+            else:
+                self.breaker.record_success()
+                return result
+
+            if attempt < self.max_retries:
+                # Full jitter keeps retries from many clients from lining up
+                delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt))
+                await asyncio.sleep(random.uniform(0, delay))
+
+        raise last_error
+
+# Shared client used by the donation pages
+_payment_client = None
+
+def get_payment_client():
+    """Return the shared payment client, creating it on first use"""
+    global _payment_client
+    if _payment_client is None:
+        _payment_client = PaymentClient()
+    return _payment_client
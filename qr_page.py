@@ -0,0 +1,196 @@
+from kivy.uix.screenmanager import Screen
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.anchorlayout import AnchorLayout
+from kivy.uix.image import Image
+from kivy.uix.label import Label
+from kivy.uix.button import Button
+from kivy.uix.textinput import TextInput
+from kivy.uix.widget import Widget
+from kivy.metrics import dp, sp
+from kivy.graphics import Color, Rectangle
+from kivy.clock import Clock
+import threading
+
+# Shared header bar, signed QR payloads and the signed-in user
+from app_chrome import HeaderBar, shared_chrome
+from qr_payload import get_qr_payloads
+from session import get_session, format_batch
+
+# Colors from the image
+TEAL_COLOR = (26/255, 164/255, 159/255, 1)  # #1AA49F
+WHITE_COLOR = (1, 1, 1, 1)
+DARK_TEXT_COLOR = (0.2, 0.2, 0.2, 1)
+LIGHT_TEXT_COLOR = (0.5, 0.5, 0.5, 1)
+ERROR_TEXT_COLOR = (0.8, 0.2, 0.2, 1)
+
+QR_IMAGE_SIZE = 220  # dp
+
+class QRCodePage(Screen):
+    """The signed-in alumnus's QR code, and a field to look up a scanned one
+
+    The QR image is drawn once and then read from the disk cache, on a
+    background thread so entering the page never waits for it. Scanned
+    codes are typed into the lookup field (handheld scanners type the
+    code and press Enter) and resolved with an HMAC check and one
+    primary-key lookup, also on a background thread.
+    """
+    # Chrome the app's shared header bar shows for this page
+    chrome_options = {'header': True, 'title': "QR Code", 'settings': False}
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        layout = BoxLayout(orientation='vertical')
+        self.add_widget(layout)
+
+        # White background
+        with layout.canvas.before:
+            Color(*WHITE_COLOR)
+            self.rect = Rectangle(pos=layout.pos, size=layout.size)
+        layout.bind(pos=self._update_rect, size=self._update_rect)
+
+        # The header comes from the app's shared chrome when it has one
+        if shared_chrome() is None:
+            layout.add_widget(HeaderBar(title="QR Code", settings=False))
+
+        content = BoxLayout(orientation='vertical', padding=[dp(20), dp(10), dp(20), dp(20)], spacing=dp(10))
+        layout.add_widget(content)
+
+        # Back button at the top-left
+        back_btn = Button(
+            text="< Back",
+            font_size=sp(18),
+            color=TEAL_COLOR,
+            background_color=(0, 0, 0, 0),  # Transparent background
+            size_hint=(None, None),
+            size=(dp(80), dp(30))
+        )
+        back_btn.bind(on_press=self.on_back)
+        content.add_widget(back_btn)
+
+        # My QR code
+        self.name_label = self._label(sp(20), DARK_TEXT_COLOR, dp(30), bold=True)
+        content.add_widget(self.name_label)
+
+        qr_container = AnchorLayout(size_hint=(1, None), height=dp(QR_IMAGE_SIZE))
+        self.qr_image = Image(size_hint=(None, None), size=(dp(QR_IMAGE_SIZE), dp(QR_IMAGE_SIZE)), opacity=0)
+        qr_container.add_widget(self.qr_image)
+        content.add_widget(qr_container)
+
+        self.payload_label = self._label(sp(13), LIGHT_TEXT_COLOR, dp(20))
+        content.add_widget(self.payload_label)
+
+        content.add_widget(Widget(size_hint_y=None, height=dp(10)))
+
+        # Lookup of a scanned code
+        content.add_widget(self._label(sp(16), DARK_TEXT_COLOR, dp(25), text="Scan a batchmate's code", bold=True))
+        self.scan_input = TextInput(
+            hint_text="Scan or type a QR code",
+            size_hint_y=None,
+            height=dp(40),
+            multiline=False
+        )
+        self.scan_input.bind(on_text_validate=self.on_scan)
+        content.add_widget(self.scan_input)
+
+        self.result_label = self._label(sp(15), DARK_TEXT_COLOR, dp(50))
+        content.add_widget(self.result_label)
+
+        content.add_widget(Widget(size_hint_y=1))
+
+        # User whose code is shown, so re-entering the page does no work
+        self.shown_user_id = None
+
+        # Latest scanned code; older lookups finishing late are dropped
+        self.scanned_code = None
+
+    def _label(self, font_size, color, height, text="", bold=False):
+        """Centered single-purpose label of a fixed height"""
+        label = Label(text=text, font_size=font_size, color=color, bold=bold,
+                      size_hint_y=None, height=height, halign='center', valign='middle')
+        label.bind(size=lambda instance, size: setattr(instance, 'text_size', size))
+        return label
+
+    def _update_rect(self, instance, value):
+        """Update background rectangle on size/position change"""
+        self.rect.pos = instance.pos
+        self.rect.size = instance.size
+
+    def on_pre_enter(self):
+        """Show the signed-in user's code"""
+        session = get_session()
+        if session is None:
+            self.shown_user_id = None
+            self.name_label.text = "Sign in to get your QR code"
+            self.qr_image.opacity = 0
+            self.payload_label.text = ""
+            return
+
+        user = session.user
+        self.name_label.text = user.get('name') or ""
+        if user.get('id') == self.shown_user_id:
+            return
+        self.shown_user_id = user.get('id')
+        self.qr_image.opacity = 0
+        self.payload_label.text = "Loading QR code..."
+
+        # Reading the key and drawing the first image stay off the Kivy thread
+        threading.Thread(target=self._load_qr, args=(self.shown_user_id,), daemon=True).start()
+
+    def _load_qr(self, user_id):
+        """Worker thread: find or draw the user's QR image"""
+        payloads = get_qr_payloads()
+        payload = payloads.payload(user_id)
+        path = payloads.image_path(user_id) if payload else None
+        Clock.schedule_once(lambda dt: self._show_qr(user_id, payload, path))
+
+    def _show_qr(self, user_id, payload, path):
+        """Main thread: display the QR image, or the payload text without one"""
+        if user_id != self.shown_user_id:
+            return
+        if payload is None:
+            self.payload_label.text = "QR codes are unavailable offline"
+            self.shown_user_id = None
+            return
+        if path is not None:
+            self.qr_image.source = str(path)
+            self.qr_image.opacity = 1
+        self.payload_label.text = payload
+
+    def on_scan(self, instance):
+        """Resolve a scanned code and ready the field for the next one"""
+        code = instance.text.strip()
+        instance.text = ""
+        if not code:
+            return
+
+        # The profile lookup (and the first key read) stay off the Kivy thread
+        self.scanned_code = code
+        self.result_label.color = LIGHT_TEXT_COLOR
+        self.result_label.text = "Looking up..."
+        threading.Thread(target=self._resolve_scan, args=(code,), daemon=True).start()
+
+        # Keep the field focused so a handheld scanner can type the next code
+        Clock.schedule_once(lambda dt: setattr(instance, 'focus', True))
+
+    def _resolve_scan(self, code):
+        """Worker thread: verify a scanned code and load its profile"""
+        ok, message, profile = get_qr_payloads().resolve(code)
+        Clock.schedule_once(lambda dt: self._show_scan(code, ok, message, profile))
+
+    def _show_scan(self, code, ok, message, profile):
+        """Main thread: show the latest scan's result"""
+        if code != self.scanned_code:
+            return
+        if ok:
+            details = " - ".join(value for value in (format_batch(profile.get('year_graduated')), profile.get('strand')) if value)
+            self.result_label.color = DARK_TEXT_COLOR
+            self.result_label.text = f"{profile['name']}\n{details}"
+        else:
+            self.result_label.color = ERROR_TEXT_COLOR
+            self.result_label.text = message
+
+    def on_back(self, instance):
+        """Return to the alumni directory"""
+        if self.manager and self.manager.has_screen('alumni_directory'):
+            self.manager.current = 'alumni_directory'
@@ -0,0 +1,228 @@
+"""Signed alumni QR payloads and their cached QR images
+
+Every alumnus has one short payload, "SR1:<id>:<signature>", where id
+is the user id in base 36 and signature a truncated HMAC-SHA256 of the
+rest under a key kept in the database. Only QR alphanumeric-mode
+characters are used, so the code stays small and quick to scan.
+Checking a scanned payload is an HMAC compare, and resolving it to a
+profile is one primary-key lookup; no image work happens on scan.
+
+QR images are drawn once per payload and kept in data/qr_codes, on
+demand or ahead of time for every alumnus:
+
+    python qr_payload.py
+
+Drawing QR codes needs the qrcode package (with Pillow). Without it
+no image is made and pages show the payload text instead.
+"""
+import argparse
+import base64
+import hashlib
+import hmac
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+
+QR_CODES_PATH = Path(__file__).parent / "data" / "qr_codes"
+
+# Payload format version, and signature length (80 bits)
+PAYLOAD_PREFIX = "SR1"
+SIGNATURE_BYTES = 10
+
+# Name of the signing key in the database's app secrets
+QR_SECRET_NAME = "qr_signing_key"
+
+# QR image layout: pixels per module and quiet-zone modules
+QR_BOX_SIZE = 8
+QR_BORDER = 2
+
+_BASE36_DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Id and signature parts of a scanned payload; anything else is rejected unsigned
+_PAYLOAD_PART = re.compile(r"[0-9A-Z]+")
+
+def to_base36(number):
+    """Non-negative integer as uppercase base 36"""
+    digits = ""
+    while True:
+        number, remainder = divmod(number, 36)
+        digits = _BASE36_DIGITS[remainder] + digits
+        if not number:
+            return digits
+
+class QRPayloads:
+    """Signs, verifies and draws alumni QR payloads
+
+    The signing key is read from the MySQL database once, so every
+    device sharing the database accepts the same codes. On the SQLite
+    fallback the key saved by the last online check-in load is used
+    instead, since a local key would sign codes no other device accepts.
+    """
+    def __init__(self, secret=None, qr_codes_path=QR_CODES_PATH):
+        self._secret = secret
+        self.qr_codes_path = Path(qr_codes_path)
+        self._lock = threading.Lock()
+
+    def payload(self, user_id):
+        """QR payload for a user, or None without a signing key"""
+        body = f"{PAYLOAD_PREFIX}:{to_base36(int(user_id))}"
+        signature = self._sign(body)
+        return f"{body}:{signature}" if signature else None
+
+    def verify(self, payload):
+        """Return the user id in a scanned payload, or None if it is not genuine"""
+        try:
+            prefix, user_part, signature = (payload or "").strip().upper().split(":")
+        except ValueError:
+            return None
+        if prefix != PAYLOAD_PREFIX:
+            return None
+
+        # Scanner input is untrusted; only ASCII codes reach the HMAC
+        if not (_PAYLOAD_PART.fullmatch(user_part) and _PAYLOAD_PART.fullmatch(signature)):
+            return None
+
+        expected = self._sign(f"{prefix}:{user_part}")
+        if not expected or not hmac.compare_digest(signature, expected):
+            return None
+        return int(user_part, 36)
+
+    def resolve(self, payload):
+        """Profile of the alumnus a scanned payload belongs to
+
+        Returns (success, message, profile) like db.get_user_profile.
+        """
+        from db_connector import db
+
+        user_id = self.verify(payload)
+        if user_id is None:
+            return False, "Not a valid alumni QR code", None
+        return db.get_user_profile(user_id)
+
+    def image_path(self, user_id):
+        """Path of the user's QR image, drawing it the first time
+
+        Returns None when there is no signing key or qrcode is missing.
+        """
+        payload = self.payload(user_id)
+        if payload is None:
+            return None
+        path = self.qr_codes_path / f"{user_id}-{payload.rsplit(':', 1)[1]}.png"
+        if path.exists():
+            return path
+        return self._generate(user_id, payload, path)
+
+    def _generate(self, user_id, payload, path):
+        """Draw a payload's QR image to path"""
+        # Without Pillow qrcode draws PyPNG images, which can't be saved to a stream by format
+        try:
+            import qrcode
+            import PIL
+        except ImportError:
+            return None
+
+        try:
+            code = qrcode.QRCode(
+                error_correction=qrcode.constants.ERROR_CORRECT_M,
+                box_size=QR_BOX_SIZE,
+                border=QR_BORDER
+            )
+            code.add_data(payload)
+            code.make(fit=True)
+            image = code.make_image(fill_color="black", back_color="white")
+
+            self.qr_codes_path.mkdir(parents=True, exist_ok=True)
+
+            # Images signed with an older key are no longer valid; a borrowed
+            # fallback key is never cached, and proves nothing about them
+            if self._secret is not None:
+                for old in self.qr_codes_path.glob(f"{user_id}-*.png"):
+                    if old == path:
+                        continue
+                    try:
+                        old.unlink()
+                    except OSError:
+                        pass
+
+            # Write to a temp file of our own and swap it in, so neither readers
+            # nor a concurrent draw of the same code see half a file
+            with tempfile.NamedTemporaryFile(dir=self.qr_codes_path, prefix=path.name + ".",
+                                             suffix=".tmp", delete=False) as temp:
+                try:
+                    image.save(temp, format="PNG")
+                except BaseException:
+                    temp.close()
+                    os.unlink(temp.name)
+                    raise
+            os.replace(temp.name, path)
+        except (OSError, ValueError) as e:
+            print(f"Error drawing QR code for user {user_id}: {e}")
+            return None
+        return path
+
+    def signing_key(self):
+        """The key payloads are signed with, or None without one"""
+        return self._get_secret()
+
+    def _sign(self, body):
+        """Truncated HMAC of a payload body, base 32 without padding"""
+        secret = self._get_secret()
+        if secret is None:
+            return None
+        digest = hmac.new(secret, body.encode("ascii"), hashlib.sha256).digest()[:SIGNATURE_BYTES]
+        return base64.b32encode(digest).decode("ascii").rstrip("=")
+
+    def _get_secret(self):
+        """Signing key from the MySQL database, read once, else the offline snapshot's"""
+        if self._secret is None:
+            with self._lock:
+                if self._secret is None:
+                    from db_connector import db
+                    if db.db_type != 'mysql':
+                        from checkin_queue import get_checkin_queue
+                        return get_checkin_queue().snapshot_key()
+                    self._secret = db.get_app_secret(QR_SECRET_NAME)
+        return self._secret
+
+# Shared payload signer
+_qr_payloads = None
+
+def get_qr_payloads():
+    """Return the shared QR payload signer, creating it on first use"""
+    global _qr_payloads
+    if _qr_payloads is None:
+        _qr_payloads = QRPayloads()
+    return _qr_payloads
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-generate alumni QR codes")
+    parser.parse_args()
+
+    try:
+        import qrcode
+        import PIL
+    except ImportError:
+        parser.error("qrcode is required to draw QR codes (pip install qrcode[pil])")
+
+    from db_connector import db
+
+    payloads = get_qr_payloads()
+    created = 0
+    after = None
+    while True:
+        ok, message, page = db.list_alumni(after=after, limit=100)
+        if not ok:
+            parser.error(message)
+        for user in page["results"]:
+            if payloads.image_path(user["id"]):
+                created += 1
+        if not page["has_more"]:
+            break
+        last = page["results"][-1]
+        after = (last["name"], last["id"])
+    print(f"{created} QR codes ready in {payloads.qr_codes_path}")
+
+if __name__ == "__main__":
+    main()
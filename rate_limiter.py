@@ -0,0 +1,172 @@
+import atexit
+import json
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+# Failed-login budget per email: a burst of 5, then one attempt a minute
+EMAIL_BURST = 5
+EMAIL_REFILL_SECONDS = 60
+
+# Budget per client (device or address) across all emails it tries
+CLIENT_BURST = 20
+CLIENT_REFILL_SECONDS = 10
+
+# Buckets kept per limiter; the least recently used is dropped beyond this
+MAX_TRACKED_KEYS = 10000
+
+# Where bucket state is kept between runs when persistence is on
+LOGIN_LIMITS_PATH = Path(__file__).parent / "data" / "login_limits.json"
+
+# Client key used when the caller cannot identify the client
+DEFAULT_CLIENT = "local"
+
+class TokenBucketLimiter:
+    """Token buckets keyed by any hashable, with LRU eviction
+
+    Each key may spend up to burst tokens at once, and gets one token
+    back every refill_seconds. A bucket is just (tokens, last update)
+    topped up lazily when it is touched, so every check is O(1) and no
+    timer runs. Keys live in an OrderedDict in recency order; past
+    max_keys the least recently touched is dropped, which is harmless
+    because an idle bucket has refilled anyway.
+    """
+    def __init__(self, burst, refill_seconds, max_keys=MAX_TRACKED_KEYS):
+        self.burst = burst
+        self.refill_seconds = refill_seconds
+        self.max_keys = max_keys
+        self.buckets = OrderedDict()
+
+    def retry_after(self, key, now):
+        """Seconds until key has a token (0 if it has one now)"""
+        tokens = self._tokens(key, now)
+        if tokens >= 1:
+            return 0
+        return math.ceil((1 - tokens) * self.refill_seconds)
+
+    def consume(self, key, now):
+        """Spend one token from key's bucket"""
+        self.buckets[key] = (self._tokens(key, now) - 1, now)
+        self.buckets.move_to_end(key)
+        while len(self.buckets) > self.max_keys:
+            self.buckets.popitem(last=False)
+
+    def reset(self, key):
+        """Give key a full bucket again"""
+        self.buckets.pop(key, None)
+
+    def _tokens(self, key, now):
+        """Tokens in key's bucket after refilling up to now"""
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            return self.burst
+        tokens, updated = bucket
+        elapsed = max(0, now - updated)
+        return min(self.burst, tokens + elapsed / self.refill_seconds)
+
+    def to_dict(self, now):
+        """Buckets that are not full yet, for saving"""
+        return {
+            key: [tokens, updated]
+            for key, (tokens, updated) in self.buckets.items()
+            if self._tokens(key, now) < self.burst
+        }
+
+    def load_dict(self, data):
+        """Restore buckets saved by to_dict"""
+        for key, (tokens, updated) in data.items():
+            self.buckets[key] = (float(tokens), float(updated))
+        while len(self.buckets) > self.max_keys:
+            self.buckets.popitem(last=False)
+
+class LoginRateLimiter:
+    """Per-email and per-client login throttle checked before the database
+
+    check() is called before a login query and refuses the attempt when
+    either the email's or the client's bucket is empty, so guessing many
+    passwords for one account and trying many accounts from one client
+    are both slowed down without a query. Every attempt that goes
+    through spends a token from both buckets; a successful login
+    refills the email's bucket. With a persist_path the buckets are
+    loaded at start and saved at exit, so restarting the app does not
+    reset them.
+    """
+    def __init__(self, email_burst=EMAIL_BURST, email_refill=EMAIL_REFILL_SECONDS,
+                 client_burst=CLIENT_BURST, client_refill=CLIENT_REFILL_SECONDS,
+                 max_keys=MAX_TRACKED_KEYS, persist_path=None):
+        self.emails = TokenBucketLimiter(email_burst, email_refill, max_keys)
+        self.clients = TokenBucketLimiter(client_burst, client_refill, max_keys)
+        self.persist_path = Path(persist_path) if persist_path else None
+        self._lock = threading.Lock()
+
+        if self.persist_path:
+            self.load()
+            atexit.register(self.save)
+
+    def check(self, email, client=None):
+        """Spend an attempt if allowed; return (allowed, seconds to wait)"""
+        email_key = normalize_email(email)
+        client_key = client or DEFAULT_CLIENT
+        now = time.time()
+
+        with self._lock:
+            wait = max(self.emails.retry_after(email_key, now),
+                       self.clients.retry_after(client_key, now))
+            if wait:
+                return False, wait
+            self.emails.consume(email_key, now)
+            self.clients.consume(client_key, now)
+            return True, 0
+
+    def succeeded(self, email):
+        """Forget the failed attempts of an email that just signed in"""
+        with self._lock:
+            self.emails.reset(normalize_email(email))
+
+    def save(self):
+        """Write the buckets that are still refilling to persist_path"""
+        if not self.persist_path:
+            return
+        now = time.time()
+        with self._lock:
+            data = {"emails": self.emails.to_dict(now), "clients": self.clients.to_dict(now)}
+        try:
+            self.persist_path.parent.mkdir(exist_ok=True)
+            tmp_path = self.persist_path.with_name(self.persist_path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.persist_path)
+        except OSError as e:
+            print(f"Error saving login limits: {e}")
+
+    def load(self):
+        """Read buckets saved by an earlier run"""
+        try:
+            with open(self.persist_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Error reading login limits: {e}")
+            return
+
+        with self._lock:
+            self.emails.load_dict(data.get("emails", {}))
+            self.clients.load_dict(data.get("clients", {}))
+
+def normalize_email(email):
+    """Email as used for rate limiting, so case and spaces don't matter"""
+    return (email or "").strip().lower()
+
+# Shared limiter used by DatabaseConnector.authenticate_user
+_login_limiter = None
+
+def get_login_limiter():
+    """Return the shared login limiter, creating it on first use"""
+    global _login_limiter
+    if _login_limiter is None:
+        _login_limiter = LoginRateLimiter(persist_path=LOGIN_LIMITS_PATH)
+    return _login_limiter
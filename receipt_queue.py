@@ -0,0 +1,457 @@
+import atexit
+import json
+import os
+import queue
+import random
+import shutil
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Default locations for the outbox and the persisted job state
+DATA_PATH = Path(__file__).parent / "data"
+OUTBOX_PATH = DATA_PATH / "outbox"
+JOBS_DB_PATH = DATA_PATH / "receipt_jobs.db"
+
+# Job settings
+DEFAULT_WORKERS = 2
+MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = 2  # Seconds, doubled after every failed attempt
+
+# Receipt layout
+RECEIPT_WIDTH = 48
+SCHOOL_NAME = "Santisimo Rosario Integrated Highschool"
+
+def render_receipt(donation):
+    """Lay out a fixed-width donation receipt as text"""
+    border = "+" + "-" * (RECEIPT_WIDTH - 2) + "+"
+
+    def line(text=""):
+        return "| " + text.ljust(RECEIPT_WIDTH - 4)[:RECEIPT_WIDTH - 4] + " |"
+
+    def row(label, value):
+        value = str(value)
+        return line(label + value.rjust(RECEIPT_WIDTH - 4 - len(label)))
+
+    amount = f"PHP {float(donation['amount']):,.2f}"
+    lines = [
+        border,
+        line(SCHOOL_NAME.center(RECEIPT_WIDTH - 4)),
+        line("OFFICIAL DONATION RECEIPT".center(RECEIPT_WIDTH - 4)),
+        border,
+        row("Reference:", donation['reference']),
+        row("Date:", donation.get('created_at') or ""),
+        line(),
+        row("Donor:", donation.get('donor_name') or "Anonymous Donor"),
+        row("Email:", donation.get('donor_email') or "-"),
+        line(),
+        line("Campaign:"),
+    ]
+
+    # Wrap long campaign titles over several lines
+    words = str(donation['campaign']).split()
+    current = ""
+    for word in words:
+        if current and len(current) + 1 + len(word) > RECEIPT_WIDTH - 6:
+            lines.append(line("  " + current))
+            current = word
+        else:
+            current = f"{current} {word}".strip()
+    if current:
+        lines.append(line("  " + current))
+
+    lines += [
+        line(),
+        row("Amount:", amount),
+        border,
+        line("Thank you for supporting our school!".center(RECEIPT_WIDTH - 4)),
+        border,
+    ]
+    return "\n".join(lines) + "\n"
+
+class ReceiptQueue:
+    """Background queue that turns recorded donations into receipts
+
+    Jobs are persisted in a small SQLite database so pending receipts
+    survive a restart. A pool of worker threads records donations in
+    the ledger, renders each receipt and writes it into the outbox
+    directory, retrying failed jobs with exponential backoff. Nothing
+    here ever runs on the UI thread.
+    """
+    def __init__(self, outbox_path=OUTBOX_PATH, jobs_db_path=JOBS_DB_PATH,
+                 workers=DEFAULT_WORKERS, max_attempts=MAX_ATTEMPTS):
+        self.outbox_path = Path(outbox_path)
+        self.sent_path = self.outbox_path / "sent"
+        self.jobs_db_path = Path(jobs_db_path)
+        self.num_workers = workers
+        self.max_attempts = max_attempts
+
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._workers = []
+        self._timers = []
+        self._callbacks = {}  # job id -> on_complete for donations recorded this run
+        self._running = False
+
+    def start(self):
+        """Create the job store, start the workers and resume pending jobs"""
+        if self._running:
+            return
+        self.outbox_path.mkdir(parents=True, exist_ok=True)
+        self.jobs_db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._initialize_job_store()
+
+        self._running = True
+        for i in range(self.num_workers):
+            worker = threading.Thread(
+                target=self._worker_loop,
+                name=f"receipt-worker-{i}",
+                daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+        # Pick up jobs left over from a previous run, keeping their backoff
+        now = time.time()
+        for job_id, next_attempt_at in self._pending_jobs():
+            if next_attempt_at and next_attempt_at > now:
+                self._schedule_retry(job_id, next_attempt_at - now)
+            else:
+                self._queue.put(job_id)
+
+    def stop(self, timeout=5):
+        """Stop the workers after the jobs they are running finish"""
+        if not self._running:
+            return
+        self._running = False
+        for timer in self._timers:
+            timer.cancel()
+        self._timers = []
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout)
+        self._workers = []
+
+    def record_donation(self, campaign, amount, on_complete=None, **donor):
+        """Queue a donation for the ledger and its receipt; return its reference immediately
+
+        donor holds db.record_donation's user_id, donor_name and
+        donor_email. The donation is persisted as a job before this
+        returns, so it survives a restart and is retried like a receipt.
+        on_complete(success, message, donation) is called on a worker
+        thread once the ledger write succeeded or failed for good.
+        """
+        from db_connector import db
+
+        if not self._running:
+            self.start()
+
+        # The reference is fixed now so every attempt writes the same ledger row
+        donation = {
+            "reference": db.new_donation_reference(),
+            "user_id": donor.get('user_id'),
+            "donor_name": donor.get('donor_name'),
+            "donor_email": donor.get('donor_email'),
+            "campaign": campaign,
+            "amount": round(float(amount), 2),
+            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        job_id = self._insert_job(donation, 'record')
+        if on_complete is not None:
+            with self._lock:
+                self._callbacks[job_id] = on_complete
+        self._queue.put(job_id)
+        return donation['reference']
+
+    def enqueue(self, donation):
+        """Queue a receipt for a recorded donation and return immediately"""
+        if not self._running:
+            self.start()
+
+        job_id = self._insert_job(donation, 'receipt')
+        if job_id is None:
+            print(f"Receipt for {donation['reference']} is already queued")
+            return None
+
+        self._queue.put(job_id)
+        return job_id
+
+    def job_status(self, reference):
+        """Return the persisted state of a receipt job, or None"""
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.row_factory = sqlite3.Row
+                row = conn.execute(
+                    "SELECT * FROM receipt_jobs WHERE reference = ?", (reference,)
+                ).fetchone()
+                return dict(row) if row else None
+            finally:
+                conn.close()
+
+    def drain_outbox(self, send_batch, batch_size=50):
+        """Hand finished receipts to send_batch in bulk
+
+        send_batch receives a list of (path, text) tuples and returns
+        True when the whole batch was sent. Sent receipts are moved to
+        the outbox's sent/ directory. Returns the number of receipts sent.
+        """
+        self.sent_path.mkdir(parents=True, exist_ok=True)
+        receipts = sorted(self.outbox_path.glob("receipt_*.txt"))
+        sent = 0
+
+        for start in range(0, len(receipts), batch_size):
+            batch = []
+            for path in receipts[start:start + batch_size]:
+                try:
+                    batch.append((path, path.read_text(encoding="utf-8")))
+                except OSError as e:
+                    print(f"Could not read receipt {path.name}: {e}")
+            if not batch:
+                continue
+
+            try:
+                ok = send_batch(batch)
+            except Exception as e:
+                print(f"Error sending receipt batch: {e}")
+                ok = False
+            if not ok:
+                # Leave the rest in the outbox for the next drain
+                break
+
+            for path, _ in batch:
+                shutil.move(str(path), str(self.sent_path / path.name))
+            sent += len(batch)
+
+        return sent
+
+    def _worker_loop(self):
+        """Process donation and receipt jobs until stopped"""
+        while True:
+            job_id = self._queue.get()
+            if job_id is None:
+                break
+            try:
+                self._process_job(job_id)
+            except Exception as e:
+                print(f"Unexpected error in receipt worker: {e}")
+
+    def _process_job(self, job_id):
+        """Record a donation or render its receipt, retrying later if it fails"""
+        job = self._claim_job(job_id)
+        if job is None:
+            return
+
+        donation = json.loads(job['payload'])
+        label = "Donation" if job['kind'] == 'record' else "Receipt"
+        try:
+            if job['kind'] == 'record':
+                self._record_donation(job_id, donation)
+                return
+            self._write_receipt(donation)
+        except Exception as e:
+            attempts = job['attempts'] + 1
+            if attempts >= self.max_attempts:
+                print(f"{label} {donation['reference']} failed permanently: {e}")
+                self._update_job(job_id, 'failed', attempts, str(e))
+                self._complete(job_id, False, str(e), donation)
+                return
+
+            # Exponential backoff with jitter before the next attempt
+            delay = RETRY_BASE_DELAY * (2 ** (attempts - 1)) * random.uniform(0.5, 1.5)
+            print(f"{label} {donation['reference']} failed ({e}), retrying in {delay:.1f}s")
+            self._update_job(job_id, 'pending', attempts, str(e), time.time() + delay)
+            self._schedule_retry(job_id, delay)
+            return
+
+        self._update_job(job_id, 'done', job['attempts'] + 1)
+
+    def _record_donation(self, job_id, donation):
+        """Write a donation to the ledger, then turn its job into a receipt job"""
+        from db_connector import db
+
+        success, message, recorded = db.record_donation(
+            donation['campaign'],
+            donation['amount'],
+            user_id=donation['user_id'],
+            donor_name=donation['donor_name'],
+            donor_email=donation['donor_email'],
+            reference=donation['reference'],
+            created_at=donation['created_at']
+        )
+        print(message)
+        if not success:
+            raise RuntimeError(message)
+
+        # The same job goes on to render the receipt from the recorded row
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    """
+                    UPDATE receipt_jobs
+                    SET kind = 'receipt', payload = ?, status = 'pending', attempts = 0,
+                        last_error = NULL, next_attempt_at = NULL, updated_at = ?
+                    WHERE id = ?
+                    """,
+                    (json.dumps(recorded, default=str), time.time(), job_id)
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        self._queue.put(job_id)
+        print(f"Receipt queued for donation {donation['reference']}")
+        self._complete(job_id, True, message, recorded)
+
+    def _complete(self, job_id, success, message, donation):
+        """Tell whoever recorded a donation this run how its ledger write ended"""
+        with self._lock:
+            on_complete = self._callbacks.pop(job_id, None)
+        if on_complete is not None:
+            on_complete(success, message, donation)
+
+    def _write_receipt(self, donation):
+        """Write a receipt atomically into the outbox"""
+        path = self.outbox_path / f"receipt_{donation['reference']}.txt"
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_text(render_receipt(donation), encoding="utf-8")
+        os.replace(temp_path, path)
+
+    def _schedule_retry(self, job_id, delay):
+        """Put a job back on the queue after a delay"""
+        if not self._running:
+            return
+        timer = threading.Timer(delay, self._queue.put, args=(job_id,))
+        timer.daemon = True
+        timer.start()
+        self._timers = [t for t in self._timers if t.is_alive()] + [timer]
+
+    def _initialize_job_store(self):
+        """Create the receipt_jobs table if it doesn't exist"""
+        conn = self._connect()
+        try:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS receipt_jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    reference TEXT NOT NULL UNIQUE,
+                    kind TEXT NOT NULL DEFAULT 'receipt',
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    next_attempt_at REAL,
+                    created_at REAL,
+                    updated_at REAL
+                )
+            ''')
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_receipt_jobs_status ON receipt_jobs (status)")
+
+            # Job stores from before donations were queued only hold receipts
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(receipt_jobs)")]
+            if 'kind' not in columns:
+                conn.execute("ALTER TABLE receipt_jobs ADD COLUMN kind TEXT NOT NULL DEFAULT 'receipt'")
+
+            # Jobs that were running when the app stopped go back to pending
+            conn.execute("UPDATE receipt_jobs SET status = 'pending' WHERE status = 'running'")
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _insert_job(self, donation, kind):
+        """Persist a pending job for a donation; return its id, or None if already queued"""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            try:
+                cursor = conn.execute(
+                    """
+                    INSERT OR IGNORE INTO receipt_jobs
+                        (reference, kind, payload, status, attempts, next_attempt_at, created_at, updated_at)
+                    VALUES (?, ?, ?, 'pending', 0, ?, ?, ?)
+                    """,
+                    (donation['reference'], kind, json.dumps(donation, default=str), now, now, now)
+                )
+                conn.commit()
+                return cursor.lastrowid if cursor.rowcount else None
+            finally:
+                conn.close()
+
+    def _pending_jobs(self):
+        """Return (id, next_attempt_at) of all jobs still waiting to run"""
+        with self._lock:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    "SELECT id, next_attempt_at FROM receipt_jobs WHERE status = 'pending' ORDER BY id"
+                ).fetchall()
+                return [(row[0], row[1]) for row in rows]
+            finally:
+                conn.close()
+
+    def _claim_job(self, job_id):
+        """Mark a pending job as running and return it"""
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.row_factory = sqlite3.Row
+                row = conn.execute(
+                    "SELECT * FROM receipt_jobs WHERE id = ? AND status = 'pending'", (job_id,)
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE receipt_jobs SET status = 'running', updated_at = ? WHERE id = ?",
+                    (time.time(), job_id)
+                )
+                conn.commit()
+                return dict(row)
+            finally:
+                conn.close()
+
+    def _update_job(self, job_id, status, attempts, error=None, next_attempt_at=None):
+        """Persist the outcome of a job attempt"""
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    """
+                    UPDATE receipt_jobs
+                    SET status = ?, attempts = ?, last_error = ?, next_attempt_at = ?, updated_at = ?
+                    WHERE id = ?
+                    """,
+                    (status, attempts, error, next_attempt_at, time.time(), job_id)
+                )
+                conn.commit()
+            finally:
+                conn.close()
+
+    def _connect(self):
+        """Open a connection to the job store"""
+        return sqlite3.connect(str(self.jobs_db_path), timeout=10)
+
+# Shared queue used by the donation pages
+_receipt_queue = None
+
+def get_receipt_queue():
+    """Return the shared receipt queue, starting it on first use"""
+    global _receipt_queue
+    if _receipt_queue is None:
+        _receipt_queue = ReceiptQueue()
+        _receipt_queue.start()
+        # Let running jobs finish on exit; pending ones resume on the next start
+        atexit.register(_receipt_queue.stop)
+    return _receipt_queue
+
+# Drain the outbox from the command line, e.g. from a scheduled mail job
+if __name__ == "__main__":
+    def print_batch(batch):
+        for path, text in batch:
+            print(f"--- {path.name} ---")
+            print(text)
+        return True
+
+    sent = ReceiptQueue().drain_outbox(print_batch)
+    print(f"Drained {sent} receipts from {OUTBOX_PATH} at {datetime.now():%Y-%m-%d %H:%M:%S}")
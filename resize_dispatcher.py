@@ -0,0 +1,131 @@
+import weakref
+
+from kivy.clock import Clock
+
+class ResizeDispatcher:
+    """Single Window.on_resize listener that fans out to page layout code
+
+    Subscribers are bound methods of widgets and are held through weak
+    references, so a page that is dropped is never kept alive or called
+    again. Resize events are coalesced with a Clock trigger: however
+    many events a drag-resize produces, each subscriber gets at most one
+    call per frame with the final window size. Widgets that are not in
+    the window (a hidden screen, a cached page) are skipped. They catch
+    up when they are added back to a parent or, for screen managers
+    passed to watch(), when their screen is shown again; screens removed
+    from a watched manager are unsubscribed at once.
+    """
+    def __init__(self):
+        self.subscribers = {}
+        self.managers = {}  # id(manager) -> screens it had at the last change
+        self._bound = False
+        self._trigger = Clock.create_trigger(self._dispatch, 0)
+
+    def subscribe(self, callback):
+        """Call callback(width, height) after the window is resized
+
+        callback must be a bound method of a widget; the subscription
+        ends when the widget is garbage collected or unsubscribe() is
+        called.
+        """
+        widget = callback.__self__
+        key = (id(widget), callback.__func__)
+        if key in self.subscribers:
+            return
+        self._bind_window()
+        self.subscribers[key] = [
+            weakref.WeakMethod(callback, lambda ref: self.subscribers.pop(key, None)),
+            self._window_size()
+        ]
+
+        # Catch up on resizes missed while the widget was off screen
+        widget.fbind('parent', self._on_parent)
+
+    def unsubscribe(self, callback):
+        """Stop calling callback on resize"""
+        widget = callback.__self__
+        if self.subscribers.pop((id(widget), callback.__func__), None) is not None:
+            widget.funbind('parent', self._on_parent)
+
+    def watch(self, manager):
+        """Catch up screens of a ScreenManager as they are shown, and
+        unsubscribe the widgets of screens removed from it"""
+        if id(manager) in self.managers:
+            return
+        self.managers[id(manager)] = list(manager.screens)
+        manager.fbind('current_screen', self._on_current_screen)
+        manager.fbind('screens', self._on_screens)
+
+    def release(self, root):
+        """Unsubscribe every subscriber that is root or inside it"""
+        for key, entry in list(self.subscribers.items()):
+            callback = entry[0]()
+            if callback is None:
+                self.subscribers.pop(key, None)
+                continue
+            widget = callback.__self__
+            while widget is not None and widget is not root:
+                widget = widget.parent
+            if widget is root:
+                self.unsubscribe(callback)
+
+    def _bind_window(self):
+        """Listen to the window once, on the first subscription"""
+        from kivy.core.window import Window
+        if not self._bound:
+            self._bound = True
+            Window.bind(on_resize=self._on_window_resize)
+
+    def _window_size(self):
+        """Current window size as a tuple"""
+        from kivy.core.window import Window
+        return tuple(Window.size)
+
+    def _on_window_resize(self, instance, width, height):
+        """Queue one layout pass for the next frame"""
+        self._trigger()
+
+    def _on_parent(self, widget, parent):
+        """A subscriber was added back to the tree; lay it out if needed"""
+        if parent is not None:
+            self._trigger()
+
+    def _on_current_screen(self, manager, screen):
+        """A screen was shown; its pages may have missed resizes while hidden"""
+        if screen is not None:
+            self._trigger()
+
+    def _on_screens(self, manager, screens):
+        """Unsubscribe the pages of screens the manager removed or evicted"""
+        previous = self.managers.get(id(manager), [])
+        self.managers[id(manager)] = list(screens)
+        current = {id(screen) for screen in screens}
+        for screen in previous:
+            if id(screen) not in current:
+                self.release(screen)
+
+    def _dispatch(self, dt):
+        """Call every visible subscriber whose last known size is stale"""
+        size = self._window_size()
+        for key, entry in list(self.subscribers.items()):
+            callback = entry[0]()
+            if callback is None:
+                self.subscribers.pop(key, None)
+                continue
+            if entry[1] == size or callback.__self__.get_root_window() is None:
+                continue
+            entry[1] = size
+            try:
+                callback(*size)
+            except Exception as e:
+                print(f"Error in resize handler {callback.__qualname__}: {e}")
+
+# Shared dispatcher used by the pages
+_resize_dispatcher = None
+
+def get_resize_dispatcher():
+    """Return the shared resize dispatcher, creating it on first use"""
+    global _resize_dispatcher
+    if _resize_dispatcher is None:
+        _resize_dispatcher = ResizeDispatcher()
+    return _resize_dispatcher
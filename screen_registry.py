@@ -0,0 +1,101 @@
+from kivy.uix.screenmanager import ScreenManager
+from kivy.clock import Clock
+
+from resize_dispatcher import get_resize_dispatcher
+
+# Delay after the first frame before preloading declared screens
+PRELOAD_DELAY = 0.5
+
+class LazyScreenManager(ScreenManager):
+    """ScreenManager whose screens are declared up front and built on demand
+
+    Screens are registered by name with a factory called as
+    factory(name=name). A screen is constructed the first time it is
+    navigated to (or looked up with get_screen). Screens marked
+    preload=True are built one per frame after the first frame, and
+    evictable screens that are not on display are dropped when the
+    window reports memory pressure; they are rebuilt from their
+    factory on the next visit.
+    """
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.factories = {}
+        self.preload_names = []
+        self.evictable_names = set()
+        self._preload_event = None
+
+        # Shown screens catch up on resizes; evicted ones stop listening
+        get_resize_dispatcher().watch(self)
+
+        # Drop cached screens when the OS warns about low memory
+        from kivy.core.window import Window
+        if Window and Window.is_event_type('on_memorywarning'):
+            Window.bind(on_memorywarning=lambda *args: self.evict())
+
+    def register(self, name, factory, preload=False, evictable=True):
+        """Declare a screen without building it"""
+        self.factories[name] = factory
+        if preload and name not in self.preload_names:
+            self.preload_names.append(name)
+        if evictable:
+            self.evictable_names.add(name)
+        else:
+            self.evictable_names.discard(name)
+
+    def is_built(self, name):
+        """Return True if the named screen has been constructed"""
+        return super().has_screen(name)
+
+    def has_screen(self, name):
+        """Declared screens count as present even before they are built"""
+        return name in self.factories or super().has_screen(name)
+
+    def get_screen(self, name):
+        """Return a screen, constructing it from its factory if needed"""
+        if not super().has_screen(name) and name in self.factories:
+            self._build_screen(name)
+        return super().get_screen(name)
+
+    def _build_screen(self, name):
+        """Construct a declared screen and add it to the manager"""
+        print(f"Building screen: {name}")
+        screen = self.factories[name](name=name)
+        screen.name = name
+        self.add_widget(screen)
+        return screen
+
+    def start_preloading(self, delay=PRELOAD_DELAY):
+        """Build the preload screens one per frame, starting after delay"""
+        if self._preload_event is None:
+            self._preload_event = Clock.schedule_once(self._preload_next, delay)
+
+    def _preload_next(self, dt):
+        """Build the next preload screen, then yield the frame"""
+        self._preload_event = None
+        pending = [name for name in self.preload_names if not self.is_built(name)]
+        if not pending:
+            return
+        self._build_screen(pending[0])
+        if len(pending) > 1:
+            self._preload_event = Clock.schedule_once(self._preload_next, 0)
+
+    def evict(self, names=None):
+        """Remove built evictable screens that are not being shown"""
+        busy = {self.current}
+        transition = self.transition
+        for screen in (getattr(transition, 'screen_in', None), getattr(transition, 'screen_out', None)):
+            if screen is not None:
+                busy.add(screen.name)
+
+        evicted = []
+        for screen in list(self.screens):
+            if screen.name in busy or screen.name not in self.evictable_names:
+                continue
+            if names is not None and screen.name not in names:
+                continue
+            self.remove_widget(screen)
+            evicted.append(screen.name)
+
+        if evicted:
+            print(f"Evicted screens: {', '.join(evicted)}")
+        return evicted
@@ -0,0 +1,273 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Seconds before cached data counts as stale and is refreshed in the background
+PROFILE_TTL = 300
+RSVPS_TTL = 60
+DONATIONS_TTL = 60
+
+# Data cached per session, with how long each kind stays fresh
+SESSION_TTLS = {
+    "profile": PROFILE_TTL,
+    "rsvps": RSVPS_TTL,
+    "donations": DONATIONS_TTL,
+}
+
+_session_executor = None
+
+def get_session_executor():
+    """Single worker thread that refreshes session data in order"""
+    global _session_executor
+    if _session_executor is None:
+        _session_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session")
+    return _session_executor
+
+def format_batch(year_graduated):
+    """Batch label for a graduation year, e.g. "Batch 2015 - 2016" for 2016"""
+    year = str(year_graduated or "").strip()
+    if year.isdigit():
+        return f"Batch {int(year) - 1} - {year}"
+    return f"Batch {year}" if year else ""
+
+class UserSession:
+    """The signed-in user and a cache of the data the pages show about them
+
+    The profile (which carries the batch and strand), the user's event
+    RSVPs and their donations are cached per key. get() always answers
+    from the cache at once; when an entry is missing or older than its
+    TTL it is reloaded on a background thread and every callback bound
+    to that key is called with the fresh value on the Kivy thread
+    (stale-while-revalidate). Changes made through the session, and
+    donations recorded anywhere in the app, invalidate the affected
+    entry immediately.
+
+    A session resumed from a saved login starts with the profile
+    snapshot from the token, marked stale so it is re-read at once.
+    """
+    def __init__(self, user, ttls=None, fresh=True):
+        from db_connector import db
+
+        self.db = db
+        self.user_id = user.get('id')
+        self.ttls = dict(SESSION_TTLS, **(ttls or {}))
+        self.loaders = {
+            "profile": lambda: self.db.get_user_profile(self.user_id),
+            "rsvps": lambda: self.db.get_user_rsvps(self.user_id),
+            "donations": lambda: self.db.get_user_donations(self.user_id),
+        }
+
+        # key -> (value, time loaded); versions bump on every invalidation
+        self._lock = threading.Lock()
+        self.entries = {}
+        self.versions = {key: 0 for key in self.loaders}
+        self.refreshing = set()
+        self.listeners = {key: [] for key in self.loaders}
+        self.closed = False
+
+        # The authentication result already is a fresh profile
+        profile = {key: value for key, value in user.items() if key != 'password'}
+        self.entries["profile"] = (profile, time.monotonic() if fresh else float('-inf'))
+
+        # The donations cache follows the ledger
+        self.db.add_donation_listener(self._on_donation)
+
+    @property
+    def user(self):
+        """The cached profile of the signed-in user"""
+        return self.entries["profile"][0]
+
+    def get(self, key, callback=None):
+        """Return the cached value for key (None if never loaded)
+
+        A missing or stale entry is reloaded in the background; callback,
+        if given, is bound to the key and called with each new value.
+        """
+        if callback is not None:
+            self.bind(key, callback)
+
+        with self._lock:
+            entry = self.entries.get(key)
+        if entry is None or time.monotonic() - entry[1] >= self.ttls[key]:
+            self.refresh(key)
+        return entry[0] if entry else None
+
+    def bind(self, key, callback):
+        """Call callback(value) whenever key is reloaded"""
+        if callback not in self.listeners[key]:
+            self.listeners[key].append(callback)
+
+    def unbind(self, key, callback):
+        """Stop calling callback when key is reloaded"""
+        if callback in self.listeners[key]:
+            self.listeners[key].remove(callback)
+
+    def invalidate(self, key):
+        """Mark an entry stale and reload it now"""
+        with self._lock:
+            self.versions[key] += 1
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries[key] = (entry[0], float('-inf'))
+        self.refresh(key)
+
+    def refresh(self, key):
+        """Reload an entry in the background unless a reload is running"""
+        with self._lock:
+            if self.closed or key in self.refreshing:
+                return
+            self.refreshing.add(key)
+            version = self.versions[key]
+        get_session_executor().submit(self._load, key, version)
+
+    def update_profile(self, **changes):
+        """Save profile changes and update the cached profile"""
+        ok, message, profile = self.db.update_user_profile(self.user_id, **changes)
+        if ok:
+            with self._lock:
+                self.versions["profile"] += 1
+                self.entries["profile"] = (profile, time.monotonic())
+            self._deliver("profile", profile)
+        return ok, message
+
+    def set_location(self, address):
+        """Opt in to nearby search from an address and reload the profile"""
+        ok, message, location = self.db.set_user_location(self.user_id, address)
+        if ok:
+            self.invalidate("profile")
+        return ok, message
+
+    def clear_location(self):
+        """Opt out of nearby search and reload the profile"""
+        ok, message = self.db.clear_user_location(self.user_id)
+        if ok:
+            self.invalidate("profile")
+        return ok, message
+
+    def rsvp(self, event_title, event_date, status="attending"):
+        """Save an RSVP and reload the cached RSVPs"""
+        ok, message = self.db.record_rsvp(self.user_id, event_title, event_date, status)
+        if ok:
+            self.invalidate("rsvps")
+        return ok, message
+
+    def close(self):
+        """Stop refreshing and listening for donations"""
+        with self._lock:
+            self.closed = True
+        self.db.remove_donation_listener(self._on_donation)
+        for callbacks in self.listeners.values():
+            callbacks.clear()
+
+    def _load(self, key, version):
+        """Worker thread: read one entry from the database"""
+        try:
+            ok, message, value = self.loaders[key]()
+        except Exception as e:
+            ok, message, value = False, str(e), None
+
+        with self._lock:
+            self.refreshing.discard(key)
+            if self.closed:
+                return
+            if version != self.versions[key]:
+                # Invalidated while loading; the value may predate the change
+                retry = True
+            else:
+                retry = False
+                if ok:
+                    self.entries[key] = (value, time.monotonic())
+
+        if retry:
+            self.refresh(key)
+        elif ok:
+            self._deliver(key, value)
+        else:
+            print(f"Error refreshing session {key}: {message}")
+
+    def _deliver(self, key, value):
+        """Hand a fresh value to the bound callbacks on the Kivy thread"""
+        from kivy.clock import Clock
+
+        def notify(dt):
+            for callback in list(self.listeners[key]):
+                try:
+                    callback(value)
+                except Exception as e:
+                    print(f"Error in session {key} callback: {e}")
+        Clock.schedule_once(notify)
+
+    def _on_donation(self, donation):
+        """A donation was recorded; reload ours if it is ours"""
+        if donation.get('user_id') == self.user_id:
+            self.invalidate("donations")
+
+# Session of the signed-in user, if any
+_session = None
+
+def get_session():
+    """Return the current user session, or None when nobody is signed in"""
+    return _session
+
+def start_session(user, fresh=True):
+    """Start a session for an authenticated user dict, ending any previous one"""
+    global _session
+    end_session()
+    _session = UserSession(user, fresh=fresh)
+
+    # Warm the caches while the first page is built
+    for key in SESSION_TTLS:
+        _session.get(key)
+    return _session
+
+def end_session():
+    """Sign out: drop the session and its cached data"""
+    global _session
+    if _session is not None:
+        _session.close()
+        _session = None
+
+def sign_in(email, password, remember=True, client=None):
+    """Authenticate a user and start their session
+
+    With remember, a signed login token is saved so the next launch
+    can resume the session without asking for credentials. client is
+    passed on to the login rate limiter. Returns (success, message,
+    user) like db.authenticate_user.
+    """
+    from db_connector import db
+    from session_tokens import get_session_tokens
+
+    success, message, user = db.authenticate_user(email, password, client)
+    if success:
+        start_session(user)
+        if remember:
+            tokens = get_session_tokens()
+            tokens.save(tokens.issue(user))
+    return success, message, user
+
+def resume_session():
+    """Start a session from the saved login token, if it is still valid
+
+    Only the token's signature, expiry and revocation are checked, so
+    no credentials are sent to the database; the profile is re-read in
+    the background. Returns the session, or None when the user has to
+    sign in.
+    """
+    from session_tokens import get_session_tokens
+
+    user = get_session_tokens().restore()
+    if user is None:
+        return None
+    return start_session(user, fresh=False)
+
+def sign_out():
+    """End the session and revoke the saved login token"""
+    from session_tokens import get_session_tokens
+
+    tokens = get_session_tokens()
+    token = tokens.load()
+    if token is not None:
+        tokens.revoke(token)
+        tokens.clear()
+    end_session()
@@ -0,0 +1,208 @@
+import base64
+import hashlib
+import hmac
+import json
+import os
+import re
+import secrets
+import threading
+import time
+from pathlib import Path
+
+# Files kept next to the local database
+DATA_PATH = Path(__file__).parent / "data"
+SECRET_PATH = DATA_PATH / "session_secret.key"
+TOKEN_PATH = DATA_PATH / "session_token"
+REVOKED_PATH = DATA_PATH / "revoked_tokens.json"
+
+# How long a saved login lasts without signing in again
+TOKEN_LIFETIME = 30 * 24 * 60 * 60  # 30 days
+
+# Bytes of key material for the HMAC secret
+SECRET_SIZE = 32
+
+# Both parts of a token are URL-safe base64; anything else is rejected unsigned
+_TOKEN_PART = re.compile(r"[A-Za-z0-9_-]+")
+
+# Profile fields carried in a token so a resumed session can show them at once
+TOKEN_USER_FIELDS = ("id", "email", "name", "year_graduated", "strand")
+
+def _b64encode(data):
+    """URL-safe base64 without padding"""
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+def _b64decode(text):
+    """Inverse of _b64encode"""
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+def _write_private(path, data):
+    """Write a file readable only by this user, replacing it atomically"""
+    path.parent.mkdir(exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(str(tmp_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+class SessionTokens:
+    """Signed, expiring login tokens stored on this device
+
+    A token is a compact JSON payload (user id, token id, expiry and a
+    profile snapshot) followed by its HMAC-SHA256 under a random secret
+    kept in the data folder. Validation is an HMAC compare, an expiry
+    check and a lookup in the revocation list, which is read from disk
+    once and then kept in memory; no database query or password hash is
+    involved. The secret never leaves the device, so only tokens issued
+    here validate here, and signing out revokes the token locally.
+    """
+    def __init__(self, secret_path=SECRET_PATH, token_path=TOKEN_PATH,
+                 revoked_path=REVOKED_PATH, lifetime=TOKEN_LIFETIME):
+        self.secret_path = Path(secret_path)
+        self.token_path = Path(token_path)
+        self.revoked_path = Path(revoked_path)
+        self.lifetime = lifetime
+        self._secret = None
+        self._revoked = None  # token id -> expiry, loaded on first use
+        self._lock = threading.Lock()
+
+    def issue(self, user):
+        """Create a token for an authenticated user dict"""
+        now = int(time.time())
+        payload = {
+            "jti": secrets.token_hex(8),
+            "iat": now,
+            "exp": now + self.lifetime,
+            "user": {field: user.get(field) for field in TOKEN_USER_FIELDS},
+        }
+        body = _b64encode(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+        return f"{body}.{self._sign(body)}"
+
+    def validate(self, token):
+        """Return the token's payload, or None if forged, expired or revoked"""
+        try:
+            body, signature = token.split(".")
+        except (AttributeError, ValueError):
+            return None
+        if not (_TOKEN_PART.fullmatch(body) and _TOKEN_PART.fullmatch(signature)):
+            return None
+
+        # Constant-time signature check before the payload is even parsed
+        if not hmac.compare_digest(signature, self._sign(body)):
+            return None
+        try:
+            payload = json.loads(_b64decode(body))
+        except ValueError:
+            return None
+
+        if payload.get("exp", 0) <= time.time():
+            return None
+        if payload.get("jti") in self._revoked_tokens():
+            return None
+        return payload
+
+    def revoke(self, token):
+        """Add a token to the revocation list so it never validates again"""
+        payload = self.validate(token)
+        if payload is None:
+            return
+        with self._lock:
+            revoked = self._revoked_tokens()
+            revoked[payload["jti"]] = payload["exp"]
+
+            # Expired entries reject themselves, so they need not be kept
+            now = time.time()
+            for jti in [jti for jti, exp in revoked.items() if exp <= now]:
+                del revoked[jti]
+            try:
+                _write_private(self.revoked_path, json.dumps(revoked).encode("utf-8"))
+            except OSError as e:
+                print(f"Error saving revoked tokens: {e}")
+
+    def save(self, token):
+        """Remember a token for the next launch"""
+        try:
+            _write_private(self.token_path, token.encode("ascii"))
+        except OSError as e:
+            print(f"Error saving session token: {e}")
+
+    def load(self):
+        """Return the saved token, or None"""
+        try:
+            return self.token_path.read_text(encoding="ascii").strip() or None
+        except (OSError, ValueError):
+            return None
+
+    def clear(self):
+        """Forget the saved token"""
+        try:
+            self.token_path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error removing session token: {e}")
+
+    def restore(self):
+        """Return the user of the saved token if it is still valid
+
+        An invalid token is deleted so later launches skip it.
+        """
+        token = self.load()
+        if token is None:
+            return None
+        payload = self.validate(token)
+        if payload is None:
+            self.clear()
+            return None
+        return payload["user"]
+
+    def _sign(self, body):
+        """HMAC-SHA256 of a token body under the device secret"""
+        digest = hmac.new(self._get_secret(), body.encode("ascii"), hashlib.sha256).digest()
+        return _b64encode(digest)
+
+    def _get_secret(self):
+        """Read the signing secret, creating it on first use"""
+        if self._secret is None:
+            with self._lock:
+                if self._secret is None:
+                    self._secret = self._read_or_create_secret()
+        return self._secret
+
+    def _read_or_create_secret(self):
+        """Load the secret file, or write a new random one"""
+        try:
+            secret = self.secret_path.read_bytes()
+            if len(secret) >= SECRET_SIZE:
+                return secret
+        except FileNotFoundError:
+            pass
+
+        # A new secret also invalidates every token issued before it
+        secret = secrets.token_bytes(SECRET_SIZE)
+        try:
+            _write_private(self.secret_path, secret)
+        except OSError as e:
+            print(f"Error saving session secret: {e}")
+        return secret
+
+    def _revoked_tokens(self):
+        """Revocation list as {token id: expiry}, read from disk once"""
+        if self._revoked is None:
+            try:
+                self._revoked = json.loads(self.revoked_path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                self._revoked = {}
+            except (OSError, ValueError) as e:
+                print(f"Error reading revoked tokens: {e}")
+                self._revoked = {}
+        return self._revoked
+
+# Shared token store
+_session_tokens = None
+
+def get_session_tokens():
+    """Return the shared token store, creating it on first use"""
+    global _session_tokens
+    if _session_tokens is None:
+        _session_tokens = SessionTokens()
+    return _session_tokens
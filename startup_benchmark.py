@@ -0,0 +1,232 @@
+"""Startup benchmark for the app entry points
+
+Boots every module's App in its own Python process with a hidden
+window and records:
+
+    import_s       running the module up to App.run() (imports, module body)
+    build_s        time spent in App.build()
+    first_frame_s  process start of the benchmark to the first frame drawn
+    widget_count   widgets in the live tree on the first frame
+
+Each entry point is run --repeat times and the median is reported.
+Results are written as JSON so they can be committed as a baseline and
+compared on later runs. On a machine without a display run it under a
+virtual one, e.g. xvfb-run.
+
+Usage:
+    python startup_benchmark.py --output benchmarks/startup.json
+    python startup_benchmark.py --repeat 5 --compare benchmarks/startup.json
+    python startup_benchmark.py donate_page event_details_page
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Modules that start an App when run directly
+ENTRY_POINTS = (
+    "alumni_directory",
+    "donate_page",
+    "donation_details_page",
+    "donation_amount_page",
+    "donation_widget",
+    "event_calendar_page",
+    "event_calendar_widget",
+    "event_details_page",
+)
+
+METRICS = ("import_s", "build_s", "first_frame_s", "widget_count")
+
+# Frames to let pass after the first one before closing the app
+SETTLE_FRAMES = 2
+
+DEFAULT_REPEAT = 3
+DEFAULT_TIMEOUT = 60  # Seconds allowed per run
+DEFAULT_THRESHOLD = 0.20  # Allowed slowdown against a baseline
+
+RESULT_MARKER = "STARTUP_BENCHMARK_RESULT "
+
+def run_child(module_name):
+    """Boot one entry point in this process and print its measurements"""
+    started = time.perf_counter()
+    result = {}
+
+    # The window must be configured before kivy.core.window is imported
+    from kivy.config import Config
+    Config.set('graphics', 'window_state', 'hidden')
+    Config.set('kivy', 'log_level', 'warning')
+    from kivy.app import App
+    from kivy.clock import Clock
+    result['kivy_import_s'] = time.perf_counter() - started
+
+    original_run = App.run
+    module_started = time.perf_counter()
+
+    def instrumented_run(app):
+        result['import_s'] = time.perf_counter() - module_started
+        original_build = app.build
+
+        def timed_build():
+            build_started = time.perf_counter()
+            root = original_build()
+            result['build_s'] = time.perf_counter() - build_started
+            return root
+
+        def on_first_frame(*args):
+            from kivy.core.window import Window
+            Window.unbind(on_flip=on_first_frame)
+            result['first_frame_s'] = time.perf_counter() - started
+            root = app.root or Window
+            result['widget_count'] = sum(1 for _ in root.walk(restrict=True))
+            settle(SETTLE_FRAMES)
+
+        def settle(frames_left):
+            # Let work scheduled for the frames after the first run before closing
+            if frames_left <= 0:
+                app.stop()
+            else:
+                Clock.schedule_once(lambda dt: settle(frames_left - 1), 0)
+
+        def watch_first_frame(*args):
+            from kivy.core.window import Window
+            Window.bind(on_flip=on_first_frame)
+
+        app.build = timed_build
+        app.bind(on_start=watch_first_frame)
+        original_run(app)
+
+    App.run = instrumented_run
+
+    # Run the module exactly as `python <module>.py` would
+    import runpy
+    sys.argv = [module_name]
+    runpy.run_module(module_name, run_name="__main__")
+
+    print(RESULT_MARKER + json.dumps(result))
+
+def run_entry_point(module_name, timeout=DEFAULT_TIMEOUT):
+    """Benchmark one entry point in a fresh interpreter"""
+    env = dict(os.environ, KIVY_NO_ARGS="1", KIVY_NO_CONSOLELOG="1")
+    command = [sys.executable, str(Path(__file__).resolve()), "--child", module_name]
+    started = time.perf_counter()
+    try:
+        completed = subprocess.run(
+            command,
+            cwd=str(Path(__file__).parent),
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        return {"error": f"timed out after {timeout}s"}
+
+    for line in completed.stdout.splitlines():
+        if line.startswith(RESULT_MARKER):
+            result = json.loads(line[len(RESULT_MARKER):])
+            result['process_s'] = time.perf_counter() - started
+            return result
+
+    output = (completed.stderr or completed.stdout).strip().splitlines()
+    return {"error": output[-1] if output else f"exited with code {completed.returncode}"}
+
+def summarize(runs):
+    """Median of every metric over the successful runs"""
+    successful = [run for run in runs if "error" not in run]
+    if not successful:
+        return None
+    keys = sorted({key for run in successful for key in run})
+    return {
+        key: statistics.median(run[key] for run in successful if key in run)
+        for key in keys
+    }
+
+def run_benchmarks(module_names, repeat=DEFAULT_REPEAT, timeout=DEFAULT_TIMEOUT):
+    """Benchmark every entry point and return the JSON report"""
+    entries = {}
+    for module_name in module_names:
+        runs = []
+        for i in range(repeat):
+            run = run_entry_point(module_name, timeout)
+            runs.append(run)
+            if "error" in run:
+                print(f"{module_name}: run {i + 1} failed: {run['error']}")
+                break
+        entries[module_name] = {"median": summarize(runs), "runs": runs}
+
+        median = entries[module_name]["median"]
+        if median:
+            print(
+                f"{module_name:24} import {median.get('import_s', 0):.3f}s  "
+                f"build {median.get('build_s', 0):.3f}s  "
+                f"first frame {median.get('first_frame_s', 0):.3f}s  "
+                f"widgets {median.get('widget_count', 0):.0f}"
+            )
+
+    return {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "entry_points": entries,
+    }
+
+def compare_reports(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """Return a list of metrics that regressed against the baseline"""
+    regressions = []
+    for module_name, entry in report["entry_points"].items():
+        current = entry["median"]
+        previous = (baseline.get("entry_points", {}).get(module_name) or {}).get("median")
+        if not current or not previous:
+            continue
+        for metric in METRICS:
+            if metric not in current or not previous.get(metric):
+                continue
+            change = (current[metric] - previous[metric]) / previous[metric]
+            if change > threshold:
+                regressions.append(
+                    f"{module_name}.{metric}: {previous[metric]:.3f} -> {current[metric]:.3f} (+{change:.0%})"
+                )
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure startup time of every app entry point")
+    parser.add_argument("modules", nargs="*", help="Entry point modules to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Runs per entry point")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Seconds allowed per run")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--compare", help="Baseline JSON report to check for regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed relative slowdown against the baseline (default: 0.20)")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child)
+        return
+
+    report = run_benchmarks(args.modules or ENTRY_POINTS, args.repeat, args.timeout)
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Wrote {output}")
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressions = compare_reports(report, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import math
+import random
+
+import pytest
+
+from geo_index import (
+    GEO_CELL_DEGREES, MAX_NEARBY_RADIUS_KM, Gazetteer, distance_km, grid_cell, neighborhood_cells,
+)
+
+@pytest.fixture(scope="module")
+def gazetteer():
+    return Gazetteer()
+
+def test_grid_cell_floors_negative_coordinates():
+    assert grid_cell(14.5995, 120.9842) == "145:1209"
+    assert grid_cell(-0.05, -0.05) == "-1:-1"
+    assert grid_cell(0.0, 0.0) == "0:0"
+
+def test_distance_km():
+    assert distance_km(14.5995, 120.9842, 14.5995, 120.9842) == 0
+    # One degree of latitude
+    assert distance_km(0, 0, 1, 0) == pytest.approx(111.19, abs=0.1)
+    # Manila to Cebu City
+    assert distance_km(14.5995, 120.9842, 10.3157, 123.8854) == pytest.approx(570, abs=10)
+
+def _offset(latitude, longitude, distance, bearing):
+    """Point distance km from a start point along a bearing (degrees)"""
+    lat1, lon1, theta = map(math.radians, (latitude, longitude, bearing))
+    delta = distance / 6371.0
+    lat2 = math.asin(math.sin(lat1) * math.cos(delta) + math.cos(lat1) * math.sin(delta) * math.cos(theta))
+    lon2 = lon1 + math.atan2(math.sin(theta) * math.sin(delta) * math.cos(lat1),
+                             math.cos(delta) - math.sin(lat1) * math.sin(lat2))
+    return math.degrees(lat2), math.degrees(lon2)
+
+@pytest.mark.parametrize("latitude, longitude", [
+    (14.5995, 120.9842),  # Manila
+    (10.3157, 123.8854),  # Cebu City
+    (0.01, -0.01),        # Around both zero lines
+    (-33.87, 151.21),     # Southern hemisphere
+    (60.0, 24.9),         # High latitude, wide cells in km
+])
+@pytest.mark.parametrize("radius_km", [1, 25, MAX_NEARBY_RADIUS_KM])
+def test_neighborhood_covers_every_point_in_radius(latitude, longitude, radius_km):
+    cells = set(neighborhood_cells(latitude, longitude, radius_km))
+    assert grid_cell(latitude, longitude) in cells
+
+    rng = random.Random(f"{latitude}:{longitude}:{radius_km}")
+    for bearing in range(0, 360, 5):
+        for fraction in (0.5, 0.99, rng.random()):
+            point = _offset(latitude, longitude, radius_km * fraction, bearing)
+            assert grid_cell(*point) in cells, (point, bearing, fraction)
+
+def test_neighborhood_radius_is_capped():
+    capped = neighborhood_cells(14.6, 121.0, MAX_NEARBY_RADIUS_KM * 10)
+    assert capped == neighborhood_cells(14.6, 121.0, MAX_NEARBY_RADIUS_KM)
+
+def test_neighborhood_stays_small():
+    cells = neighborhood_cells(14.6, 121.0, 25)
+    side = 2 * 25 / 111.32 / GEO_CELL_DEGREES + 2
+    assert len(cells) <= side * side * 1.2
+
+@pytest.mark.parametrize("address, place", [
+    ("Manila", "Manila"),
+    ("123 Rizal St, Las Piñas, Metro Manila", "Las Pinas"),
+    ("Brgy. Lahug, Cebu City", "Cebu City"),
+    ("cebu", "Cebu City"),
+    ("Unit 5 Tower 2 Quezon City Metro Manila", "Quezon City"),
+    ("San Jose del Monte, Bulacan", "San Jose del Monte"),
+])
+def test_geocode(gazetteer, address, place):
+    assert gazetteer.geocode(address)["place"] == place
+
+@pytest.mark.parametrize("address", [None, "", "Atlantis", ",,,", "12345"])
+def test_geocode_unknown(gazetteer, address):
+    assert gazetteer.geocode(address) is None
+
+def test_geocode_picks_province(tmp_path):
+    path = tmp_path / "gazetteer.csv"
+    path.write_text(
+        "name,province,latitude,longitude\n"
+        "San Jose,Batangas,13.87,121.10\n"
+        "San Jose,Nueva Ecija,15.79,120.99\n",
+        encoding="utf-8"
+    )
+    gazetteer = Gazetteer(path)
+    assert gazetteer.geocode("San Jose, Nueva Ecija")["province"] == "Nueva Ecija"
+    assert gazetteer.geocode("San Jose, Batangas")["province"] == "Batangas"
+
+def test_missing_gazetteer_geocodes_nothing(tmp_path):
+    assert Gazetteer(tmp_path / "missing.csv").geocode("Manila") is None
@@ -0,0 +1,74 @@
+import pytest
+
+from qr_payload import PAYLOAD_PREFIX, QRPayloads, to_base36
+
+SECRET = b"test-qr-signing-key"
+
+@pytest.fixture
+def payloads(tmp_path):
+    return QRPayloads(secret=SECRET, qr_codes_path=tmp_path)
+
+def test_to_base36():
+    assert to_base36(0) == "0"
+    assert to_base36(35) == "Z"
+    assert to_base36(36) == "10"
+    assert int(to_base36(123456789), 36) == 123456789
+
+def test_payload_round_trip(payloads):
+    for user_id in (1, 42, 99999):
+        payload = payloads.payload(user_id)
+        assert payload.startswith(PAYLOAD_PREFIX + ":")
+        assert payloads.verify(payload) == user_id
+
+def test_verify_accepts_case_and_whitespace(payloads):
+    payload = payloads.payload(7)
+    assert payloads.verify(f"  {payload.lower()}\n") == 7
+
+def test_verify_rejects_forgeries(payloads):
+    payload = payloads.payload(7)
+    prefix, user_part, signature = payload.split(":")
+
+    # Another user's id under this signature
+    assert payloads.verify(f"{prefix}:{to_base36(8)}:{signature}") is None
+
+    # A changed signature character
+    flipped = ("A" if signature[0] != "A" else "B") + signature[1:]
+    assert payloads.verify(f"{prefix}:{user_part}:{flipped}") is None
+
+    # A truncated signature
+    assert payloads.verify(f"{prefix}:{user_part}:{signature[:-1]}") is None
+
+    # Signed with another key
+    other = QRPayloads(secret=b"another-key").payload(7)
+    assert payloads.verify(other) is None
+
+@pytest.mark.parametrize("garbage", [
+    None,
+    "",
+    "hello",
+    "SR1",
+    "SR1:1",
+    "SR1:1:AAAA:extra",
+    "SR2:1:AAAA",
+    "SR1::AAAA",
+    "SR1:1:",
+    "SR1:-1:AAAA",
+    "SR1:1 2:AAAA",
+    "SR1:É:AAAA",
+    "SR1:1:ÄÄ",
+    "SR1:１:AAAA",
+    "SR1:1:AAAA\x00",
+    "﻿SR1:1:AAAA",
+])
+def test_verify_rejects_garbage(payloads, garbage):
+    assert payloads.verify(garbage) is None
+
+def test_verify_rejects_non_ascii_variant_of_valid_payload(payloads):
+    payload = payloads.payload(7)
+    assert payloads.verify(payload[:-1] + "É") is None
+
+def test_no_key_signs_nothing(tmp_path, monkeypatch):
+    payloads = QRPayloads(qr_codes_path=tmp_path)
+    monkeypatch.setattr(payloads, "_get_secret", lambda: None)
+    assert payloads.payload(1) is None
+    assert payloads.verify("SR1:1:AAAA") is None
@@ -0,0 +1,114 @@
+import pytest
+
+import rate_limiter
+from rate_limiter import LoginRateLimiter, TokenBucketLimiter, normalize_email
+
+def test_bucket_allows_burst_then_refuses():
+    limiter = TokenBucketLimiter(burst=3, refill_seconds=10)
+    for _ in range(3):
+        assert limiter.retry_after("k", 100.0) == 0
+        limiter.consume("k", 100.0)
+    assert limiter.retry_after("k", 100.0) == 10
+
+def test_bucket_refills_one_token_per_interval():
+    limiter = TokenBucketLimiter(burst=2, refill_seconds=10)
+    limiter.consume("k", 0.0)
+    limiter.consume("k", 0.0)
+    assert limiter.retry_after("k", 4.0) == 6
+    assert limiter.retry_after("k", 10.0) == 0
+    limiter.consume("k", 10.0)
+    assert limiter.retry_after("k", 10.0) == 10
+
+def test_bucket_never_refills_past_burst():
+    limiter = TokenBucketLimiter(burst=2, refill_seconds=1)
+    limiter.consume("k", 0.0)
+    assert limiter._tokens("k", 1000.0) == 2
+
+def test_bucket_ignores_clock_going_backwards():
+    limiter = TokenBucketLimiter(burst=1, refill_seconds=10)
+    limiter.consume("k", 100.0)
+    assert limiter.retry_after("k", 50.0) == 10
+
+def test_bucket_evicts_least_recently_used():
+    limiter = TokenBucketLimiter(burst=1, refill_seconds=60, max_keys=2)
+    limiter.consume("a", 0.0)
+    limiter.consume("b", 0.0)
+    limiter.consume("a", 0.0)
+    limiter.consume("c", 0.0)
+    assert list(limiter.buckets) == ["a", "c"]
+
+def test_bucket_round_trips_only_unfilled_buckets():
+    limiter = TokenBucketLimiter(burst=2, refill_seconds=10)
+    limiter.consume("busy", 0.0)
+    limiter.consume("idle", 0.0)
+    saved = limiter.to_dict(5.0)
+    assert set(saved) == {"busy", "idle"}
+    assert limiter.to_dict(100.0) == {}
+
+    restored = TokenBucketLimiter(burst=2, refill_seconds=10)
+    restored.load_dict(saved)
+    assert restored.retry_after("busy", 5.0) == 0
+    assert restored._tokens("busy", 5.0) == pytest.approx(1.5)
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limiter.time, "time", lambda: now[0])
+    return now
+
+def test_login_limiter_throttles_one_email(clock):
+    limiter = LoginRateLimiter(email_burst=3, email_refill=60, client_burst=100, client_refill=1)
+    for _ in range(3):
+        assert limiter.check("a@x.com") == (True, 0)
+    allowed, wait = limiter.check("A@X.com ")
+    assert not allowed and wait == 60
+
+    # Other accounts are unaffected
+    assert limiter.check("b@x.com") == (True, 0)
+
+    clock[0] += 60
+    assert limiter.check("a@x.com") == (True, 0)
+
+def test_login_limiter_throttles_one_client_across_emails(clock):
+    limiter = LoginRateLimiter(email_burst=100, email_refill=1, client_burst=2, client_refill=10)
+    assert limiter.check("a@x.com", client="dev1")[0]
+    assert limiter.check("b@x.com", client="dev1")[0]
+    assert limiter.check("c@x.com", client="dev1") == (False, 10)
+    assert limiter.check("c@x.com", client="dev2")[0]
+
+def test_refused_attempts_do_not_spend_tokens(clock):
+    limiter = LoginRateLimiter(email_burst=1, email_refill=60, client_burst=100, client_refill=1)
+    assert limiter.check("a@x.com")[0]
+    for _ in range(5):
+        assert not limiter.check("a@x.com")[0]
+    clock[0] += 60
+    assert limiter.check("a@x.com")[0]
+
+def test_success_refills_the_email(clock):
+    limiter = LoginRateLimiter(email_burst=2, email_refill=60, client_burst=100, client_refill=1)
+    limiter.check("a@x.com")
+    limiter.check("a@x.com")
+    assert not limiter.check("a@x.com")[0]
+    limiter.succeeded("A@x.com")
+    assert limiter.check("a@x.com")[0]
+
+def test_login_limiter_persists_buckets(tmp_path, clock, monkeypatch):
+    monkeypatch.setattr(rate_limiter.atexit, "register", lambda func: None)
+    path = tmp_path / "limits.json"
+    limiter = LoginRateLimiter(email_burst=1, email_refill=60, persist_path=path)
+    limiter.check("a@x.com")
+    limiter.save()
+
+    restarted = LoginRateLimiter(email_burst=1, email_refill=60, persist_path=path)
+    assert restarted.check("a@x.com") == (False, 60)
+
+def test_login_limiter_survives_corrupt_state(tmp_path, clock, monkeypatch):
+    monkeypatch.setattr(rate_limiter.atexit, "register", lambda func: None)
+    path = tmp_path / "limits.json"
+    path.write_text("{not json", encoding="utf-8")
+    limiter = LoginRateLimiter(persist_path=path)
+    assert limiter.check("a@x.com")[0]
+
+def test_normalize_email():
+    assert normalize_email("  Ivan@Example.COM ") == "ivan@example.com"
+    assert normalize_email(None) == ""
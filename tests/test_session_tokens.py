@@ -0,0 +1,74 @@
+import os
+import stat
+
+import pytest
+
+import session_tokens
+from session_tokens import SessionTokens
+
+USER = {"id": 7, "email": "a@x.com", "name": "Ivan", "year_graduated": "2016",
+        "strand": "STEM", "password": "never in a token"}
+
+@pytest.fixture
+def tokens(tmp_path):
+    return SessionTokens(
+        secret_path=tmp_path / "secret.key",
+        token_path=tmp_path / "token",
+        revoked_path=tmp_path / "revoked.json"
+    )
+
+def test_issue_and_validate(tokens):
+    payload = tokens.validate(tokens.issue(USER))
+    assert payload["user"]["id"] == 7
+    assert payload["user"]["name"] == "Ivan"
+    assert "password" not in payload["user"]
+
+def test_secret_is_private(tokens):
+    tokens.issue(USER)
+    if os.name == "posix":
+        assert stat.S_IMODE(tokens.secret_path.stat().st_mode) == 0o600
+
+def test_tampered_tokens_are_rejected(tokens):
+    token = tokens.issue(USER)
+    body, signature = token.split(".")
+    flipped = ("A" if body[5] != "A" else "B")
+    assert tokens.validate(body[:5] + flipped + body[6:] + "." + signature) is None
+    assert tokens.validate(body + "." + signature[:-1]) is None
+    assert tokens.validate(body + ".") is None
+
+def test_tokens_from_another_secret_are_rejected(tokens, tmp_path):
+    other = SessionTokens(secret_path=tmp_path / "other.key", token_path=tmp_path / "t2",
+                          revoked_path=tmp_path / "r2.json")
+    assert tokens.validate(other.issue(USER)) is None
+
+@pytest.mark.parametrize("garbage", [None, "", "abc", "a.b.c", ".", "é.é", "abc.ÄÄ", "ÄÄ.abc"])
+def test_garbage_is_rejected(tokens, garbage):
+    assert tokens.validate(garbage) is None
+
+def test_expired_tokens_are_rejected(tokens, monkeypatch):
+    token = tokens.issue(USER)
+    now = session_tokens.time.time()
+    monkeypatch.setattr(session_tokens.time, "time", lambda: now + tokens.lifetime + 1)
+    assert tokens.validate(token) is None
+
+def test_revoked_tokens_stay_revoked(tokens, tmp_path):
+    token = tokens.issue(USER)
+    other = tokens.issue(USER)
+    tokens.revoke(token)
+    assert tokens.validate(token) is None
+    assert tokens.validate(other) is not None
+
+    # The revocation list is read back by the next launch
+    relaunched = SessionTokens(secret_path=tokens.secret_path, token_path=tokens.token_path,
+                               revoked_path=tokens.revoked_path)
+    assert relaunched.validate(token) is None
+    assert relaunched.validate(other) is not None
+
+def test_restore_returns_user_and_clears_bad_tokens(tokens):
+    assert tokens.restore() is None
+    tokens.save(tokens.issue(USER))
+    assert tokens.restore()["id"] == 7
+
+    tokens.save("not.a-token")
+    assert tokens.restore() is None
+    assert not tokens.token_path.exists()
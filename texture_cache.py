@@ -0,0 +1,126 @@
+"""Shared textures for navigation icons and campaign images
+
+Navigation icons are packed into a single Kivy atlas at build time:
+
+    python texture_cache.py
+
+Pages ask navigation_icon_source() for an icon; when the atlas exists
+they get an atlas:// URL, so all icons share one texture that is
+decoded and uploaded once. Without an atlas the plain file path is returned.
+
+Campaign images share a process-wide cache keyed by (path, target
+size). image_loader decodes each file in the background and hands the
+texture to store_texture(), which scales it down once on the GPU;
+every later widget showing the same image at the same size gets that
+texture from peek_texture().
+"""
+import json
+import os
+from pathlib import Path
+
+NAVIGATION_ICONS_PATH = Path(__file__).parent / Path(r"navigation_icons")
+ATLAS_PATH = Path(__file__).parent / "data" / "atlas"
+ICON_ATLAS_NAME = "navigation_icons"
+ICON_ATLAS_SIZE = 256  # Pixels per atlas page
+
+# Textures kept in the Kivy cache
+TEXTURE_CACHE_CATEGORY = 'texture_cache.textures'
+TEXTURE_CACHE_LIMIT = 64
+
+_atlas_icons = None
+_cache_registered = False
+
+def build_icon_atlas(icons_path=NAVIGATION_ICONS_PATH, atlas_path=ATLAS_PATH, size=ICON_ATLAS_SIZE):
+    """Pack every navigation icon into one atlas and return its .atlas file"""
+    from kivy.atlas import Atlas
+
+    global _atlas_icons
+    filenames = sorted(str(path) for path in Path(icons_path).glob("*.png"))
+    if not filenames:
+        print(f"No icons found in {icons_path}")
+        return None
+
+    Path(atlas_path).mkdir(parents=True, exist_ok=True)
+    result = Atlas.create(str(Path(atlas_path) / ICON_ATLAS_NAME), filenames, size)
+    _atlas_icons = None  # Re-read the index on next lookup
+    if not result:
+        print("Could not create the navigation icon atlas")
+        return None
+    atlas_file, _ = result
+    return atlas_file
+
+def _load_atlas_icons():
+    """Return the icon names packed in the atlas (empty if it isn't built)"""
+    global _atlas_icons
+    if _atlas_icons is None:
+        _atlas_icons = set()
+        atlas_file = ATLAS_PATH / f"{ICON_ATLAS_NAME}.atlas"
+        if os.path.exists(atlas_file):
+            try:
+                with open(atlas_file, encoding="utf-8") as f:
+                    for icons in json.load(f).values():
+                        _atlas_icons.update(icons)
+            except (OSError, ValueError) as e:
+                print(f"Error reading icon atlas: {e}")
+    return _atlas_icons
+
+def navigation_icon_source(icon_path):
+    """Return the atlas URL for a navigation icon, or its file path"""
+    name = Path(icon_path).stem
+    if name in _load_atlas_icons():
+        return f"atlas://{(ATLAS_PATH / ICON_ATLAS_NAME).as_posix()}/{name}"
+    return str(icon_path)
+
+def _fit_size(texture_size, target_size):
+    """Largest size inside target_size that keeps the aspect ratio, never enlarging"""
+    width, height = texture_size
+    scale = min(target_size[0] / width, target_size[1] / height, 1.0)
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+def _scaled_texture(texture, size):
+    """Draw a texture into an offscreen buffer of the given size"""
+    from kivy.graphics import ClearBuffers, ClearColor, Fbo, Rectangle
+
+    fbo = Fbo(size=size)
+    with fbo:
+        ClearColor(0, 0, 0, 0)
+        ClearBuffers()
+        Rectangle(texture=texture, pos=(0, 0), size=size)
+    fbo.draw()
+    return fbo.texture
+
+def _texture_cache():
+    """Return the Kivy Cache, registering the texture category on first use"""
+    from kivy.cache import Cache
+
+    global _cache_registered
+    if not _cache_registered:
+        Cache.register(TEXTURE_CACHE_CATEGORY, limit=TEXTURE_CACHE_LIMIT)
+        _cache_registered = True
+    return Cache
+
+def display_size(height_dp):
+    """Pixel box an image drawn height_dp tall is scaled to fit"""
+    from kivy.metrics import dp
+
+    # Widest aspect ratio kept when scaling on the GPU
+    height = int(dp(height_dp))
+    return height * 4, height
+
+def peek_texture(path, size=None):
+    """Return the cached texture for (path, size) without loading anything"""
+    return _texture_cache().get(TEXTURE_CACHE_CATEGORY, (str(path), tuple(size) if size else None))
+
+def store_texture(path, size, texture):
+    """Scale a freshly loaded texture down to fit size and cache it"""
+    if size:
+        fitted = _fit_size(texture.size, size)
+        if fitted != tuple(texture.size):
+            texture = _scaled_texture(texture, fitted)
+    _texture_cache().append(TEXTURE_CACHE_CATEGORY, (str(path), tuple(size) if size else None), texture)
+    return texture
+
+if __name__ == "__main__":
+    atlas_file = build_icon_atlas()
+    if atlas_file:
+        print(f"Packed {len(_load_atlas_icons())} navigation icons into {atlas_file}")
@@ -0,0 +1,180 @@
+"""Pre-scaled campaign image variants
+
+thumbnail(path, height_dp) returns a copy of the image scaled to the
+height a widget actually draws it at, for the screen density bucket
+of the device. Variants live in data/thumbnails and are named after a
+hash of the source file's location and one of its contents, so
+same-named images in different folders keep apart, and editing an
+image produces new variants and the old ones are pruned. Variants are made on demand, or
+ahead of time for every campaign image:
+
+    python thumbnails.py
+    python thumbnails.py --densities 1 2 3 --heights 150 190 200
+
+Scaling needs Pillow. Without it the original file is returned.
+"""
+import argparse
+import hashlib
+import math
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+BASE_PATH = Path(__file__).parent
+THUMBNAILS_PATH = BASE_PATH / "data" / "thumbnails"
+
+# Folders holding campaign images
+CAMPAIGN_IMAGE_DIRS = (
+    BASE_PATH / Path(r"build\assets\frame7"),
+    BASE_PATH / Path(r"build\assets\frame9"),
+    BASE_PATH / "assets",
+)
+IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg")
+
+# Display heights (dp) of campaign images: search results, cards, detail pages
+DEFAULT_HEIGHTS = (150, 190, 200)
+
+# Android-style density buckets (mdpi, hdpi, xhdpi, xxhdpi, xxxhdpi)
+DENSITY_BUCKETS = (1.0, 1.5, 2.0, 3.0, 4.0)
+
+_hash_lock = threading.Lock()
+_content_hashes = {}
+
+def density_bucket(density=None):
+    """Smallest density bucket that is at least the screen density"""
+    if density is None:
+        from kivy.metrics import Metrics
+        density = Metrics.density
+    for bucket in DENSITY_BUCKETS:
+        if bucket >= density:
+            return bucket
+    return DENSITY_BUCKETS[-1]
+
+def content_hash(path):
+    """Short hash of a file's contents, recomputed only when the file changes"""
+    stat = os.stat(path)
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    with _hash_lock:
+        cached = _content_hashes.get(str(path))
+        if cached and cached[0] == key:
+            return cached[1]
+
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(65536), b""):
+            digest.update(block)
+    value = digest.hexdigest()[:12]
+
+    with _hash_lock:
+        _content_hashes[str(path)] = (key, value)
+    return value
+
+def _variant_key(path):
+    """Name prefix shared by every variant of one source file"""
+    path = Path(path)
+    location = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()[:8]
+    return f"{path.stem}-{location}"
+
+def thumbnail_path(path, height_px, thumbnails_path=THUMBNAILS_PATH):
+    """Where the variant of an image at a pixel height is stored"""
+    path = Path(path)
+    return Path(thumbnails_path) / f"{_variant_key(path)}-{content_hash(path)}-{height_px}px{path.suffix.lower()}"
+
+def _prune_stale_variants(path, current_hash, thumbnails_path):
+    """Delete variants made from an older version of the image"""
+    for variant in Path(thumbnails_path).glob(f"{_variant_key(path)}-*px*"):
+        if f"-{current_hash}-" not in variant.name:
+            try:
+                variant.unlink()
+            except OSError:
+                pass
+
+def generate_thumbnail(path, height_px, thumbnails_path=THUMBNAILS_PATH):
+    """Write the scaled variant of an image and return its path
+
+    Returns the source path if Pillow is missing, the file can't be
+    read, or the image is already no taller than height_px.
+    """
+    try:
+        from PIL import Image as PILImage
+    except ImportError:
+        return Path(path)
+
+    target = thumbnail_path(path, height_px, thumbnails_path)
+    if target.exists():
+        return target
+
+    try:
+        with PILImage.open(path) as image:
+            if image.height <= height_px:
+                return Path(path)
+            width_px = max(1, round(image.width * height_px / image.height))
+            scaled = image.resize((width_px, height_px), PILImage.LANCZOS)
+            if target.suffix in (".jpg", ".jpeg") and scaled.mode not in ("RGB", "L"):
+                scaled = scaled.convert("RGB")
+
+            Path(thumbnails_path).mkdir(parents=True, exist_ok=True)
+            _prune_stale_variants(path, content_hash(path), thumbnails_path)
+
+            # Write to a temp file of our own and swap it in, so neither readers
+            # nor a concurrent request for the same variant see half a file
+            with tempfile.NamedTemporaryFile(dir=thumbnails_path, prefix=target.name + ".",
+                                             suffix=".tmp", delete=False) as temp:
+                try:
+                    scaled.save(temp, format=image.format or "PNG")
+                except BaseException:
+                    temp.close()
+                    os.unlink(temp.name)
+                    raise
+            os.replace(temp.name, target)
+    except OSError as e:
+        print(f"Error creating thumbnail for {path}: {e}")
+        return Path(path)
+
+    return target
+
+def thumbnail(path, height_dp, density=None):
+    """Return the image to load for a widget drawing path at height_dp"""
+    if not path or not os.path.exists(path):
+        return path
+    height_px = math.ceil(height_dp * density_bucket(density))
+    variant = thumbnail_path(path, height_px)
+    if variant.exists():
+        return str(variant)
+    return str(generate_thumbnail(path, height_px))
+
+def campaign_images(dirs=CAMPAIGN_IMAGE_DIRS):
+    """Every campaign image file in the image folders"""
+    for folder in dirs:
+        if os.path.isdir(folder):
+            for path in sorted(Path(folder).iterdir()):
+                if path.suffix.lower() in IMAGE_SUFFIXES:
+                    yield path
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-generate campaign image thumbnails")
+    parser.add_argument("images", nargs="*", help="Images to scale (default: all campaign images)")
+    parser.add_argument("--heights", type=float, nargs="+", default=DEFAULT_HEIGHTS,
+                        help="Display heights in dp")
+    parser.add_argument("--densities", type=float, nargs="+", default=DENSITY_BUCKETS,
+                        help="Screen density buckets to generate")
+    args = parser.parse_args()
+
+    try:
+        import PIL
+    except ImportError:
+        parser.error("Pillow is required to generate thumbnails (pip install pillow)")
+
+    images = [Path(image) for image in args.images] or list(campaign_images())
+    created = 0
+    for image in images:
+        for density in args.densities:
+            for height in args.heights:
+                variant = generate_thumbnail(image, math.ceil(height * density))
+                if variant != image:
+                    created += 1
+    print(f"{created} thumbnails ready in {THUMBNAILS_PATH}")
+
+if __name__ == "__main__":
+    main()